@@ -157,6 +157,7 @@ def async_register_callback(
     callback: BluetoothCallback,
     match_dict: BluetoothCallbackMatcher | None,
     mode: BluetoothScanningMode,
+    cooldown: float | None = None,
 ) -> Callable[[], None]:
     """Register to receive a callback on bluetooth change.
 
@@ -165,9 +166,12 @@ def async_register_callback(
     is required to be present to avoid a future breaking change
     when we support passive scanning.
 
+    If cooldown is passed, the callback is called at most once every
+    cooldown seconds for each address with the latest advertisement.
+
     Returns a callback that can be used to cancel the registration.
     """
-    return _get_manager(hass).async_register_callback(callback, match_dict)
+    return _get_manager(hass).async_register_callback(callback, match_dict, cooldown)
 
 
 async def async_process_advertisements(
@@ -96,6 +96,81 @@ def _dispatch_bleak_callback(
         _LOGGER.exception("Error in callback: %s", callback)
 
 
+class _CooldownCallback:
+    """Call a bluetooth callback at most once per cooldown for each address.
+
+    Advertisements received during the cooldown are not dropped, the latest one
+    is passed to the callback when the cooldown ends. Addresses whose cooldown
+    has ended are pruned once per cooldown so devices that stop advertising,
+    or rotate their address, are not tracked forever.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, callback: BluetoothCallback, cooldown: float
+    ) -> None:
+        """Init the cooldown callback."""
+        self._hass = hass
+        self._callback = callback
+        self._cooldown = cooldown
+        self._last_calls: dict[str, float] = {}
+        self._last_prune = hass.loop.time()
+        self._pending: dict[str, tuple[BluetoothServiceInfoBleak, BluetoothChange]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+
+    @hass_callback
+    def __call__(
+        self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Call the callback now or when the cooldown for the address ends."""
+        address = service_info.address
+        if address in self._timers:
+            self._pending[address] = (service_info, change)
+            return
+        now = self._hass.loop.time()
+        if now - self._last_prune >= self._cooldown:
+            self._async_prune(now)
+        if (last_call := self._last_calls.get(address)) is not None and (
+            now - last_call < self._cooldown
+        ):
+            self._pending[address] = (service_info, change)
+            self._timers[address] = self._hass.loop.call_at(
+                last_call + self._cooldown, self._async_call_pending, address
+            )
+            return
+        self._last_calls[address] = now
+        self._callback(service_info, change)
+
+    @hass_callback
+    def _async_prune(self, now: float) -> None:
+        """Forget the addresses whose cooldown has ended."""
+        self._last_prune = now
+        cooldown = self._cooldown
+        self._last_calls = {
+            address: last_call
+            for address, last_call in self._last_calls.items()
+            if now - last_call < cooldown
+        }
+
+    @hass_callback
+    def _async_call_pending(self, address: str) -> None:
+        """Call the callback with the latest advertisement from the cooldown."""
+        del self._timers[address]
+        service_info, change = self._pending.pop(address)
+        self._last_calls[address] = self._hass.loop.time()
+        try:
+            self._callback(service_info, change)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error in bluetooth callback")
+
+    @hass_callback
+    def async_cancel(self) -> None:
+        """Cancel the pending calls."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._pending.clear()
+
+
 class BluetoothManager:
     """Manage Bluetooth."""
 
@@ -496,8 +571,18 @@ class BluetoothManager:
         self,
         callback: BluetoothCallback,
         matcher: BluetoothCallbackMatcher | None,
+        cooldown: float | None = None,
     ) -> Callable[[], None]:
-        """Register a callback."""
+        """Register a callback.
+
+        If a cooldown is passed, the callback is called at most once per
+        cooldown seconds for each address.
+        """
+        cooldown_callback: _CooldownCallback | None = None
+        if cooldown:
+            callback = cooldown_callback = _CooldownCallback(
+                self.hass, callback, cooldown
+            )
         callback_matcher = BluetoothCallbackMatcherWithCallback(callback=callback)
         if not matcher:
             callback_matcher[CONNECTABLE] = True
@@ -513,6 +598,8 @@ class BluetoothManager:
         @hass_callback
         def _async_remove_callback() -> None:
             self._callback_index.remove_callback_matcher(callback_matcher)
+            if cooldown_callback:
+                cooldown_callback.async_cancel()
 
         # If we have history for the subscriber, we can trigger the callback
         # immediately with the last packet so the subscriber can see the
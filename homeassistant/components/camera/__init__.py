@@ -12,6 +12,7 @@ from functools import partial
 import logging
 import os
 from random import SystemRandom
+import time
 from typing import Any, Final, Optional, cast, final
 
 from aiohttp import hdrs, web
@@ -65,8 +66,10 @@ from .const import (  # noqa: F401
     DATA_CAMERA_PREFS,
     DATA_RTSP_TO_WEB_RTC,
     DOMAIN,
+    MAX_SNAPSHOT_TTL,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_TTL,
     SERVICE_RECORD,
     STREAM_TYPE_HLS,
     STREAM_TYPE_WEB_RTC,
@@ -166,27 +169,125 @@ async def _async_get_image(
     """
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            if image_bytes := await camera.async_camera_image(
-                width=width, height=height
+            if image := await camera.snapshot_cache.async_get_image(
+                camera, timeout, width, height
             ):
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_fetch_image(
+    camera: Camera,
+    fetch_timeout: async_timeout.Timeout,
+    width: int | None,
+    height: int | None,
+) -> Image | None:
+    """Fetch a snapshot image from a camera device and scale it if requested."""
+    async with fetch_timeout:
+        image_bytes = await camera.async_camera_image(width=width, height=height)
+    if not image_bytes:
+        return None
+
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(content_type, scale_jpeg_camera_image(image, width, height))
+
+    return image
+
+
+def _get_snapshot_ttl(camera: Camera) -> float:
+    """Return the snapshot TTL of a camera, the user's preference wins."""
+    prefs: CameraPreferences = camera.hass.data[DATA_CAMERA_PREFS]
+    if (snapshot_ttl := prefs.get(camera.entity_id).snapshot_ttl) is not None:
+        return snapshot_ttl
+    return camera.snapshot_ttl
+
+
+class SnapshotCache:
+    """Share snapshot images of a camera between requests.
+
+    Concurrent requests for the same size are served by a single fetch from the
+    device, which times out when the caller with the longest timeout would.
+    Fetched images, scaled to the requested size, are kept for the snapshot TTL
+    of the camera.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the snapshot cache."""
+        self.hits = 0
+        self.misses = 0
+        self._images: dict[tuple[int | None, int | None], tuple[float, Image]] = {}
+        self._requests: dict[
+            tuple[int | None, int | None],
+            tuple[asyncio.Task[Image | None], async_timeout.Timeout],
+        ] = {}
+
+    async def async_get_image(
+        self,
+        camera: Camera,
+        timeout: int,
+        width: int | None,
+        height: int | None,
+    ) -> Image | None:
+        """Return a snapshot image, fetching it from the camera if needed."""
+        key = (width, height)
+        if (cached := self._images.get(key)) is not None:
+            fetched, image = cached
+            if time.monotonic() - fetched < _get_snapshot_ttl(camera):
+                self.hits += 1
+                return image
+            del self._images[key]
+
+        if (pending := self._requests.get(key)) is not None:
+            self.hits += 1
+            request, fetch_timeout = pending
+            # Extend the shared fetch to the timeout of this caller if it is longer
+            deadline = camera.hass.loop.time() + timeout
+            if (
+                not request.done()
+                and not fetch_timeout.expired
+                and fetch_timeout.deadline is not None
+                and deadline > fetch_timeout.deadline
+            ):
+                fetch_timeout.update(deadline)
+        else:
+            self.misses += 1
+            fetch_timeout = async_timeout.timeout(timeout)
+            request = camera.hass.async_create_task(
+                _async_fetch_image(camera, fetch_timeout, width, height)
+            )
+            self._requests[key] = (request, fetch_timeout)
+            request.add_done_callback(partial(self._async_request_done, camera, key))
+
+        # Shield the shared request so one caller timing out doesn't cancel
+        # it for the other callers
+        return await asyncio.shield(request)
+
+    @callback
+    def _async_request_done(
+        self,
+        camera: Camera,
+        key: tuple[int | None, int | None],
+        request: asyncio.Task[Image | None],
+    ) -> None:
+        """Store the result of a finished request."""
+        del self._requests[key]
+        if request.cancelled() or request.exception() is not None:
+            return
+        if (image := request.result()) is not None and _get_snapshot_ttl(camera) > 0:
+            self._images[key] = (time.monotonic(), image)
+
+    def get_diagnostics(self) -> dict[str, int]:
+        """Return diagnostics information for the snapshot cache."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -429,6 +530,7 @@ class Camera(Entity):
     _attr_model: str | None = None
     _attr_motion_detection_enabled: bool = False
     _attr_should_poll: bool = False  # No need to poll cameras
+    _attr_snapshot_ttl: float = 0
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: int = 0
 
@@ -442,6 +544,7 @@ class Camera(Entity):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self.snapshot_cache = SnapshotCache()
 
     @property
     def entity_picture(self) -> str:
@@ -485,6 +588,14 @@ class Camera(Entity):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @property
+    def snapshot_ttl(self) -> float:
+        """Return how many seconds a snapshot may be served from cache.
+
+        Concurrent snapshot requests are always served by a single fetch.
+        """
+        return self._attr_snapshot_ttl
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -869,6 +980,9 @@ async def websocket_get_prefs(
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional(PREF_PRELOAD_STREAM): bool,
         vol.Optional(PREF_ORIENTATION): vol.All(int, vol.Range(min=1, max=8)),
+        vol.Optional(PREF_SNAPSHOT_TTL): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_SNAPSHOT_TTL)
+        ),
     }
 )
 @websocket_api.async_response
@@ -10,6 +10,7 @@ DATA_RTSP_TO_WEB_RTC: Final = "rtsp_to_web_rtc"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
+PREF_SNAPSHOT_TTL: Final = "snapshot_ttl"
 
 SERVICE_RECORD: Final = "record"
 
@@ -18,6 +19,8 @@ CONF_DURATION: Final = "duration"
 
 CAMERA_STREAM_SOURCE_TIMEOUT: Final = 10
 CAMERA_IMAGE_TIMEOUT: Final = 10
+# Longest time in seconds a snapshot may be served from the cache
+MAX_SNAPSHOT_TTL: Final = 3600
 
 
 class StreamType(StrEnum):
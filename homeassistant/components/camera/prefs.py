@@ -1,7 +1,7 @@
 """Preference management for camera component."""
 from __future__ import annotations
 
-from typing import Final, Union, cast
+from typing import Final, Optional, Union, cast
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
@@ -9,7 +9,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
-from .const import DOMAIN, PREF_ORIENTATION, PREF_PRELOAD_STREAM
+from .const import DOMAIN, PREF_ORIENTATION, PREF_PRELOAD_STREAM, PREF_SNAPSHOT_TTL
 
 STORAGE_KEY: Final = DOMAIN
 STORAGE_VERSION: Final = 1
@@ -18,11 +18,11 @@ STORAGE_VERSION: Final = 1
 class CameraEntityPreferences:
     """Handle preferences for camera entity."""
 
-    def __init__(self, prefs: dict[str, bool | int]) -> None:
+    def __init__(self, prefs: dict[str, bool | int | float]) -> None:
         """Initialize prefs."""
         self._prefs = prefs
 
-    def as_dict(self) -> dict[str, bool | int]:
+    def as_dict(self) -> dict[str, bool | int | float]:
         """Return dictionary version."""
         return self._prefs
 
@@ -34,7 +34,15 @@ class CameraEntityPreferences:
     @property
     def orientation(self) -> int:
         """Return the current stream orientation settings."""
-        return self._prefs.get(PREF_ORIENTATION, 1)
+        return cast(int, self._prefs.get(PREF_ORIENTATION, 1))
+
+    @property
+    def snapshot_ttl(self) -> float | None:
+        """Return how many seconds a snapshot may be served from cache.
+
+        None if the user did not set it, in which case the camera decides.
+        """
+        return cast(Optional[float], self._prefs.get(PREF_SNAPSHOT_TTL))
 
 
 class CameraPreferences:
@@ -44,12 +52,12 @@ class CameraPreferences:
         """Initialize camera prefs."""
         self._hass = hass
         # The orientation prefs are stored in in the entity registry options
-        # The preload_stream prefs are stored in this Store
-        self._store = Store[dict[str, dict[str, Union[bool, int]]]](
+        # The preload_stream and snapshot_ttl prefs are stored in this Store
+        self._store = Store[dict[str, dict[str, Union[bool, int, float]]]](
             hass, STORAGE_VERSION, STORAGE_KEY
         )
-        # Local copy of the preload_stream prefs
-        self._prefs: dict[str, dict[str, bool | int]] | None = None
+        # Local copy of the preload_stream and snapshot_ttl prefs
+        self._prefs: dict[str, dict[str, bool | int | float]] | None = None
 
     async def async_initialize(self) -> None:
         """Finish initializing the preferences."""
@@ -65,7 +73,8 @@ class CameraPreferences:
         preload_stream: bool | UndefinedType = UNDEFINED,
         orientation: int | UndefinedType = UNDEFINED,
         stream_options: dict[str, str] | UndefinedType = UNDEFINED,
-    ) -> dict[str, bool | int]:
+        snapshot_ttl: float | UndefinedType = UNDEFINED,
+    ) -> dict[str, bool | int | float]:
         """Update camera preferences.
 
         Returns a dict with the preferences on success.
@@ -79,6 +88,14 @@ class CameraPreferences:
             self._prefs[entity_id][PREF_PRELOAD_STREAM] = preload_stream
             await self._store.async_save(self._prefs)
 
+        if snapshot_ttl is not UNDEFINED:
+            # Prefs already initialized.
+            assert self._prefs is not None
+            if not self._prefs.get(entity_id):
+                self._prefs[entity_id] = {}
+            self._prefs[entity_id][PREF_SNAPSHOT_TTL] = snapshot_ttl
+            await self._store.async_save(self._prefs)
+
         if orientation is not UNDEFINED:
             if (registry := er.async_get(self._hass)).async_get(entity_id):
                 registry.async_update_entity_options(
@@ -10,6 +10,7 @@ from datetime import timedelta
 from fnmatch import translate
 from functools import lru_cache
 from ipaddress import ip_address as make_ip_address
+import itertools
 import logging
 import os
 import re
@@ -72,6 +73,8 @@ IP_ADDRESS: Final = "ip"
 REGISTERED_DEVICES: Final = "registered_devices"
 DHCP_REQUEST = 3
 SCAN_INTERVAL = timedelta(minutes=60)
+OUI_LENGTH = 6
+FNMATCH_WILDCARDS = ("*", "?", "[")
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -86,6 +89,43 @@ class DhcpServiceInfo(BaseServiceInfo):
     macaddress: str
 
 
+@dataclass
+class DhcpMatchers:
+    """Prepared matchers for dhcp."""
+
+    registered_devices_domains: set[str]
+    no_oui_matchers: list[DHCPMatcher]
+    oui_matchers: dict[str, list[DHCPMatcher]]
+
+
+def index_integration_matchers(
+    integration_matchers: list[DHCPMatcher],
+) -> DhcpMatchers:
+    """Index the integration matchers.
+
+    Matchers with a mac address pattern that starts with a fixed OUI are
+    indexed by it so a client only has to be checked against the matchers
+    for its own OUI and the few that cannot be indexed.
+    """
+    registered_devices_domains: set[str] = set()
+    no_oui_matchers: list[DHCPMatcher] = []
+    oui_matchers: dict[str, list[DHCPMatcher]] = {}
+    for matcher in integration_matchers:
+        if (matcher_mac := matcher.get(MAC_ADDRESS)) is not None and not any(
+            wildcard in matcher_mac[:OUI_LENGTH] for wildcard in FNMATCH_WILDCARDS
+        ):
+            oui_matchers.setdefault(matcher_mac[:OUI_LENGTH], []).append(matcher)
+        elif matcher.get(REGISTERED_DEVICES) and len(matcher) == 2:
+            registered_devices_domains.add(matcher["domain"])
+        else:
+            no_oui_matchers.append(matcher)
+    return DhcpMatchers(
+        registered_devices_domains=registered_devices_domains,
+        no_oui_matchers=no_oui_matchers,
+        oui_matchers=oui_matchers,
+    )
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the dhcp component."""
     watchers: list[WatcherBase] = []
@@ -128,7 +168,7 @@ class WatcherBase:
         super().__init__()
 
         self.hass = hass
-        self._integration_matchers = integration_matchers
+        self._integration_matchers = index_integration_matchers(integration_matchers)
         self._address_data = address_data
 
     @abstractmethod
@@ -198,7 +238,17 @@ class WatcherBase:
                 if entry := self.hass.config_entries.async_get_entry(entry_id):
                     device_domains.add(entry.domain)
 
-        for matcher in self._integration_matchers:
+        matchers = self._integration_matchers
+        registered_devices_domains = matchers.registered_devices_domains
+        if device_domains and registered_devices_domains:
+            for domain in device_domains & registered_devices_domains:
+                _LOGGER.debug("Matched %s against registered device %s", data, domain)
+                matched_domains.add(domain)
+
+        for matcher in itertools.chain(
+            matchers.oui_matchers.get(uppercase_mac[:OUI_LENGTH], ()),
+            matchers.no_oui_matchers,
+        ):
             domain = matcher["domain"]
 
             if matcher.get(REGISTERED_DEVICES) and domain not in device_domains:
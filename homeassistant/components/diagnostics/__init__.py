@@ -1,6 +1,7 @@
 """The Diagnostics integration."""
 from __future__ import annotations
 
+from dataclasses import asdict
 from http import HTTPStatus
 import json
 import logging
@@ -14,6 +15,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import integration_platform
 from homeassistant.helpers.device_registry import DeviceEntry, async_get
+from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
@@ -122,6 +124,23 @@ def handle_get(
     )
 
 
+@callback
+def _async_get_polling_stats(
+    hass: HomeAssistant, domain: str, config_entry_id: str
+) -> list[dict[str, Any]]:
+    """Return the polling statistics of the entity platforms of a config entry."""
+    return [
+        {
+            "domain": platform.domain,
+            "scan_interval": platform.scan_interval.total_seconds(),
+            **asdict(platform.polling_stats),
+        }
+        for platform in async_get_platforms(hass, domain)
+        if platform.config_entry is not None
+        and platform.config_entry.entry_id == config_entry_id
+    ]
+
+
 async def _async_get_json_file_response(
     hass: HomeAssistant,
     data: Any,
@@ -151,6 +170,7 @@ async def _async_get_json_file_response(
                 "home_assistant": hass_sys_info,
                 "custom_components": custom_components,
                 "integration_manifest": integration.manifest,
+                "polling": _async_get_polling_stats(hass, domain, d_id),
                 "data": data,
             },
             indent=2,
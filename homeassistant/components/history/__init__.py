@@ -31,6 +31,8 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
+from .websocket_stream import async_setup as async_setup_history_stream
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "history"
@@ -64,6 +66,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    async_setup_history_stream(hass)
 
     return True
 
@@ -0,0 +1,396 @@
+"""Websocket API to stream history."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, MutableMapping
+from dataclasses import dataclass
+from datetime import datetime as dt
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.websocket_api import messages
+from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.json import JSON_DUMP
+import homeassistant.util.dt as dt_util
+
+MAX_PENDING_HISTORY_STATES = 2048
+STATE_COALESCE_TIME = 0.35
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class HistoryLiveStream:
+    """Track a history live stream."""
+
+    stream_queue: asyncio.Queue[Event]
+    subscriptions: list[CALLBACK_TYPE]
+    end_time_unsub: CALLBACK_TYPE | None = None
+    task: asyncio.Task | None = None
+    wait_sync_task: asyncio.Task | None = None
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the history websocket API."""
+    websocket_api.async_register_command(hass, ws_stream)
+
+
+def _generate_stream_message(
+    states: MutableMapping[str, list[Any]], start_day: dt, end_day: dt
+) -> dict[str, Any]:
+    """Generate a history stream message response."""
+    return {
+        "states": states,
+        "start_time": dt_util.utc_to_timestamp(start_day),
+        "end_time": dt_util.utc_to_timestamp(end_day),
+    }
+
+
+def _ws_stream_get_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_day: dt,
+    end_day: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    partial: bool,
+) -> tuple[str, float | None]:
+    """Fetch states and convert them to json in the executor."""
+    states = history.get_significant_states(
+        hass,
+        start_day,
+        end_day,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    last_time = None
+    for entity_states in states.values():
+        last_updated = entity_states[-1][COMPRESSED_STATE_LAST_UPDATED]
+        if last_time is None or last_updated > last_time:
+            last_time = last_updated
+    message = _generate_stream_message(states, start_day, end_day)
+    if partial:
+        # This is a hint to consumers of the api that
+        # the live stream is about to start
+        message["partial"] = True
+    return JSON_DUMP(messages.event_message(msg_id, message)), last_time
+
+
+async def _async_send_historical_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    partial: bool,
+) -> float | None:
+    """Select historical states from the database and deliver them to the websocket.
+
+    This function returns the timestamp of the most recent state we sent to
+    the websocket.
+    """
+    message, last_time = await get_instance(hass).async_add_executor_job(
+        _ws_stream_get_states,
+        hass,
+        msg_id,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        partial,
+    )
+    # If there is no last_time there are no historical results, but
+    # we still send an empty message if its the last one (not partial)
+    # so consumers of the api know their request was answered
+    if last_time or not partial:
+        connection.send_message(message)
+    return last_time
+
+
+def _history_compressed_state(
+    state: State, minimal_response: bool, no_attributes: bool
+) -> dict[str, Any]:
+    """Convert a state to the compressed format used by the history queries."""
+    if minimal_response and state.domain not in history.NEED_ATTRIBUTE_DOMAINS:
+        # Matches the states in-between the first and last
+        # one of a minimal response from the database
+        return {
+            COMPRESSED_STATE_STATE: state.state,
+            COMPRESSED_STATE_LAST_UPDATED: state.last_updated.timestamp(),
+        }
+    comp_state: dict[str, Any] = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: {} if no_attributes else state.attributes,
+        COMPRESSED_STATE_LAST_UPDATED: state.last_updated.timestamp(),
+    }
+    if state.last_changed != state.last_updated:
+        comp_state[COMPRESSED_STATE_LAST_CHANGED] = state.last_changed.timestamp()
+    return comp_state
+
+
+def _events_to_compressed_states(
+    events: Iterable[Event], minimal_response: bool, no_attributes: bool
+) -> dict[str, list[dict[str, Any]]]:
+    """Convert state_changed events to compressed states grouped by entity_id."""
+    states: dict[str, list[dict[str, Any]]] = {}
+    for event in events:
+        state: State = event.data["new_state"]
+        states.setdefault(state.entity_id, []).append(
+            _history_compressed_state(state, minimal_response, no_attributes)
+        )
+    return states
+
+
+@callback
+def _async_state_change_is_significant(
+    event: Event, significant_changes_only: bool, minimal_response: bool
+) -> bool:
+    """Check if a state change would be returned by the history query."""
+    if (new_state := event.data["new_state"]) is None:
+        return False
+    old_state: State | None = event.data["old_state"]
+    if old_state is None or old_state.state != new_state.state:
+        return True
+    if minimal_response and new_state.domain not in history.NEED_ATTRIBUTE_DOMAINS:
+        return False
+    return (
+        not significant_changes_only or new_state.domain in history.SIGNIFICANT_DOMAINS
+    )
+
+
+async def _async_states_consumer(
+    subscriptions_setup_complete_time: dt,
+    connection: ActiveConnection,
+    msg_id: int,
+    stream_queue: asyncio.Queue[Event],
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Stream states from the queue."""
+    while True:
+        events: list[Event] = [await stream_queue.get()]
+        # If the state is older than the last db
+        # state we already sent it so we skip it.
+        if events[0].time_fired <= subscriptions_setup_complete_time:
+            continue
+        # We sleep for the STATE_COALESCE_TIME so
+        # we can group states together to minimize
+        # the number of websocket messages when the
+        # system is overloaded with a state change storm
+        await asyncio.sleep(STATE_COALESCE_TIME)
+        while not stream_queue.empty():
+            events.append(stream_queue.get_nowait())
+
+        connection.send_message(
+            JSON_DUMP(
+                messages.event_message(
+                    msg_id,
+                    {
+                        "states": _events_to_compressed_states(
+                            events, minimal_response, no_attributes
+                        )
+                    },
+                )
+            )
+        )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("no_attributes", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_stream(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle history stream websocket command."""
+    start_time_str = msg["start_time"]
+    msg_id: int = msg["id"]
+    utc_now = dt_util.utcnow()
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+
+    if not start_time or start_time > utc_now:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+
+    end_time_str = msg.get("end_time")
+    end_time: dt | None = None
+    if end_time_str:
+        if not (end_time := dt_util.parse_datetime(end_time_str)):
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+        end_time = dt_util.as_utc(end_time)
+        if end_time < start_time:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+
+    entity_ids: list[str] = msg["entity_ids"]
+    include_start_time_state: bool = msg["include_start_time_state"]
+    significant_changes_only: bool = msg["significant_changes_only"]
+    minimal_response: bool = msg["minimal_response"]
+    no_attributes: bool = msg["no_attributes"]
+
+    if end_time and end_time <= utc_now:
+        # Not a live stream so we only fetch the history
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        await _async_send_historical_states(
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            partial=False,
+        )
+        return
+
+    subscriptions: list[CALLBACK_TYPE] = []
+    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_HISTORY_STATES)
+    live_stream = HistoryLiveStream(
+        subscriptions=subscriptions, stream_queue=stream_queue
+    )
+
+    @callback
+    def _unsub(*time: Any) -> None:
+        """Unsubscribe from all state changes."""
+        for subscription in subscriptions:
+            subscription()
+        subscriptions.clear()
+        if live_stream.task:
+            live_stream.task.cancel()
+        if live_stream.wait_sync_task:
+            live_stream.wait_sync_task.cancel()
+        if live_stream.end_time_unsub:
+            live_stream.end_time_unsub()
+            live_stream.end_time_unsub = None
+
+    if end_time:
+        live_stream.end_time_unsub = async_track_point_in_utc_time(
+            hass, _unsub, end_time
+        )
+
+    @callback
+    def _queue_or_cancel(event: Event) -> None:
+        """Queue a state change to be processed or cancel."""
+        if not _async_state_change_is_significant(
+            event, significant_changes_only, minimal_response
+        ):
+            return
+        try:
+            stream_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            _LOGGER.debug(
+                "Client exceeded max pending messages of %s",
+                MAX_PENDING_HISTORY_STATES,
+            )
+            _unsub()
+
+    subscriptions.append(
+        async_track_state_change_event(hass, entity_ids, _queue_or_cancel)
+    )
+    subscriptions_setup_complete_time = dt_util.utcnow()
+    connection.subscriptions[msg_id] = _unsub
+    connection.send_result(msg_id)
+    # Fetch everything from history
+    last_time = await _async_send_historical_states(
+        hass,
+        connection,
+        msg_id,
+        start_time,
+        subscriptions_setup_complete_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        partial=True,
+    )
+
+    live_stream.task = asyncio.create_task(
+        _async_states_consumer(
+            subscriptions_setup_complete_time,
+            connection,
+            msg_id,
+            stream_queue,
+            minimal_response,
+            no_attributes,
+        )
+    )
+
+    if msg_id not in connection.subscriptions:
+        # Unsubscribe happened while sending historical states
+        return
+
+    live_stream.wait_sync_task = asyncio.create_task(
+        get_instance(hass).async_block_till_done()
+    )
+    await live_stream.wait_sync_task
+
+    #
+    # Fetch any states from the database that have
+    # not been committed since the original fetch
+    # so we can switch over to using the subscriptions
+    #
+    # We only want states that changed after the last state
+    # we had from the last database query
+    #
+    await _async_send_historical_states(
+        hass,
+        connection,
+        msg_id,
+        dt_util.utc_from_timestamp(last_time) if last_time else start_time,
+        subscriptions_setup_complete_time,
+        entity_ids,
+        False,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        partial=False,
+    )
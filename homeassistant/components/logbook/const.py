@@ -14,6 +14,13 @@ ALWAYS_CONTINUOUS_DOMAINS = {COUNTER_DOMAIN, PROXIMITY_DOMAIN}
 # Domains that are continuous if there is a UOM set on the entity
 CONDITIONALLY_CONTINUOUS_DOMAINS = {SENSOR_DOMAIN}
 
+# The logbook queries the states_meta, event_types, timestamp
+# and binary context id columns since this schema version
+LOGBOOK_SCHEMA_VERSION = 33
+
+# The recorder writes the logbook_entries table since this schema version
+LOGBOOK_ENTRIES_SCHEMA_VERSION = 35
+
 ATTR_MESSAGE = "message"
 
 DOMAIN = "logbook"
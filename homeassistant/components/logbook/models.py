@@ -2,14 +2,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime as dt
 import json
 from typing import Any, cast
 
 from sqlalchemy.engine.row import Row
 
+from homeassistant.components.recorder.models import (
+    bytes_to_ulid_or_none,
+    bytes_to_uuid_hex_or_none,
+    context_id_to_bytes,
+    uuid_hex_to_bytes_or_none,
+)
 from homeassistant.const import ATTR_ICON, EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, State, callback
+import homeassistant.util.dt as dt_util
 
 
 class LazyEventPartialState:
@@ -22,9 +28,7 @@ class LazyEventPartialState:
         "event_type",
         "entity_id",
         "state",
-        "context_id",
-        "context_user_id",
-        "context_parent_id",
+        "context_id_bin",
         "data",
     ]
 
@@ -40,9 +44,7 @@ class LazyEventPartialState:
         self.event_type: str | None = self.row.event_type
         self.entity_id: str | None = self.row.entity_id
         self.state = self.row.state
-        self.context_id: str | None = self.row.context_id
-        self.context_user_id: str | None = self.row.context_user_id
-        self.context_parent_id: str | None = self.row.context_parent_id
+        self.context_id_bin: bytes | None = self.row.context_id_bin
         if data := getattr(row, "data", None):
             # If its an EventAsRow we can avoid the whole
             # json decode process as we already have the data
@@ -58,6 +60,21 @@ class LazyEventPartialState:
                 dict[str, Any], json.loads(source)
             )
 
+    @property
+    def context_id(self) -> str | None:
+        """Return the context id."""
+        return bytes_to_ulid_or_none(self.context_id_bin)
+
+    @property
+    def context_user_id(self) -> str | None:
+        """Return the context user id."""
+        return bytes_to_uuid_hex_or_none(self.row.context_user_id_bin)
+
+    @property
+    def context_parent_id(self) -> str | None:
+        """Return the context parent id."""
+        return bytes_to_ulid_or_none(self.row.context_parent_id_bin)
+
 
 @dataclass(frozen=True)
 class EventAsRow:
@@ -65,16 +82,16 @@ class EventAsRow:
 
     data: dict[str, Any]
     context: Context
-    context_id: str
-    time_fired: dt
+    context_id_bin: bytes | None
+    time_fired_ts: float
     state_id: int
     event_data: str | None = None
     old_format_icon: None = None
     event_id: None = None
     entity_id: str | None = None
     icon: str | None = None
-    context_user_id: str | None = None
-    context_parent_id: str | None = None
+    context_user_id_bin: bytes | None = None
+    context_parent_id_bin: bytes | None = None
     event_type: str | None = None
     state: str | None = None
     shared_data: str | None = None
@@ -89,10 +106,10 @@ def async_event_to_row(event: Event) -> EventAsRow | None:
             data=event.data,
             context=event.context,
             event_type=event.event_type,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
-            time_fired=event.time_fired,
+            context_id_bin=context_id_to_bytes(event.context.id),
+            context_user_id_bin=uuid_hex_to_bytes_or_none(event.context.user_id),
+            context_parent_id_bin=context_id_to_bytes(event.context.parent_id),
+            time_fired_ts=dt_util.utc_to_timestamp(event.time_fired),
             state_id=hash(event),
         )
     # States are prefiltered so we never get states
@@ -104,10 +121,10 @@ def async_event_to_row(event: Event) -> EventAsRow | None:
         context=event.context,
         entity_id=new_state.entity_id,
         state=new_state.state,
-        context_id=new_state.context.id,
-        context_user_id=new_state.context.user_id,
-        context_parent_id=new_state.context.parent_id,
-        time_fired=new_state.last_updated,
+        context_id_bin=context_id_to_bytes(new_state.context.id),
+        context_user_id_bin=uuid_hex_to_bytes_or_none(new_state.context.user_id),
+        context_parent_id_bin=context_id_to_bytes(new_state.context.parent_id),
+        time_fired_ts=dt_util.utc_to_timestamp(new_state.last_updated),
         state_id=hash(event),
         icon=new_state.attributes.get(ATTR_ICON),
     )
@@ -6,7 +6,9 @@ from datetime import datetime as dt
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.models import context_id_to_bytes
 from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
 
 from .all import all_stmt
 from .devices import devices_stmt
@@ -15,28 +17,43 @@ from .entities_and_devices import entities_devices_stmt
 
 
 def statement_for_request(
-    start_day: dt,
-    end_day: dt,
+    start_day_dt: dt,
+    end_day_dt: dt,
     event_types: tuple[str, ...],
     entity_ids: list[str] | None = None,
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    use_logbook_entries: bool = False,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    The state changes are found in the logbook_entries table
+    when use_logbook_entries is set.
+    """
+    start_day = dt_util.utc_to_timestamp(start_day_dt)
+    end_day = dt_util.utc_to_timestamp(end_day_dt)
 
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
-        states_entity_filter = filters.states_entity_filter() if filters else None
+        states_entity_filter = (
+            filters.states_metadata_entity_filter() if filters else None
+        )
         events_entity_filter = filters.events_entity_filter() if filters else None
+        context_id_bin: bytes | None = None
+        if context_id is not None:
+            # A context_id that cannot be converted can never
+            # match a row so we use an empty value instead
+            context_id_bin = context_id_to_bytes(context_id) or b""
         return all_stmt(
             start_day,
             end_day,
             event_types,
             states_entity_filter,
             events_entity_filter,
-            context_id,
+            context_id_bin,
+            use_logbook_entries,
         )
 
     # sqlalchemy caches object quoting, the
@@ -55,6 +72,7 @@ def statement_for_request(
             entity_ids,
             json_quoted_entity_ids,
             json_quoted_device_ids,
+            use_logbook_entries,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +84,7 @@ def statement_for_request(
             event_types,
             entity_ids,
             json_quoted_entity_ids,
+            use_logbook_entries,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
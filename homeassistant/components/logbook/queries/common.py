@@ -1,8 +1,6 @@
 """Queries for logbook."""
 from __future__ import annotations
 
-from datetime import datetime as dt
-
 import sqlalchemy
 from sqlalchemy import select
 from sqlalchemy.orm import Query
@@ -11,15 +9,19 @@ from sqlalchemy.sql.expression import literal
 from sqlalchemy.sql.selectable import Select
 
 from homeassistant.components.recorder.db_schema import (
-    EVENTS_CONTEXT_ID_INDEX,
+    EVENTS_CONTEXT_ID_BIN_INDEX,
+    LOGBOOK_ENTRIES_LAST_UPDATED_INDEX,
     OLD_FORMAT_ATTRS_JSON,
     OLD_STATE,
     SHARED_ATTRS_JSON,
-    STATES_CONTEXT_ID_INDEX,
+    STATES_CONTEXT_ID_BIN_INDEX,
     EventData,
     Events,
+    EventTypes,
+    LogbookEntries,
     StateAttributes,
     States,
+    StatesMeta,
 )
 from homeassistant.components.recorder.filters import like_domain_matchers
 
@@ -45,18 +47,18 @@ PSUEDO_EVENT_STATE_CHANGED = None
 
 EVENT_COLUMNS = (
     Events.event_id.label("event_id"),
-    Events.event_type.label("event_type"),
+    EventTypes.event_type.label("event_type"),
     Events.event_data.label("event_data"),
-    Events.time_fired.label("time_fired"),
-    Events.context_id.label("context_id"),
-    Events.context_user_id.label("context_user_id"),
-    Events.context_parent_id.label("context_parent_id"),
+    Events.time_fired_ts.label("time_fired_ts"),
+    Events.context_id_bin.label("context_id_bin"),
+    Events.context_user_id_bin.label("context_user_id_bin"),
+    Events.context_parent_id_bin.label("context_parent_id_bin"),
 )
 
 STATE_COLUMNS = (
     States.state_id.label("state_id"),
     States.state.label("state"),
-    States.entity_id.label("entity_id"),
+    StatesMeta.entity_id.label("entity_id"),
     SHARED_ATTRS_JSON["icon"].as_string().label("icon"),
     OLD_FORMAT_ATTRS_JSON["icon"].as_string().label("old_format_icon"),
 )
@@ -64,7 +66,7 @@ STATE_COLUMNS = (
 STATE_CONTEXT_ONLY_COLUMNS = (
     States.state_id.label("state_id"),
     States.state.label("state"),
-    States.entity_id.label("entity_id"),
+    StatesMeta.entity_id.label("entity_id"),
     literal(value=None, type_=sqlalchemy.String).label("icon"),
     literal(value=None, type_=sqlalchemy.String).label("old_format_icon"),
 )
@@ -79,13 +81,34 @@ EVENT_COLUMNS_FOR_STATE_SELECT = [
         "event_type"
     ),
     literal(value=None, type_=sqlalchemy.Text).label("event_data"),
-    States.last_updated.label("time_fired"),
-    States.context_id.label("context_id"),
-    States.context_user_id.label("context_user_id"),
-    States.context_parent_id.label("context_parent_id"),
+    States.last_updated_ts.label("time_fired_ts"),
+    States.context_id_bin.label("context_id_bin"),
+    States.context_user_id_bin.label("context_user_id_bin"),
+    States.context_parent_id_bin.label("context_parent_id_bin"),
     literal(value=None, type_=sqlalchemy.Text).label("shared_data"),
 ]
 
+EVENT_COLUMNS_FOR_LOGBOOK_ENTRY_SELECT = [
+    literal(value=None, type_=sqlalchemy.Text).label("event_id"),
+    literal(value=PSUEDO_EVENT_STATE_CHANGED, type_=sqlalchemy.String).label(
+        "event_type"
+    ),
+    literal(value=None, type_=sqlalchemy.Text).label("event_data"),
+    LogbookEntries.last_updated_ts.label("time_fired_ts"),
+    States.context_id_bin.label("context_id_bin"),
+    States.context_user_id_bin.label("context_user_id_bin"),
+    States.context_parent_id_bin.label("context_parent_id_bin"),
+    literal(value=None, type_=sqlalchemy.Text).label("shared_data"),
+]
+
+LOGBOOK_ENTRY_STATE_COLUMNS = (
+    LogbookEntries.state_id.label("state_id"),
+    States.state.label("state"),
+    StatesMeta.entity_id.label("entity_id"),
+    LogbookEntries.icon.label("icon"),
+    literal(value=None, type_=sqlalchemy.String).label("old_format_icon"),
+)
+
 EMPTY_STATE_COLUMNS = (
     literal(value=0, type_=sqlalchemy.Integer).label("state_id"),
     literal(value=None, type_=sqlalchemy.String).label("state"),
@@ -108,15 +131,15 @@ NOT_CONTEXT_ONLY = literal(None).label("context_only")
 
 
 def select_events_context_id_subquery(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
 ) -> Select:
     """Generate the select for a context_id subquery."""
     return (
-        select(Events.context_id)
-        .where((Events.time_fired > start_day) & (Events.time_fired < end_day))
-        .where(Events.event_type.in_(event_types))
+        select(Events.context_id_bin)
+        .where((Events.time_fired_ts > start_day) & (Events.time_fired_ts < end_day))
+        .where(_event_type_id_matcher(event_types))
         .outerjoin(EventData, (Events.data_id == EventData.data_id))
     )
 
@@ -142,14 +165,15 @@ def select_states_context_only() -> Select:
 
 
 def select_events_without_states(
-    start_day: dt, end_day: dt, event_types: tuple[str, ...]
+    start_day: float, end_day: float, event_types: tuple[str, ...]
 ) -> Select:
     """Generate an events select that does not join states."""
     return (
         select(*EVENT_ROWS_NO_STATES, NOT_CONTEXT_ONLY)
-        .where((Events.time_fired > start_day) & (Events.time_fired < end_day))
-        .where(Events.event_type.in_(event_types))
+        .where((Events.time_fired_ts > start_day) & (Events.time_fired_ts < end_day))
+        .where(_event_type_id_matcher(event_types))
         .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
     )
 
 
@@ -159,11 +183,34 @@ def select_states() -> Select:
         *EVENT_COLUMNS_FOR_STATE_SELECT,
         *STATE_COLUMNS,
         NOT_CONTEXT_ONLY,
+    ).outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+
+
+def select_logbook_entries(start_day: float, end_day: float) -> Select:
+    """Generate a logbook_entries select that formats the entries as event rows.
+
+    The recorder only writes logbook entries for states that changed
+    value so only the continuous entities have to be filtered.
+    """
+    return (
+        select(
+            *EVENT_COLUMNS_FOR_LOGBOOK_ENTRY_SELECT,
+            *LOGBOOK_ENTRY_STATE_COLUMNS,
+            NOT_CONTEXT_ONLY,
+        )
+        .select_from(LogbookEntries)
+        .join(States, (LogbookEntries.state_id == States.state_id))
+        .outerjoin(StatesMeta, (LogbookEntries.metadata_id == StatesMeta.metadata_id))
+        .where(
+            (LogbookEntries.last_updated_ts > start_day)
+            & (LogbookEntries.last_updated_ts < end_day)
+        )
+        .where(_not_continuous_logbook_entry_matcher())
     )
 
 
 def legacy_select_events_context_id(
-    start_day: dt, end_day: dt, context_id: str
+    start_day: float, end_day: float, context_id_bin: bytes
 ) -> Select:
     """Generate a legacy events context id select that also joins states."""
     # This can be removed once we no longer have event_ids in the states table
@@ -175,19 +222,41 @@ def legacy_select_events_context_id(
             NOT_CONTEXT_ONLY,
         )
         .outerjoin(States, (Events.event_id == States.event_id))
+        .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
         .where(
-            (States.last_updated == States.last_changed) | States.last_changed.is_(None)
+            (States.last_updated_ts == States.last_changed_ts)
+            | States.last_changed_ts.is_(None)
         )
         .where(_not_continuous_entity_matcher())
         .outerjoin(
             StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
         )
-        .where((Events.time_fired > start_day) & (Events.time_fired < end_day))
-        .where(Events.context_id == context_id)
+        .where((Events.time_fired_ts > start_day) & (Events.time_fired_ts < end_day))
+        .where(Events.context_id_bin == context_id_bin)
+    )
+
+
+def apply_event_types_join(query: Query) -> Query:
+    """Join the event_types table to get the event_type of the event rows."""
+    return query.outerjoin(
+        EventTypes, (Events.event_type_id == EventTypes.event_type_id)
     )
 
 
-def apply_states_filters(query: Query, start_day: dt, end_day: dt) -> Query:
+def apply_states_meta_join(query: Query) -> Query:
+    """Join the states_meta table to get the entity_id of the state rows."""
+    return query.outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+
+
+def _event_type_id_matcher(event_types: tuple[str, ...]) -> ClauseList:
+    """Match the event_type_ids of the event_types in the event_types table."""
+    return Events.event_type_id.in_(
+        select(EventTypes.event_type_id).where(EventTypes.event_type.in_(event_types))
+    )
+
+
+def apply_states_filters(query: Query, start_day: float, end_day: float) -> Query:
     """Filter states by time range.
 
     Filters states that do not have an old state or new state (added / removed)
@@ -196,13 +265,14 @@ def apply_states_filters(query: Query, start_day: dt, end_day: dt) -> Query:
     """
     return (
         query.filter(
-            (States.last_updated > start_day) & (States.last_updated < end_day)
+            (States.last_updated_ts > start_day) & (States.last_updated_ts < end_day)
         )
         .outerjoin(OLD_STATE, (States.old_state_id == OLD_STATE.state_id))
         .where(_missing_state_matcher())
         .where(_not_continuous_entity_matcher())
         .where(
-            (States.last_updated == States.last_changed) | States.last_changed.is_(None)
+            (States.last_updated_ts == States.last_changed_ts)
+            | States.last_changed_ts.is_(None)
         )
         .outerjoin(
             StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
@@ -234,6 +304,17 @@ def _not_continuous_entity_matcher() -> sqlalchemy.or_:
     )
 
 
+def _not_continuous_logbook_entry_matcher() -> sqlalchemy.or_:
+    """Match logbook entries of non continuous entities."""
+    return sqlalchemy.or_(
+        _not_possible_continuous_domain_matcher(),
+        sqlalchemy.and_(
+            _conditionally_continuous_domain_matcher(),
+            LogbookEntries.has_unit.is_(False),
+        ).self_group(),
+    )
+
+
 def _not_possible_continuous_domain_matcher() -> sqlalchemy.and_:
     """Match not continuous domains.
 
@@ -243,7 +324,7 @@ def _not_possible_continuous_domain_matcher() -> sqlalchemy.and_:
     """
     return sqlalchemy.and_(
         *[
-            ~States.entity_id.like(entity_domain)
+            ~StatesMeta.entity_id.like(entity_domain)
             for entity_domain in (
                 *ALWAYS_CONTINUOUS_ENTITY_ID_LIKE,
                 *CONDITIONALLY_CONTINUOUS_ENTITY_ID_LIKE,
@@ -260,7 +341,7 @@ def _conditionally_continuous_domain_matcher() -> sqlalchemy.or_:
     """
     return sqlalchemy.or_(
         *[
-            States.entity_id.like(entity_domain)
+            StatesMeta.entity_id.like(entity_domain)
             for entity_domain in CONDITIONALLY_CONTINUOUS_ENTITY_ID_LIKE
         ],
     ).self_group()
@@ -276,12 +357,21 @@ def _not_uom_attributes_matcher() -> ClauseList:
 def apply_states_context_hints(query: Query) -> Query:
     """Force mysql to use the right index on large context_id selects."""
     return query.with_hint(
-        States, f"FORCE INDEX ({STATES_CONTEXT_ID_INDEX})", dialect_name="mysql"
+        States, f"FORCE INDEX ({STATES_CONTEXT_ID_BIN_INDEX})", dialect_name="mysql"
+    )
+
+
+def apply_logbook_entries_hints(query: Query) -> Query:
+    """Force mysql to use the right index on large selects."""
+    return query.with_hint(
+        LogbookEntries,
+        f"FORCE INDEX ({LOGBOOK_ENTRIES_LAST_UPDATED_INDEX})",
+        dialect_name="mysql",
     )
 
 
 def apply_events_context_hints(query: Query) -> Query:
     """Force mysql to use the right index on large context_id selects."""
     return query.with_hint(
-        Events, f"FORCE INDEX ({EVENTS_CONTEXT_ID_INDEX})", dialect_name="mysql"
+        Events, f"FORCE INDEX ({EVENTS_CONTEXT_ID_BIN_INDEX})", dialect_name="mysql"
     )
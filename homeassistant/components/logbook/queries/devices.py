@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import datetime as dt
 
 import sqlalchemy
 from sqlalchemy import lambda_stmt, select
@@ -19,8 +18,10 @@ from homeassistant.components.recorder.db_schema import (
 )
 
 from .common import (
+    apply_event_types_join,
     apply_events_context_hints,
     apply_states_context_hints,
+    apply_states_meta_join,
     select_events_context_id_subquery,
     select_events_context_only,
     select_events_without_states,
@@ -29,8 +30,8 @@ from .common import (
 
 
 def _select_device_id_context_ids_sub_query(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
 ) -> CompoundSelect:
@@ -38,13 +39,13 @@ def _select_device_id_context_ids_sub_query(
     inner = select_events_context_id_subquery(start_day, end_day, event_types).where(
         apply_event_device_id_matchers(json_quotable_device_ids)
     )
-    return select(inner.c.context_id).group_by(inner.c.context_id)
+    return select(inner.c.context_id_bin).group_by(inner.c.context_id_bin)
 
 
 def _apply_devices_context_union(
     query: Query,
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
 ) -> CompoundSelect:
@@ -56,22 +57,30 @@ def _apply_devices_context_union(
         json_quotable_device_ids,
     ).cte()
     return query.union_all(
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(devices_cte)
-            .outerjoin(Events, devices_cte.c.context_id == Events.context_id)
-        ).outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_cte)
-            .outerjoin(States, devices_cte.c.context_id == States.context_id)
+        apply_event_types_join(
+            apply_events_context_hints(
+                select_events_context_only()
+                .select_from(devices_cte)
+                .outerjoin(
+                    Events, devices_cte.c.context_id_bin == Events.context_id_bin
+                )
+            ).outerjoin(EventData, (Events.data_id == EventData.data_id))
+        ),
+        apply_states_meta_join(
+            apply_states_context_hints(
+                select_states_context_only()
+                .select_from(devices_cte)
+                .outerjoin(
+                    States, devices_cte.c.context_id_bin == States.context_id_bin
+                )
+            )
         ),
     )
 
 
 def devices_stmt(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
 ) -> StatementLambdaElement:
@@ -85,7 +94,7 @@ def devices_stmt(
             end_day,
             event_types,
             json_quotable_device_ids,
-        ).order_by(Events.time_fired)
+        ).order_by(Events.time_fired_ts)
     )
     return stmt
 
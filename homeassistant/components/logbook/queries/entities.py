@@ -2,38 +2,44 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import datetime as dt
 
 import sqlalchemy
 from sqlalchemy import lambda_stmt, select, union_all
 from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ClauseList
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import CTE, CompoundSelect
 
 from homeassistant.components.recorder.db_schema import (
     ENTITY_ID_IN_EVENT,
-    ENTITY_ID_LAST_UPDATED_INDEX,
+    LOGBOOK_ENTRIES_METADATA_ID_LAST_UPDATED_INDEX,
+    METADATA_ID_LAST_UPDATED_INDEX,
     OLD_ENTITY_ID_IN_EVENT,
     EventData,
     Events,
+    LogbookEntries,
     States,
+    StatesMeta,
 )
 
 from .common import (
+    apply_event_types_join,
     apply_events_context_hints,
     apply_states_context_hints,
     apply_states_filters,
+    apply_states_meta_join,
     select_events_context_id_subquery,
     select_events_context_only,
     select_events_without_states,
+    select_logbook_entries,
     select_states,
     select_states_context_only,
 )
 
 
 def _select_entities_context_ids_sub_query(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
@@ -43,17 +49,20 @@ def _select_entities_context_ids_sub_query(
         select_events_context_id_subquery(start_day, end_day, event_types).where(
             apply_event_entity_id_matchers(json_quoted_entity_ids)
         ),
-        apply_entities_hints(select(States.context_id))
-        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .where(States.entity_id.in_(entity_ids)),
+        apply_entities_hints(select(States.context_id_bin))
+        .filter(
+            (States.last_updated_ts > start_day) & (States.last_updated_ts < end_day)
+        )
+        .where(states_metadata_id_matcher(entity_ids)),
     )
-    return select(union.c.context_id).group_by(union.c.context_id)
+    return select(union.c.context_id_bin).group_by(union.c.context_id_bin)
 
 
 def _apply_entities_context_union(
     query: Query,
-    start_day: dt,
-    end_day: dt,
+    states_query: Query,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
@@ -72,49 +81,93 @@ def _apply_entities_context_union(
     # in the python code anyways since they will have context_only
     # set on them the impact is minimal.
     return query.union_all(
-        states_query_for_entity_ids(start_day, end_day, entity_ids),
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(entities_cte)
-            .outerjoin(Events, entities_cte.c.context_id == Events.context_id)
-        ).outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(entities_cte)
-            .outerjoin(States, entities_cte.c.context_id == States.context_id)
+        states_query,
+        apply_event_types_join(
+            apply_events_context_hints(
+                select_events_context_only()
+                .select_from(entities_cte)
+                .outerjoin(
+                    Events, entities_cte.c.context_id_bin == Events.context_id_bin
+                )
+            ).outerjoin(EventData, (Events.data_id == EventData.data_id))
+        ),
+        apply_states_meta_join(
+            apply_states_context_hints(
+                select_states_context_only()
+                .select_from(entities_cte)
+                .outerjoin(
+                    States, entities_cte.c.context_id_bin == States.context_id_bin
+                )
+            )
         ),
     )
 
 
 def entities_stmt(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    use_logbook_entries: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
+    if use_logbook_entries:
+        return lambda_stmt(
+            lambda: _apply_entities_context_union(
+                select_events_without_states(start_day, end_day, event_types).where(
+                    apply_event_entity_id_matchers(json_quoted_entity_ids)
+                ),
+                logbook_entries_query_for_entity_ids(start_day, end_day, entity_ids),
+                start_day,
+                end_day,
+                event_types,
+                entity_ids,
+                json_quoted_entity_ids,
+            ).order_by(Events.time_fired_ts)
+        )
     return lambda_stmt(
         lambda: _apply_entities_context_union(
             select_events_without_states(start_day, end_day, event_types).where(
                 apply_event_entity_id_matchers(json_quoted_entity_ids)
             ),
+            states_query_for_entity_ids(start_day, end_day, entity_ids),
             start_day,
             end_day,
             event_types,
             entity_ids,
             json_quoted_entity_ids,
-        ).order_by(Events.time_fired)
+        ).order_by(Events.time_fired_ts)
     )
 
 
 def states_query_for_entity_ids(
-    start_day: dt, end_day: dt, entity_ids: list[str]
+    start_day: float, end_day: float, entity_ids: list[str]
 ) -> Query:
     """Generate a select for states from the States table for specific entities."""
     return apply_states_filters(
         apply_entities_hints(select_states()), start_day, end_day
-    ).where(States.entity_id.in_(entity_ids))
+    ).where(states_metadata_id_matcher(entity_ids))
+
+
+def logbook_entries_query_for_entity_ids(
+    start_day: float, end_day: float, entity_ids: list[str]
+) -> Query:
+    """Generate a select for the logbook entries of specific entities."""
+    return apply_logbook_entries_entities_hints(
+        select_logbook_entries(start_day, end_day)
+    ).where(
+        LogbookEntries.metadata_id.in_(
+            select(StatesMeta.metadata_id).where(StatesMeta.entity_id.in_(entity_ids))
+        )
+    )
+
+
+def states_metadata_id_matcher(entity_ids: list[str]) -> ClauseList:
+    """Match the metadata_ids of the entity_ids in the states_meta table."""
+    return States.metadata_id.in_(
+        select(StatesMeta.metadata_id).where(StatesMeta.entity_id.in_(entity_ids))
+    )
 
 
 def apply_event_entity_id_matchers(
@@ -136,5 +189,14 @@ def apply_event_entity_id_matchers(
 def apply_entities_hints(query: Query) -> Query:
     """Force mysql to use the right index on large selects."""
     return query.with_hint(
-        States, f"FORCE INDEX ({ENTITY_ID_LAST_UPDATED_INDEX})", dialect_name="mysql"
+        States, f"FORCE INDEX ({METADATA_ID_LAST_UPDATED_INDEX})", dialect_name="mysql"
+    )
+
+
+def apply_logbook_entries_entities_hints(query: Query) -> Query:
+    """Force mysql to use the right index on large selects."""
+    return query.with_hint(
+        LogbookEntries,
+        f"FORCE INDEX ({LOGBOOK_ENTRIES_METADATA_ID_LAST_UPDATED_INDEX})",
+        dialect_name="mysql",
     )
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import datetime as dt
 
 import sqlalchemy
 from sqlalchemy import lambda_stmt, select, union_all
@@ -13,8 +12,10 @@ from sqlalchemy.sql.selectable import CTE, CompoundSelect
 from homeassistant.components.recorder.db_schema import EventData, Events, States
 
 from .common import (
+    apply_event_types_join,
     apply_events_context_hints,
     apply_states_context_hints,
+    apply_states_meta_join,
     select_events_context_id_subquery,
     select_events_context_only,
     select_events_without_states,
@@ -24,13 +25,15 @@ from .devices import apply_event_device_id_matchers
 from .entities import (
     apply_entities_hints,
     apply_event_entity_id_matchers,
+    logbook_entries_query_for_entity_ids,
+    states_metadata_id_matcher,
     states_query_for_entity_ids,
 )
 
 
 def _select_entities_device_id_context_ids_sub_query(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
@@ -43,17 +46,20 @@ def _select_entities_device_id_context_ids_sub_query(
                 json_quoted_entity_ids, json_quoted_device_ids
             )
         ),
-        apply_entities_hints(select(States.context_id))
-        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .where(States.entity_id.in_(entity_ids)),
+        apply_entities_hints(select(States.context_id_bin))
+        .filter(
+            (States.last_updated_ts > start_day) & (States.last_updated_ts < end_day)
+        )
+        .where(states_metadata_id_matcher(entity_ids)),
     )
-    return select(union.c.context_id).group_by(union.c.context_id)
+    return select(union.c.context_id_bin).group_by(union.c.context_id_bin)
 
 
 def _apply_entities_devices_context_union(
     query: Query,
-    start_day: dt,
-    end_day: dt,
+    states_query: Query,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
@@ -73,29 +79,57 @@ def _apply_entities_devices_context_union(
     # in the python code anyways since they will have context_only
     # set on them the impact is minimal.
     return query.union_all(
-        states_query_for_entity_ids(start_day, end_day, entity_ids),
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(devices_entities_cte)
-            .outerjoin(Events, devices_entities_cte.c.context_id == Events.context_id)
-        ).outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_entities_cte)
-            .outerjoin(States, devices_entities_cte.c.context_id == States.context_id)
+        states_query,
+        apply_event_types_join(
+            apply_events_context_hints(
+                select_events_context_only()
+                .select_from(devices_entities_cte)
+                .outerjoin(
+                    Events,
+                    devices_entities_cte.c.context_id_bin == Events.context_id_bin,
+                )
+            ).outerjoin(EventData, (Events.data_id == EventData.data_id))
+        ),
+        apply_states_meta_join(
+            apply_states_context_hints(
+                select_states_context_only()
+                .select_from(devices_entities_cte)
+                .outerjoin(
+                    States,
+                    devices_entities_cte.c.context_id_bin == States.context_id_bin,
+                )
+            )
         ),
     )
 
 
 def entities_devices_stmt(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    use_logbook_entries: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
+    if use_logbook_entries:
+        return lambda_stmt(
+            lambda: _apply_entities_devices_context_union(
+                select_events_without_states(start_day, end_day, event_types).where(
+                    _apply_event_entity_id_device_id_matchers(
+                        json_quoted_entity_ids, json_quoted_device_ids
+                    )
+                ),
+                logbook_entries_query_for_entity_ids(start_day, end_day, entity_ids),
+                start_day,
+                end_day,
+                event_types,
+                entity_ids,
+                json_quoted_entity_ids,
+                json_quoted_device_ids,
+            ).order_by(Events.time_fired_ts)
+        )
     stmt = lambda_stmt(
         lambda: _apply_entities_devices_context_union(
             select_events_without_states(start_day, end_day, event_types).where(
@@ -103,13 +137,14 @@ def entities_devices_stmt(
                     json_quoted_entity_ids, json_quoted_device_ids
                 )
             ),
+            states_query_for_entity_ids(start_day, end_day, entity_ids),
             start_day,
             end_day,
             event_types,
             entity_ids,
             json_quoted_entity_ids,
             json_quoted_device_ids,
-        ).order_by(Events.time_fired)
+        ).order_by(Events.time_fired_ts)
     )
     return stmt
 
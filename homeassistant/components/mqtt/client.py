@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable, Coroutine, Iterable
+from datetime import datetime
 from functools import lru_cache, partial, wraps
+from heapq import merge
 import inspect
 from itertools import groupby
 import logging
@@ -257,12 +260,109 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None] = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+class _TopicTrieNode:
+    """A level in the subscription topic trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        # (sequence, subscription) pairs in the order they were added
+        self.subscriptions: list[tuple[int, Subscription]] = []
+
+
+class TopicTrie:
+    """Index of subscriptions by topic filter.
+
+    Each level of a topic filter is a node in the trie so matching
+    a topic only visits the nodes for its levels and the `+` and `#`
+    wildcards, instead of testing every subscription.
+    """
+
+    __slots__ = ("_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+        self._sequence = 0
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            node = node.children.setdefault(level, _TopicTrieNode())
+        self._sequence += 1
+        node.subscriptions.append((self._sequence, subscription))
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription and prune the nodes left empty."""
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions = [
+            item for item in node.subscriptions if item[1] is not subscription
+        ]
+        for parent, level in reversed(path):
+            node = parent.children[level]
+            if node.children or node.subscriptions:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there are subscriptions for the exact topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic in subscription order."""
+        levels = topic.split("/")
+        # Wildcards at the first level must not match topics starting
+        # with $ as those are reserved for broker internal topics
+        wildcards_allowed = not topic.startswith("$")
+        matches: list[list[tuple[int, Subscription]]] = []
+        nodes = [self._root]
+        for level in levels:
+            next_nodes: list[_TopicTrieNode] = []
+            for node in nodes:
+                children = node.children
+                if child := children.get(level):
+                    next_nodes.append(child)
+                if wildcards_allowed:
+                    if child := children.get("+"):
+                        next_nodes.append(child)
+                    if (child := children.get("#")) and child.subscriptions:
+                        matches.append(child.subscriptions)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            wildcards_allowed = True
+        else:
+            for node in nodes:
+                if node.subscriptions:
+                    matches.append(node.subscriptions)
+                # A multi-level wildcard also matches its parent level
+                if (child := node.children.get("#")) and child.subscriptions:
+                    matches.append(child.subscriptions)
+
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return [subscription for _, subscription in matches[0]]
+        return [subscription for _, subscription in merge(*matches)]
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -337,6 +437,11 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_index = TopicTrie()
+        # Messages received by the paho thread waiting to be handled
+        # in the event loop
+        self._pending_messages: deque[MQTTMessage] = deque()
+        self._pending_messages_scheduled = False
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -473,10 +578,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
+        self._subscription_index.add(subscription)
         self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
@@ -490,6 +594,7 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
+            self._subscription_index.remove(subscription)
             self._matching_subscriptions.cache_clear()
 
             # Only unsubscribe if currently connected
@@ -513,7 +618,7 @@ class MQTT:
             assert mid
             return mid
 
-        if any(other.topic == topic for other in self.subscriptions):
+        if self._subscription_index.has_topic(topic):
             # Other subscriptions on topic remaining - don't unsubscribe.
             return
 
@@ -622,27 +727,58 @@ class MQTT:
     def _mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: MQTTMessage
     ) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are buffered so a flood of messages, like the retained
+        messages after a reconnect, only wakes up the event loop once
+        per batch instead of once per message.
+        """
+        self._pending_messages.append(msg)
+        if not self._pending_messages_scheduled:
+            self._pending_messages_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._mqtt_handle_pending_messages)
 
     @lru_cache(2048)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        return self._subscription_index.match(topic)
+
+    @callback
+    def _mqtt_handle_pending_messages(self) -> None:
+        """Handle the messages buffered by the paho thread."""
+        # Clear the flag before draining so a message appended while
+        # draining schedules a new batch instead of being left behind.
+        # Only the messages queued when the batch starts are handled
+        # to avoid starving the event loop during a flood.
+        self._pending_messages_scheduled = False
+        pending_messages = self._pending_messages
+        timestamp = dt_util.utcnow()
+        try:
+            for _ in range(len(pending_messages)):
+                msg = pending_messages.popleft()
+                # A failing subscriber must not drop the rest of the batch
+                try:
+                    self._mqtt_dispatch_message(msg, timestamp)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Exception while handling message on %s", msg.topic
+                    )
+        finally:
+            self._mqtt_data.state_write_requests.process_write_state_requests()
 
     @callback
     def _mqtt_handle_message(self, msg: MQTTMessage) -> None:
+        self._mqtt_dispatch_message(msg, dt_util.utcnow())
+        self._mqtt_data.state_write_requests.process_write_state_requests()
+
+    @callback
+    def _mqtt_dispatch_message(self, msg: MQTTMessage, timestamp: datetime) -> None:
+        """Run the jobs of the subscriptions matching a message."""
         _LOGGER.debug(
             "Received%s message on %s: %s",
             " retained" if msg.retain else "",
             msg.topic,
             msg.payload[0:8192],
         )
-        timestamp = dt_util.utcnow()
-
         subscriptions = self._matching_subscriptions(msg.topic)
 
         for subscription in subscriptions:
@@ -671,7 +807,6 @@ class MQTT:
                     timestamp,
                 ),
             )
-        self._mqtt_data.state_write_requests.process_write_state_requests()
 
     def _mqtt_on_callback(
         self,
@@ -762,13 +897,3 @@ def _raise_on_errors(result_codes: Iterable[int | None]) -> None:
 def _raise_on_error(result_code: int | None) -> None:
     """Raise error if error result."""
     _raise_on_errors((result_code,))
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
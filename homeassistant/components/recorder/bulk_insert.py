@@ -0,0 +1,169 @@
+"""Bulk insert helpers for state_changed events."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm.session import Session
+
+from .const import MAX_STATES_TO_INSERT, SupportedDialect
+from .db_schema import LogbookEntries, StateAttributes, States, StatesMeta
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PendingState:
+    """A state waiting to be written by the bulk insert.
+
+    The attributes and states_meta rows may not have been flushed
+    yet when the state is queued so we keep a reference to them
+    and resolve the ids when the states are inserted.
+    """
+
+    __slots__ = (
+        "dbstate",
+        "entity_id",
+        "state_attributes",
+        "states_meta",
+        "old_state_pending",
+        "logbook_entry",
+    )
+
+    def __init__(self, dbstate: States, entity_id: str) -> None:
+        """Init the pending state."""
+        self.dbstate = dbstate
+        self.entity_id = entity_id
+        self.state_attributes: StateAttributes | None = None
+        self.states_meta: StatesMeta | None = None
+        self.old_state_pending = False
+        self.logbook_entry: LogbookEntries | None = None
+
+
+def bulk_insert_states(
+    session: Session,
+    dialect_name: SupportedDialect | None,
+    pending_states: list[PendingState],
+) -> None:
+    """Insert the pending states without going through the ORM unit of work.
+
+    The pending attributes and states_meta rows must already be flushed.
+
+    States are grouped into generations where each generation contains
+    at most one state per entity. A state can only refer to an old state
+    from an earlier generation so each generation can be written with
+    multi-row inserts once the state_ids of the previous one are known.
+
+    The logbook entries of the states are inserted once every state_id
+    is known.
+    """
+    generations: list[list[PendingState]] = []
+    seen: dict[str, int] = {}
+    for pending in pending_states:
+        generation = seen.get(pending.entity_id, 0)
+        seen[pending.entity_id] = generation + 1
+        if generation == len(generations):
+            generations.append([])
+        generations[generation].append(pending)
+
+    last_state_ids: dict[str, int] = {}
+    state_ids: list[list[int]] = []
+    logbook_entries_rows: list[dict[str, Any]] = []
+    for generation_states in generations:
+        rows = [
+            _pending_state_to_row(pending, last_state_ids)
+            for pending in generation_states
+        ]
+        generation_state_ids = _insert_states_rows(session, dialect_name, rows)
+        for pending, state_id in zip(generation_states, generation_state_ids):
+            last_state_ids[pending.entity_id] = state_id
+            if pending.logbook_entry:
+                logbook_entries_rows.append(_logbook_entry_to_row(pending, state_id))
+        state_ids.append(generation_state_ids)
+
+    if logbook_entries_rows:
+        session.execute(insert(LogbookEntries), logbook_entries_rows)
+
+    # Only update the ORM objects once every row was inserted so
+    # a failed insert does not leave behind state_ids that were
+    # never written to the database
+    for generation_states, generation_state_ids in zip(generations, state_ids):
+        for pending, state_id in zip(generation_states, generation_state_ids):
+            pending.dbstate.state_id = state_id
+    _LOGGER.debug(
+        "Inserted %s states in %s generations", len(pending_states), len(generations)
+    )
+
+
+def _pending_state_to_row(
+    pending: PendingState, last_state_ids: dict[str, int]
+) -> dict[str, Any]:
+    """Convert a pending state to a row for a core insert."""
+    dbstate = pending.dbstate
+    if pending.state_attributes:
+        dbstate.attributes_id = pending.state_attributes.attributes_id
+    if pending.states_meta:
+        dbstate.metadata_id = pending.states_meta.metadata_id
+    if pending.old_state_pending:
+        dbstate.old_state_id = last_state_ids.get(pending.entity_id)
+    return {
+        "state": dbstate.state,
+        "last_updated_ts": dbstate.last_updated_ts,
+        "last_changed_ts": dbstate.last_changed_ts,
+        "old_state_id": dbstate.old_state_id,
+        "attributes_id": dbstate.attributes_id,
+        "metadata_id": dbstate.metadata_id,
+        "context_id_bin": dbstate.context_id_bin,
+        "context_user_id_bin": dbstate.context_user_id_bin,
+        "context_parent_id_bin": dbstate.context_parent_id_bin,
+        "origin_idx": dbstate.origin_idx,
+    }
+
+
+def _logbook_entry_to_row(pending: PendingState, state_id: int) -> dict[str, Any]:
+    """Convert the logbook entry of an inserted state to a row for a core insert."""
+    assert pending.logbook_entry is not None
+    return {
+        "state_id": state_id,
+        "metadata_id": pending.dbstate.metadata_id,
+        "last_updated_ts": pending.dbstate.last_updated_ts,
+        "icon": pending.logbook_entry.icon,
+        "has_unit": pending.logbook_entry.has_unit,
+    }
+
+
+def _insert_states_rows(
+    session: Session,
+    dialect_name: SupportedDialect | None,
+    rows: list[dict[str, Any]],
+) -> list[int]:
+    """Insert states rows and return the new state_ids in the same order."""
+    if dialect_name == SupportedDialect.SQLITE:
+        # SQLite assigns rowids sequentially and the recorder is the
+        # only writer so the state_ids are the range ending at the
+        # last inserted rowid. An executemany reuses the compiled
+        # statement which is much cheaper than compiling a multi-row
+        # VALUES statement for every chunk.
+        session.execute(insert(States), rows)
+        last_state_id: int = session.execute(select(func.last_insert_rowid())).scalar()
+        return list(range(last_state_id - len(rows) + 1, last_state_id + 1))
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        # The order RETURNING produces rows in is not guaranteed, but
+        # each generation only has one row per metadata_id
+        state_id_by_metadata_id: dict[int, int] = {}
+        for idx in range(0, len(rows), MAX_STATES_TO_INSERT):
+            state_id_by_metadata_id.update(
+                (metadata_id, state_id)
+                for state_id, metadata_id in session.execute(
+                    insert(States)
+                    .values(rows[idx : idx + MAX_STATES_TO_INSERT])
+                    .returning(States.state_id, States.metadata_id)
+                )
+            )
+        return [state_id_by_metadata_id[row["metadata_id"]] for row in rows]
+    # MySQL does not support RETURNING and lastrowid ranges are not
+    # safe when auto_increment_increment is set (ie Galera clusters)
+    return [
+        session.execute(insert(States).values(row)).inserted_primary_key[0]
+        for row in rows
+    ]
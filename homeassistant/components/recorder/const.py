@@ -26,6 +26,19 @@ MAX_QUEUE_BACKLOG = 40000
 # have upgraded their sqlite version
 MAX_ROWS_TO_PURGE = 998
 
+# The maximum number of state_ids we select in one
+# query, kept under the same sqlite limit
+MAX_STATE_IDS_PER_SELECT = 998
+
+# The maximum number of states we write in one multi-row insert
+# statement. Each row binds 10 parameters so this keeps the number
+# of parameters in a statement under the same limit
+MAX_STATES_TO_INSERT = 99
+
+# The number of rows we update in one transaction when
+# backfilling new columns during a schema migration
+MIGRATION_BATCH_SIZE = 10000
+
 DB_WORKER_PREFIX = "DbWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
@@ -42,6 +42,7 @@ from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 
 from . import migration, statistics
+from .bulk_insert import PendingState, bulk_insert_states
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -59,13 +60,17 @@ from .db_schema import (
     Base,
     EventData,
     Events,
+    EventTypes,
+    LogbookEntries,
     StateAttributes,
     States,
+    StatesMeta,
     Statistics,
     StatisticsRuns,
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .latest_states import LatestStates
 from .models import (
     StatisticData,
     StatisticMetaData,
@@ -73,7 +78,12 @@ from .models import (
     process_timestamp,
 )
 from .pool import POOL_SIZE, MutexPool, RecorderPool
-from .queries import find_shared_attributes_id, find_shared_data_id
+from .queries import (
+    find_event_type_id,
+    find_shared_attributes_id,
+    find_shared_data_id,
+    find_states_metadata_id,
+)
 from .run_history import RunHistory
 from .tasks import (
     AdjustStatisticsTask,
@@ -124,6 +134,14 @@ EXPIRE_AFTER_COMMITS = 120
 STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
 EVENT_DATA_ID_CACHE_SIZE = 2048
 
+# The number of entity_id and event_type ids to cache in memory
+#
+# Every state_changed event needs a metadata_id and
+# every event needs an event_type_id so these are sized
+# to hold the working set of a large installation
+STATES_META_ID_CACHE_SIZE = 8192
+EVENT_TYPE_ID_CACHE_SIZE = 2048
+
 SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
@@ -184,6 +202,7 @@ class Recorder(threading.Thread):
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
         self.run_history = RunHistory()
+        self.latest_states = LatestStates()
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
@@ -193,9 +212,13 @@ class Recorder(threading.Thread):
         self._old_states: dict[str, States] = {}
         self._state_attributes_ids: LRU = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
         self._event_data_ids: LRU = LRU(EVENT_DATA_ID_CACHE_SIZE)
+        self._states_meta_ids: LRU = LRU(STATES_META_ID_CACHE_SIZE)
+        self._event_type_ids: LRU = LRU(EVENT_TYPE_ID_CACHE_SIZE)
         self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_event_data: dict[str, EventData] = {}
-        self._pending_expunge: list[States] = []
+        self._pending_states_meta: dict[str, StatesMeta] = {}
+        self._pending_event_types: dict[str, EventTypes] = {}
+        self._pending_states: list[PendingState] = []
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
@@ -825,39 +848,74 @@ class Recorder(threading.Thread):
                 return cast(int, data_id[0])
         return None
 
+    def _find_event_type_id_in_db(self, event_type: str) -> int | None:
+        """Find an event_type_id in the db from the event_type."""
+        assert self.event_session is not None
+        with self.event_session.no_autoflush:
+            if event_type_id := self.event_session.execute(
+                find_event_type_id(event_type)
+            ).first():
+                return cast(int, event_type_id[0])
+        return None
+
+    def _find_states_metadata_id_in_db(self, entity_id: str) -> int | None:
+        """Find a states metadata_id in the db from the entity_id."""
+        assert self.event_session is not None
+        with self.event_session.no_autoflush:
+            if metadata_id := self.event_session.execute(
+                find_states_metadata_id(entity_id)
+            ).first():
+                return cast(int, metadata_id[0])
+        return None
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         assert self.event_session is not None
         dbevent = Events.from_event(event)
-        if not event.data:
-            self.event_session.add(dbevent)
-            return
-
-        try:
-            shared_data_bytes = EventData.shared_data_bytes_from_event(event)
-        except JSON_ENCODE_EXCEPTIONS as ex:
-            _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
-            return
+        if event.data:
+            try:
+                shared_data_bytes = EventData.shared_data_bytes_from_event(event)
+            except JSON_ENCODE_EXCEPTIONS as ex:
+                _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+                return
 
-        shared_data = shared_data_bytes.decode("utf-8")
-        # Matching attributes found in the pending commit
-        if pending_event_data := self._pending_event_data.get(shared_data):
-            dbevent.event_data_rel = pending_event_data
-        # Matching attributes id found in the cache
-        elif data_id := self._event_data_ids.get(shared_data):
-            dbevent.data_id = data_id
-        else:
-            data_hash = EventData.hash_shared_data_bytes(shared_data_bytes)
-            # Matching attributes found in the database
-            if data_id := self._find_shared_data_in_db(data_hash, shared_data):
-                self._event_data_ids[shared_data] = dbevent.data_id = data_id
-            # No matching attributes found, save them in the DB
+            shared_data = shared_data_bytes.decode("utf-8")
+            # Matching attributes found in the pending commit
+            if pending_event_data := self._pending_event_data.get(shared_data):
+                dbevent.event_data_rel = pending_event_data
+            # Matching attributes id found in the cache
+            elif data_id := self._event_data_ids.get(shared_data):
+                dbevent.data_id = data_id
             else:
-                dbevent_data = EventData(shared_data=shared_data, hash=data_hash)
-                dbevent.event_data_rel = self._pending_event_data[
-                    shared_data
-                ] = dbevent_data
-                self.event_session.add(dbevent_data)
+                data_hash = EventData.hash_shared_data_bytes(shared_data_bytes)
+                # Matching attributes found in the database
+                if data_id := self._find_shared_data_in_db(data_hash, shared_data):
+                    self._event_data_ids[shared_data] = dbevent.data_id = data_id
+                # No matching attributes found, save them in the DB
+                else:
+                    dbevent_data = EventData(shared_data=shared_data, hash=data_hash)
+                    dbevent.event_data_rel = self._pending_event_data[
+                        shared_data
+                    ] = dbevent_data
+                    self.event_session.add(dbevent_data)
+
+        event_type = event.event_type
+        # Matching event_type found in the pending commit
+        if pending_event_type := self._pending_event_types.get(event_type):
+            dbevent.event_type_rel = pending_event_type
+        # Matching event_type_id found in the cache
+        elif event_type_id := self._event_type_ids.get(event_type):
+            dbevent.event_type_id = event_type_id
+        # Matching event_type_id found in the database
+        elif event_type_id := self._find_event_type_id_in_db(event_type):
+            self._event_type_ids[event_type] = dbevent.event_type_id = event_type_id
+        # No matching event_type found, save it in the DB
+        else:
+            dbevent_type = EventTypes(event_type=event_type)
+            dbevent.event_type_rel = self._pending_event_types[
+                event_type
+            ] = dbevent_type
+            self.event_session.add(dbevent_type)
 
         self.event_session.add(dbevent)
 
@@ -877,11 +935,12 @@ class Recorder(threading.Thread):
             )
             return
 
+        entity_id: str = event.data["entity_id"]
+        pending_state = PendingState(dbstate, entity_id)
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
         # Matching attributes found in the pending commit
         if pending_attributes := self._pending_state_attributes.get(shared_attrs):
-            dbstate.state_attributes = pending_attributes
+            pending_state.state_attributes = pending_attributes
         # Matching attributes id found in the cache
         elif attributes_id := self._state_attributes_ids.get(shared_attrs):
             dbstate.attributes_id = attributes_id
@@ -896,21 +955,47 @@ class Recorder(threading.Thread):
                 dbstate_attributes = StateAttributes(
                     shared_attrs=shared_attrs, hash=attr_hash
                 )
-                dbstate.state_attributes = dbstate_attributes
+                pending_state.state_attributes = dbstate_attributes
                 self._pending_state_attributes[shared_attrs] = dbstate_attributes
                 self.event_session.add(dbstate_attributes)
 
-        if old_state := self._old_states.pop(dbstate.entity_id, None):
+        # Matching entity_id found in the pending commit
+        if pending_states_meta := self._pending_states_meta.get(entity_id):
+            pending_state.states_meta = pending_states_meta
+        # Matching metadata_id found in the cache
+        elif metadata_id := self._states_meta_ids.get(entity_id):
+            dbstate.metadata_id = metadata_id
+        # Matching metadata_id found in the database
+        elif metadata_id := self._find_states_metadata_id_in_db(entity_id):
+            self._states_meta_ids[entity_id] = dbstate.metadata_id = metadata_id
+        # No matching entity_id found, save it in the DB
+        else:
+            dbstates_meta = StatesMeta(entity_id=entity_id)
+            pending_state.states_meta = self._pending_states_meta[
+                entity_id
+            ] = dbstates_meta
+            self.event_session.add(dbstates_meta)
+
+        if old_state := self._old_states.pop(entity_id, None):
             if old_state.state_id:
                 dbstate.old_state_id = old_state.state_id
             else:
-                dbstate.old_state = old_state
-        if event.data.get("new_state"):
-            self._old_states[dbstate.entity_id] = dbstate
-            self._pending_expunge.append(dbstate)
+                # The old state is in the same commit and will be
+                # linked once its state_id is known at insert time
+                pending_state.old_state_pending = True
+        if new_state := event.data.get("new_state"):
+            self._old_states[entity_id] = dbstate
+            if (
+                old_state
+                and old_state.state != dbstate.state
+                and dbstate.last_changed_ts is None
+            ):
+                pending_state.logbook_entry = LogbookEntries.from_state(new_state)
         else:
             dbstate.state = None
-        self.event_session.add(dbstate)
+        # States are never added to the session, they are written
+        # with bulk inserts when the event session is committed
+        self._pending_states.append(pending_state)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -924,7 +1009,12 @@ class Recorder(threading.Thread):
 
     def _event_session_has_pending_writes(self) -> bool:
         return bool(
-            self.event_session and (self.event_session.new or self.event_session.dirty)
+            self.event_session
+            and (
+                self._pending_states
+                or self.event_session.new
+                or self.event_session.dirty
+            )
         )
 
     def _commit_event_session_or_retry(self) -> None:
@@ -953,14 +1043,16 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         self._commits_without_expire += 1
 
+        if self._pending_states:
+            # Flush first so the pending attributes and states_meta
+            # have ids before the states that refer to them are inserted
+            self.event_session.flush()
+            bulk_insert_states(
+                self.event_session, self.dialect_name, self._pending_states
+            )
         self.event_session.commit()
-        if self._pending_expunge:
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
+        self.latest_states.update(self._pending_states)
+        self._pending_states = []
 
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -974,6 +1066,12 @@ class Recorder(threading.Thread):
         for event_data in self._pending_event_data.values():
             self._event_data_ids[event_data.shared_data] = event_data.data_id
         self._pending_event_data = {}
+        for states_meta in self._pending_states_meta.values():
+            self._states_meta_ids[states_meta.entity_id] = states_meta.metadata_id
+        self._pending_states_meta = {}
+        for event_type in self._pending_event_types.values():
+            self._event_type_ids[event_type.event_type] = event_type.event_type_id
+        self._pending_event_types = {}
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -994,10 +1092,15 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self._old_states = {}
+        self._pending_states = []
         self._state_attributes_ids = {}
         self._event_data_ids = {}
+        self._states_meta_ids = {}
+        self._event_type_ids = {}
         self._pending_state_attributes = {}
         self._pending_event_data = {}
+        self._pending_states_meta = {}
+        self._pending_event_types = {}
 
         if not self.event_session:
             return
@@ -1174,6 +1277,7 @@ class Recorder(threading.Thread):
         with session_scope(session=self.get_session()) as session:
             end_incomplete_runs(session, self.run_history.recording_start)
             self.run_history.start(session)
+        self.latest_states.start(self.run_history.recording_start)
 
         self._open_event_session()
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any, TypeVar, cast
 
 import ciso8601
@@ -19,6 +20,7 @@ from sqlalchemy import (
     Identity,
     Index,
     Integer,
+    LargeBinary,
     SmallInteger,
     String,
     Text,
@@ -31,6 +33,8 @@ from sqlalchemy.orm import aliased, declarative_base, relationship
 from sqlalchemy.orm.session import Session
 
 from homeassistant.const import (
+    ATTR_ICON,
+    ATTR_UNIT_OF_MEASUREMENT,
     MAX_LENGTH_EVENT_CONTEXT_ID,
     MAX_LENGTH_EVENT_EVENT_TYPE,
     MAX_LENGTH_EVENT_ORIGIN,
@@ -47,13 +51,22 @@ from homeassistant.helpers.json import (
 import homeassistant.util.dt as dt_util
 
 from .const import ALL_DOMAIN_EXCLUDE_ATTRS
-from .models import StatisticData, StatisticMetaData, process_timestamp
+from .models import (
+    StatisticData,
+    StatisticMetaData,
+    bytes_to_ulid_or_none,
+    bytes_to_uuid_hex_or_none,
+    context_id_to_bytes,
+    process_datetime_to_timestamp,
+    process_timestamp,
+    uuid_hex_to_bytes_or_none,
+)
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 30
+SCHEMA_VERSION = 35
 
 _StatisticsBaseSelfT = TypeVar("_StatisticsBaseSelfT", bound="StatisticsBase")
 
@@ -61,26 +74,36 @@ _LOGGER = logging.getLogger(__name__)
 
 TABLE_EVENTS = "events"
 TABLE_EVENT_DATA = "event_data"
+TABLE_EVENT_TYPES = "event_types"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
+TABLE_STATES_META = "states_meta"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
+TABLE_LOGBOOK_ENTRIES = "logbook_entries"
 
 ALL_TABLES = [
     TABLE_STATES,
     TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES_META,
     TABLE_EVENTS,
     TABLE_EVENT_DATA,
+    TABLE_EVENT_TYPES,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
+    TABLE_LOGBOOK_ENTRIES,
 ]
 
 TABLES_TO_CHECK = [
@@ -90,10 +113,17 @@ TABLES_TO_CHECK = [
     TABLE_SCHEMA_CHANGES,
 ]
 
-LAST_UPDATED_INDEX = "ix_states_last_updated"
-ENTITY_ID_LAST_UPDATED_INDEX = "ix_states_entity_id_last_updated"
-EVENTS_CONTEXT_ID_INDEX = "ix_events_context_id"
-STATES_CONTEXT_ID_INDEX = "ix_states_context_id"
+LAST_UPDATED_INDEX = "ix_states_last_updated_ts"
+METADATA_ID_LAST_UPDATED_INDEX = "ix_states_metadata_id_last_updated_ts"
+EVENT_TYPE_ID_TIME_FIRED_INDEX = "ix_events_event_type_id_time_fired_ts"
+EVENTS_CONTEXT_ID_BIN_INDEX = "ix_events_context_id_bin"
+STATES_CONTEXT_ID_BIN_INDEX = "ix_states_context_id_bin"
+LOGBOOK_ENTRIES_LAST_UPDATED_INDEX = "ix_logbook_entries_last_updated_ts"
+LOGBOOK_ENTRIES_METADATA_ID_LAST_UPDATED_INDEX = (
+    "ix_logbook_entries_metadata_id_last_updated_ts"
+)
+MAX_LENGTH_LOGBOOK_ENTRY_ICON = 255
+CONTEXT_ID_BIN_MAX_LENGTH = 16
 
 
 class FAST_PYSQLITE_DATETIME(sqlite.DATETIME):  # type: ignore[misc]
@@ -121,6 +151,27 @@ DOUBLE_TYPE = (
     .with_variant(oracle.DOUBLE_PRECISION(), "oracle")
     .with_variant(postgresql.DOUBLE_PRECISION(), "postgresql")
 )
+TIMESTAMP_TYPE = DOUBLE_TYPE
+
+
+class NativeLargeBinary(LargeBinary):  # type: ignore[misc]
+    """A faster version of LargeBinary for engines that support python bytes natively."""
+
+    def bind_processor(self, dialect):  # type: ignore[no-untyped-def]
+        """No conversion needed for engines that support native bytes."""
+        return None
+
+    def result_processor(self, dialect, coltype):  # type: ignore[no-untyped-def]
+        """No conversion needed for engines that support native bytes."""
+        return None
+
+
+# Context ids are stored as 16 bytes instead of 26 character ulid strings
+CONTEXT_BINARY_TYPE = (
+    LargeBinary(CONTEXT_ID_BIN_MAX_LENGTH)
+    .with_variant(NativeLargeBinary(CONTEXT_ID_BIN_MAX_LENGTH), "mysql")
+    .with_variant(NativeLargeBinary(CONTEXT_ID_BIN_MAX_LENGTH), "sqlite")
+)
 
 
 class JSONLiteral(JSON):  # type: ignore[misc]
@@ -146,59 +197,99 @@ class Events(Base):  # type: ignore[misc,valid-type]
     __table_args__ = (
         # Used for fetching events at a specific time
         # see logbook
-        Index("ix_events_event_type_time_fired", "event_type", "time_fired"),
+        Index(EVENT_TYPE_ID_TIME_FIRED_INDEX, "event_type_id", "time_fired_ts"),
+        Index(
+            EVENTS_CONTEXT_ID_BIN_INDEX,
+            "context_id_bin",
+            mysql_length=CONTEXT_ID_BIN_MAX_LENGTH,
+        ),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
     __tablename__ = TABLE_EVENTS
     event_id = Column(Integer, Identity(), primary_key=True)
-    event_type = Column(String(MAX_LENGTH_EVENT_EVENT_TYPE))
+    event_type = Column(String(MAX_LENGTH_EVENT_EVENT_TYPE))  # no longer used
     event_data = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
     origin = Column(String(MAX_LENGTH_EVENT_ORIGIN))  # no longer used for new rows
     origin_idx = Column(SmallInteger)
-    time_fired = Column(DATETIME_TYPE, index=True)
-    context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
-    context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
-    context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
+    time_fired = Column(DATETIME_TYPE)  # no longer used for new rows
+    time_fired_ts = Column(TIMESTAMP_TYPE, index=True)
+    context_id = Column(  # no longer used for new rows
+        String(MAX_LENGTH_EVENT_CONTEXT_ID)
+    )
+    context_user_id = Column(  # no longer used for new rows
+        String(MAX_LENGTH_EVENT_CONTEXT_ID)
+    )
+    context_parent_id = Column(  # no longer used for new rows
+        String(MAX_LENGTH_EVENT_CONTEXT_ID)
+    )
+    context_id_bin = Column(CONTEXT_BINARY_TYPE)
+    context_user_id_bin = Column(CONTEXT_BINARY_TYPE)
+    context_parent_id_bin = Column(CONTEXT_BINARY_TYPE)
     data_id = Column(Integer, ForeignKey("event_data.data_id"), index=True)
+    event_type_id = Column(Integer, ForeignKey("event_types.event_type_id"))
     event_data_rel = relationship("EventData")
+    event_type_rel = relationship("EventTypes")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
         return (
             f"<recorder.Events("
-            f"id={self.event_id}, type='{self.event_type}', "
-            f"origin_idx='{self.origin_idx}', time_fired='{self.time_fired}'"
+            f"id={self.event_id}, type_id={self.event_type_id}, "
+            f"origin_idx='{self.origin_idx}', time_fired='{self.time_fired_isotime}'"
             f", data_id={self.data_id})>"
         )
 
+    @property
+    def time_fired_isotime(self) -> str | None:
+        """Return time_fired as an isotime string."""
+        date_time: datetime | None
+        if self.time_fired_ts is not None:
+            date_time = dt_util.utc_from_timestamp(self.time_fired_ts)
+        else:
+            date_time = process_timestamp(self.time_fired)
+        if date_time is None:
+            return None
+        return date_time.isoformat(sep=" ", timespec="seconds")
+
     @staticmethod
     def from_event(event: Event) -> Events:
         """Create an event database object from a native event."""
         return Events(
-            event_type=event.event_type,
+            event_type=None,
             event_data=None,
             origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-            time_fired=event.time_fired,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
+            time_fired=None,
+            time_fired_ts=dt_util.utc_to_timestamp(event.time_fired),
+            context_id=None,
+            context_id_bin=context_id_to_bytes(event.context.id),
+            context_user_id=None,
+            context_user_id_bin=uuid_hex_to_bytes_or_none(event.context.user_id),
+            context_parent_id=None,
+            context_parent_id_bin=context_id_to_bytes(event.context.parent_id),
         )
 
     def to_native(self, validate_entity_id: bool = True) -> Event | None:
         """Convert to a native HA Event."""
         context = Context(
-            id=self.context_id,
-            user_id=self.context_user_id,
-            parent_id=self.context_parent_id,
+            id=bytes_to_ulid_or_none(self.context_id_bin) or self.context_id,
+            user_id=bytes_to_uuid_hex_or_none(self.context_user_id_bin)
+            or self.context_user_id,
+            parent_id=bytes_to_ulid_or_none(self.context_parent_id_bin)
+            or self.context_parent_id,
         )
+        event_type = self.event_type
+        if event_type is None and self.event_type_rel is not None:
+            event_type = self.event_type_rel.event_type
         try:
             return Event(
-                self.event_type,
+                event_type,
                 json_loads(self.event_data) if self.event_data else {},
                 EventOrigin(self.origin)
                 if self.origin
                 else EVENT_ORIGIN_ORDER[self.origin_idx],
-                process_timestamp(self.time_fired),
+                dt_util.utc_from_timestamp(self.time_fired_ts)
+                if self.time_fired_ts is not None
+                else process_timestamp(self.time_fired),
                 context=context,
             )
         except JSON_DECODE_EXCEPTIONS:
@@ -255,18 +346,42 @@ class EventData(Base):  # type: ignore[misc,valid-type]
             return {}
 
 
+class EventTypes(Base):  # type: ignore[misc,valid-type]
+    """Event type history."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_EVENT_TYPES
+    event_type_id = Column(Integer, Identity(), primary_key=True)
+    event_type = Column(String(MAX_LENGTH_EVENT_EVENT_TYPE), index=True, unique=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.EventTypes("
+            f"id={self.event_type_id}, event_type='{self.event_type}'"
+            f")>"
+        )
+
+
 class States(Base):  # type: ignore[misc,valid-type]
     """State change history."""
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
         # (get_states in history.py)
-        Index(ENTITY_ID_LAST_UPDATED_INDEX, "entity_id", "last_updated"),
+        Index(METADATA_ID_LAST_UPDATED_INDEX, "metadata_id", "last_updated_ts"),
+        Index(
+            STATES_CONTEXT_ID_BIN_INDEX,
+            "context_id_bin",
+            mysql_length=CONTEXT_ID_BIN_MAX_LENGTH,
+        ),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
     __tablename__ = TABLE_STATES
     state_id = Column(Integer, Identity(), primary_key=True)
-    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID))
+    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID))  # no longer used
     state = Column(String(MAX_LENGTH_STATE_STATE))
     attributes = Column(
         Text().with_variant(mysql.LONGTEXT, "mysql")
@@ -274,66 +389,95 @@ class States(Base):  # type: ignore[misc,valid-type]
     event_id = Column(  # no longer used for new rows
         Integer, ForeignKey("events.event_id", ondelete="CASCADE"), index=True
     )
-    last_changed = Column(DATETIME_TYPE)
-    last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
+    last_changed = Column(DATETIME_TYPE)  # no longer used for new rows
+    last_changed_ts = Column(TIMESTAMP_TYPE)
+    last_updated = Column(DATETIME_TYPE)  # no longer used for new rows
+    last_updated_ts = Column(TIMESTAMP_TYPE, default=time.time, index=True)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
     attributes_id = Column(
         Integer, ForeignKey("state_attributes.attributes_id"), index=True
     )
-    context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
-    context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
-    context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
+    context_id = Column(  # no longer used for new rows
+        String(MAX_LENGTH_EVENT_CONTEXT_ID)
+    )
+    context_user_id = Column(  # no longer used for new rows
+        String(MAX_LENGTH_EVENT_CONTEXT_ID)
+    )
+    context_parent_id = Column(  # no longer used for new rows
+        String(MAX_LENGTH_EVENT_CONTEXT_ID)
+    )
+    context_id_bin = Column(CONTEXT_BINARY_TYPE)
+    context_user_id_bin = Column(CONTEXT_BINARY_TYPE)
+    context_parent_id_bin = Column(CONTEXT_BINARY_TYPE)
     origin_idx = Column(SmallInteger)  # 0 is local, 1 is remote
+    metadata_id = Column(Integer, ForeignKey("states_meta.metadata_id"))
     old_state = relationship("States", remote_side=[state_id])
     state_attributes = relationship("StateAttributes")
+    states_meta_rel = relationship("StatesMeta")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
         return (
             f"<recorder.States("
-            f"id={self.state_id}, entity_id='{self.entity_id}', "
+            f"id={self.state_id}, metadata_id={self.metadata_id}, "
             f"state='{self.state}', event_id='{self.event_id}', "
-            f"last_updated='{self.last_updated.isoformat(sep=' ', timespec='seconds')}', "
+            f"last_updated='{self.last_updated_isotime}', "
             f"old_state_id={self.old_state_id}, attributes_id={self.attributes_id}"
             f")>"
         )
 
+    @property
+    def last_updated_isotime(self) -> str | None:
+        """Return last_updated as an isotime string."""
+        date_time: datetime | None
+        if self.last_updated_ts is not None:
+            date_time = dt_util.utc_from_timestamp(self.last_updated_ts)
+        else:
+            date_time = process_timestamp(self.last_updated)
+        if date_time is None:
+            return None
+        return date_time.isoformat(sep=" ", timespec="seconds")
+
     @staticmethod
     def from_event(event: Event) -> States:
         """Create object from a state_changed event."""
-        entity_id = event.data["entity_id"]
         state: State | None = event.data.get("new_state")
         dbstate = States(
-            entity_id=entity_id,
+            entity_id=None,
             attributes=None,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
+            context_id=None,
+            context_id_bin=context_id_to_bytes(event.context.id),
+            context_user_id=None,
+            context_user_id_bin=uuid_hex_to_bytes_or_none(event.context.user_id),
+            context_parent_id=None,
+            context_parent_id_bin=context_id_to_bytes(event.context.parent_id),
             origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
         )
 
         # None state means the state was removed from the state machine
         if state is None:
             dbstate.state = ""
-            dbstate.last_updated = event.time_fired
-            dbstate.last_changed = None
+            dbstate.last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
+            dbstate.last_changed_ts = None
             return dbstate
 
         dbstate.state = state.state
-        dbstate.last_updated = state.last_updated
+        dbstate.last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
         if state.last_updated == state.last_changed:
-            dbstate.last_changed = None
+            dbstate.last_changed_ts = None
         else:
-            dbstate.last_changed = state.last_changed
+            dbstate.last_changed_ts = dt_util.utc_to_timestamp(state.last_changed)
 
         return dbstate
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
         context = Context(
-            id=self.context_id,
-            user_id=self.context_user_id,
-            parent_id=self.context_parent_id,
+            id=bytes_to_ulid_or_none(self.context_id_bin) or self.context_id,
+            user_id=bytes_to_uuid_hex_or_none(self.context_user_id_bin)
+            or self.context_user_id,
+            parent_id=bytes_to_ulid_or_none(self.context_parent_id_bin)
+            or self.context_parent_id,
         )
         try:
             attrs = json_loads(self.attributes) if self.attributes else {}
@@ -341,13 +485,27 @@ class States(Base):  # type: ignore[misc,valid-type]
             # When json_loads fails
             _LOGGER.exception("Error converting row to state: %s", self)
             return None
-        if self.last_changed is None or self.last_changed == self.last_updated:
-            last_changed = last_updated = process_timestamp(self.last_updated)
+        if self.last_updated_ts is None:
+            # Rows that have not been migrated to the timestamp columns yet
+            if self.last_changed is None or self.last_changed == self.last_updated:
+                last_changed = last_updated = process_timestamp(self.last_updated)
+            else:
+                last_updated = process_timestamp(self.last_updated)
+                last_changed = process_timestamp(self.last_changed)
+        elif (
+            self.last_changed_ts is None or self.last_changed_ts == self.last_updated_ts
+        ):
+            last_changed = last_updated = dt_util.utc_from_timestamp(
+                self.last_updated_ts
+            )
         else:
-            last_updated = process_timestamp(self.last_updated)
-            last_changed = process_timestamp(self.last_changed)
+            last_updated = dt_util.utc_from_timestamp(self.last_updated_ts)
+            last_changed = dt_util.utc_from_timestamp(self.last_changed_ts)
+        entity_id = self.entity_id
+        if entity_id is None and self.states_meta_rel is not None:
+            entity_id = self.states_meta_rel.entity_id
         return State(
-            self.entity_id,
+            entity_id,
             self.state,
             # Join the state_attributes table on attributes_id to get the attributes
             # for newer states
@@ -421,6 +579,72 @@ class StateAttributes(Base):  # type: ignore[misc,valid-type]
             return {}
 
 
+class StatesMeta(Base):  # type: ignore[misc,valid-type]
+    """Metadata for states."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATES_META
+    metadata_id = Column(Integer, Identity(), primary_key=True)
+    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID), index=True, unique=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatesMeta("
+            f"id={self.metadata_id}, entity_id='{self.entity_id}'"
+            ")>"
+        )
+
+
+class LogbookEntries(Base):  # type: ignore[misc,valid-type]
+    """State changes shown in the logbook.
+
+    Written with the state when the state value changed so the logbook
+    can find the state changes of a period without comparing every state
+    with its old state and decoding its attributes.
+    """
+
+    __table_args__ = (
+        Index(
+            LOGBOOK_ENTRIES_METADATA_ID_LAST_UPDATED_INDEX,
+            "metadata_id",
+            "last_updated_ts",
+        ),
+    )
+    __tablename__ = TABLE_LOGBOOK_ENTRIES
+    state_id = Column(Integer, primary_key=True, autoincrement=False)
+    metadata_id = Column(Integer)
+    last_updated_ts = Column(TIMESTAMP_TYPE, index=True)
+    icon = Column(String(MAX_LENGTH_LOGBOOK_ENTRY_ICON))
+    has_unit = Column(Boolean)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.LogbookEntries("
+            f"state_id={self.state_id}, metadata_id={self.metadata_id}, "
+            f"last_updated_ts={self.last_updated_ts}, icon='{self.icon}', "
+            f"has_unit={self.has_unit}"
+            ")>"
+        )
+
+    @staticmethod
+    def from_state(state: State) -> LogbookEntries:
+        """Create object from a state.
+
+        The state_id, metadata_id and last_updated_ts are set when the
+        state is inserted.
+        """
+        icon = state.attributes.get(ATTR_ICON)
+        if not isinstance(icon, str) or len(icon) > MAX_LENGTH_LOGBOOK_ENTRY_ICON:
+            icon = None
+        return LogbookEntries(
+            icon=icon, has_unit=ATTR_UNIT_OF_MEASUREMENT in state.attributes
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
@@ -484,6 +708,48 @@ class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore[misc,valid-type
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsDaily(Base, StatisticsBase):  # type: ignore[misc,valid-type]
+    """Long term statistics rolled up per local day.
+
+    The start is the start of the first hour of the day, the
+    length of the day depends on the time zone.
+    """
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start",
+            "metadata_id",
+            "start",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsBase):  # type: ignore[misc,valid-type]
+    """Long term statistics rolled up per local month.
+
+    The start is the start of the first hour of the month, the
+    length of the month depends on the month and the time zone.
+    """
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start",
+            "metadata_id",
+            "start",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticsMeta(Base):  # type: ignore[misc,valid-type]
     """Statistics meta data."""
 
@@ -539,14 +805,20 @@ class RecorderRuns(Base):  # type: ignore[misc,valid-type]
 
         assert session is not None, "RecorderRuns need to be persisted"
 
-        query = session.query(distinct(States.entity_id)).filter(
-            States.last_updated >= self.start
+        query = (
+            session.query(distinct(StatesMeta.entity_id))
+            .join(States, States.metadata_id == StatesMeta.metadata_id)
+            .filter(States.last_updated_ts >= process_datetime_to_timestamp(self.start))
         )
 
         if point_in_time is not None:
-            query = query.filter(States.last_updated < point_in_time)
+            query = query.filter(
+                States.last_updated_ts < process_datetime_to_timestamp(point_in_time)
+            )
         elif self.end is not None:
-            query = query.filter(States.last_updated < self.end)
+            query = query.filter(
+                States.last_updated_ts < process_datetime_to_timestamp(self.end)
+            )
 
         return [row[0] for row in query]
 
@@ -13,6 +13,7 @@ from sqlalchemy import Column, Text, and_, func, lambda_stmt, or_, select
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.query import Query
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ClauseList
 from sqlalchemy.sql.expression import literal
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Subquery
@@ -25,15 +26,19 @@ from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
 from .. import recorder
-from .db_schema import RecorderRuns, StateAttributes, States
+from .const import MAX_STATE_IDS_PER_SELECT
+from .db_schema import RecorderRuns, StateAttributes, States, StatesMeta
 from .filters import Filters
 from .models import (
     LazyState,
+    LazyStatePreSchema32,
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
     row_to_compressed_state,
+    row_to_compressed_state_pre_schema_32,
 )
+from .queries import find_states_metadata_ids
 from .util import execute_stmt_lambda_element, session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,25 +64,18 @@ NEED_ATTRIBUTE_DOMAINS = {
     "water_heater",
 }
 
-BASE_STATES = [
-    States.entity_id,
-    States.state,
-    States.last_changed,
-    States.last_updated,
-]
-BASE_STATES_NO_LAST_CHANGED = [
-    States.entity_id,
-    States.state,
-    literal(value=None, type_=Text).label("last_changed"),
-    States.last_updated,
-]
+# The first schema version where the entity_id
+# is stored in the states_meta table
+STATES_META_SCHEMA_VERSION = 31
+# The first schema version where last_updated and
+# last_changed are stored as float timestamps
+TIMESTAMP_SCHEMA_VERSION = 32
+
+NULL_LAST_CHANGED = literal(value=None, type_=Text).label("last_changed")
+NULL_LAST_CHANGED_TS = literal(value=None, type_=Text).label("last_changed_ts")
+
 QUERY_STATE_NO_ATTR = [
-    *BASE_STATES,
-    literal(value=None, type_=Text).label("attributes"),
-    literal(value=None, type_=Text).label("shared_attrs"),
-]
-QUERY_STATE_NO_ATTR_NO_LAST_CHANGED = [
-    *BASE_STATES_NO_LAST_CHANGED,
+    States.state,
     literal(value=None, type_=Text).label("attributes"),
     literal(value=None, type_=Text).label("shared_attrs"),
 ]
@@ -85,23 +83,12 @@ QUERY_STATE_NO_ATTR_NO_LAST_CHANGED = [
 # and the migration_in_progress check
 # once schema 26 is created
 QUERY_STATES_PRE_SCHEMA_25 = [
-    *BASE_STATES,
-    States.attributes,
-    literal(value=None, type_=Text).label("shared_attrs"),
-]
-QUERY_STATES_PRE_SCHEMA_25_NO_LAST_CHANGED = [
-    *BASE_STATES_NO_LAST_CHANGED,
+    States.state,
     States.attributes,
     literal(value=None, type_=Text).label("shared_attrs"),
 ]
 QUERY_STATES = [
-    *BASE_STATES,
-    # Remove States.attributes once all attributes are in StateAttributes.shared_attrs
-    States.attributes,
-    StateAttributes.shared_attrs,
-]
-QUERY_STATES_NO_LAST_CHANGED = [
-    *BASE_STATES_NO_LAST_CHANGED,
+    States.state,
     # Remove States.attributes once all attributes are in StateAttributes.shared_attrs
     States.attributes,
     StateAttributes.shared_attrs,
@@ -112,11 +99,74 @@ def _schema_version(hass: HomeAssistant) -> int:
     return recorder.get_instance(hass).schema_version
 
 
+def _uses_states_meta(schema_version: int) -> bool:
+    """Return if the entity_id is stored in the states_meta table."""
+    return schema_version >= STATES_META_SCHEMA_VERSION
+
+
+def _uses_timestamps(schema_version: int) -> bool:
+    """Return if last_updated and last_changed are stored as float timestamps."""
+    return schema_version >= TIMESTAMP_SCHEMA_VERSION
+
+
+def _entity_id_column(schema_version: int) -> Column:
+    """Return the column that holds the entity_id."""
+    if _uses_states_meta(schema_version):
+        return StatesMeta.entity_id
+    return States.entity_id
+
+
+def _state_time_columns(schema_version: int) -> tuple[Column, Column]:
+    """Return the last_updated and last_changed columns.
+
+    The datetime columns are used until the migration
+    to the timestamp columns has finished.
+    """
+    if _uses_timestamps(schema_version):
+        return States.last_updated_ts, States.last_changed_ts
+    return States.last_updated, States.last_changed
+
+
+def _state_time(schema_version: int, value: datetime) -> datetime | float:
+    """Convert a datetime to the type stored in the state time columns."""
+    if _uses_timestamps(schema_version):
+        return process_datetime_to_timestamp(value)
+    return value
+
+
 def lambda_stmt_and_join_attributes(
     schema_version: int, no_attributes: bool, include_last_changed: bool = True
 ) -> tuple[StatementLambdaElement, bool]:
     """Return the lambda_stmt and if StateAttributes should be joined.
 
+    The entity_id is selected from the states_meta table and the
+    times from the timestamp columns unless we are still migrating
+    to a schema that has them.
+    """
+    stmt, join_attributes = _lambda_stmt_and_join_attributes(
+        schema_version, no_attributes
+    )
+    last_updated, last_changed = _state_time_columns(schema_version)
+    if include_last_changed:
+        stmt += lambda q: q.add_columns(last_changed, last_updated)
+    elif _uses_timestamps(schema_version):
+        stmt += lambda q: q.add_columns(NULL_LAST_CHANGED_TS, last_updated)
+    else:
+        stmt += lambda q: q.add_columns(NULL_LAST_CHANGED, last_updated)
+    if _uses_states_meta(schema_version):
+        stmt += lambda q: q.add_columns(StatesMeta.entity_id).outerjoin(
+            StatesMeta, States.metadata_id == StatesMeta.metadata_id
+        )
+    else:
+        stmt += lambda q: q.add_columns(States.entity_id)
+    return stmt, join_attributes
+
+
+def _lambda_stmt_and_join_attributes(
+    schema_version: int, no_attributes: bool
+) -> tuple[StatementLambdaElement, bool]:
+    """Return the lambda_stmt and if StateAttributes should be joined.
+
     Because these are lambda_stmt the values inside the lambdas need
     to be explicitly written out to avoid caching the wrong values.
     """
@@ -124,31 +174,16 @@ def lambda_stmt_and_join_attributes(
     # without the attributes fields and do not join the
     # state_attributes table
     if no_attributes:
-        if include_last_changed:
-            return lambda_stmt(lambda: select(*QUERY_STATE_NO_ATTR)), False
-        return (
-            lambda_stmt(lambda: select(*QUERY_STATE_NO_ATTR_NO_LAST_CHANGED)),
-            False,
-        )
+        return lambda_stmt(lambda: select(*QUERY_STATE_NO_ATTR)), False
     # If we in the process of migrating schema we do
     # not want to join the state_attributes table as we
     # do not know if it will be there yet
     if schema_version < 25:
-        if include_last_changed:
-            return (
-                lambda_stmt(lambda: select(*QUERY_STATES_PRE_SCHEMA_25)),
-                False,
-            )
-        return (
-            lambda_stmt(lambda: select(*QUERY_STATES_PRE_SCHEMA_25_NO_LAST_CHANGED)),
-            False,
-        )
+        return lambda_stmt(lambda: select(*QUERY_STATES_PRE_SCHEMA_25)), False
     # Finally if no migration is in progress and no_attributes
     # was not requested, we query both attributes columns and
     # join state_attributes
-    if include_last_changed:
-        return lambda_stmt(lambda: select(*QUERY_STATES)), True
-    return lambda_stmt(lambda: select(*QUERY_STATES_NO_LAST_CHANGED)), True
+    return lambda_stmt(lambda: select(*QUERY_STATES)), True
 
 
 def get_significant_states(
@@ -180,8 +215,31 @@ def get_significant_states(
         )
 
 
+def _get_metadata_ids(session: Session, entity_ids: list[str]) -> list[int]:
+    """Resolve entity_ids to the metadata_ids in the states_meta table."""
+    return [
+        metadata_id
+        for metadata_id, _ in session.execute(find_states_metadata_ids(entity_ids))
+    ]
+
+
 def _ignore_domains_filter(query: Query) -> Query:
     """Add a filter to ignore domains we do not fetch history for."""
+    return query.filter(
+        and_(
+            *[
+                ~StatesMeta.entity_id.like(entity_domain)
+                for entity_domain in IGNORE_DOMAINS_ENTITY_ID_LIKE
+            ]
+        )
+    )
+
+
+def _legacy_ignore_domains_filter(query: Query) -> Query:
+    """Add a filter to ignore domains we do not fetch history for.
+
+    Used until the states_meta migration has finished.
+    """
     return query.filter(
         and_(
             *[
@@ -192,11 +250,94 @@ def _ignore_domains_filter(query: Query) -> Query:
     )
 
 
+def _significant_changes_clause(schema_version: int) -> ClauseList:
+    """Return a clause to only fetch states where the state changed."""
+    last_updated, last_changed = _state_time_columns(schema_version)
+    return (last_changed == last_updated) | last_changed.is_(None)
+
+
+def _significant_domains_filter(query: Query) -> Query:
+    """Add a filter to only fetch significant changes."""
+    return query.filter(
+        or_(
+            *[
+                StatesMeta.entity_id.like(entity_domain)
+                for entity_domain in SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE
+            ],
+            (
+                (States.last_changed_ts == States.last_updated_ts)
+                | States.last_changed_ts.is_(None)
+            ),
+        )
+    )
+
+
+def _significant_domains_filter_pre_schema_32(query: Query) -> Query:
+    """Add a filter to only fetch significant changes.
+
+    Used until the timestamp migration has finished.
+    """
+    return query.filter(
+        or_(
+            *[
+                StatesMeta.entity_id.like(entity_domain)
+                for entity_domain in SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE
+            ],
+            (
+                (States.last_changed == States.last_updated)
+                | States.last_changed.is_(None)
+            ),
+        )
+    )
+
+
+def _legacy_significant_domains_filter(query: Query) -> Query:
+    """Add a filter to only fetch significant changes.
+
+    Used until the states_meta migration has finished.
+    """
+    return query.filter(
+        or_(
+            *[
+                States.entity_id.like(entity_domain)
+                for entity_domain in SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE
+            ],
+            (
+                (States.last_changed == States.last_updated)
+                | States.last_changed.is_(None)
+            ),
+        )
+    )
+
+
+def _order_by_entity_and_last_updated(
+    stmt: StatementLambdaElement,
+    schema_version: int,
+    has_entity_ids: bool,
+    descending: bool = False,
+) -> StatementLambdaElement:
+    """Order the states by entity and last_updated.
+
+    When specific entities are requested the metadata_id is used
+    so the order can be read from the index, otherwise we keep
+    sorting by entity_id.
+    """
+    if _uses_states_meta(schema_version) and has_entity_ids:
+        entity_column = States.metadata_id
+    else:
+        entity_column = _entity_id_column(schema_version)
+    last_updated, _ = _state_time_columns(schema_version)
+    if descending:
+        return stmt + (lambda q: q.order_by(entity_column, last_updated.desc()))
+    return stmt + (lambda q: q.order_by(entity_column, last_updated))
+
+
 def _significant_states_stmt(
     schema_version: int,
     start_time: datetime,
     end_time: datetime | None,
     entity_ids: list[str] | None,
+    metadata_ids: list[int] | None,
     filters: Filters | None,
     significant_changes_only: bool,
     no_attributes: bool,
@@ -205,49 +346,53 @@ def _significant_states_stmt(
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, no_attributes, include_last_changed=not significant_changes_only
     )
+    uses_states_meta = _uses_states_meta(schema_version)
     if (
         entity_ids
         and len(entity_ids) == 1
         and significant_changes_only
         and split_entity_id(entity_ids[0])[0] not in SIGNIFICANT_DOMAINS
     ):
-        stmt += lambda q: q.filter(
-            (States.last_changed == States.last_updated) | States.last_changed.is_(None)
-        )
+        significant_changes = _significant_changes_clause(schema_version)
+        stmt += lambda q: q.filter(significant_changes)
+    elif significant_changes_only and _uses_timestamps(schema_version):
+        stmt += _significant_domains_filter
+    elif significant_changes_only and uses_states_meta:
+        stmt += _significant_domains_filter_pre_schema_32
     elif significant_changes_only:
-        stmt += lambda q: q.filter(
-            or_(
-                *[
-                    States.entity_id.like(entity_domain)
-                    for entity_domain in SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE
-                ],
-                (
-                    (States.last_changed == States.last_updated)
-                    | States.last_changed.is_(None)
-                ),
-            )
-        )
+        stmt += _legacy_significant_domains_filter
 
-    if entity_ids:
+    if entity_ids and uses_states_meta:
+        stmt += lambda q: q.filter(States.metadata_id.in_(metadata_ids))
+    elif entity_ids:
         stmt += lambda q: q.filter(States.entity_id.in_(entity_ids))
-    else:
+    elif uses_states_meta:
         stmt += _ignore_domains_filter
         if filters and filters.has_config:
-            entity_filter = filters.states_entity_filter()
+            entity_filter = filters.states_metadata_entity_filter()
             stmt = stmt.add_criteria(
                 lambda q: q.filter(entity_filter), track_on=[filters]
             )
+    else:
+        stmt += _legacy_ignore_domains_filter
+        if filters and filters.has_config:
+            legacy_entity_filter = filters.states_entity_filter()
+            stmt = stmt.add_criteria(
+                lambda q: q.filter(legacy_entity_filter), track_on=[filters]
+            )
 
-    stmt += lambda q: q.filter(States.last_updated > start_time)
+    last_updated, _ = _state_time_columns(schema_version)
+    start_time_value = _state_time(schema_version, start_time)
+    stmt += lambda q: q.filter(last_updated > start_time_value)
     if end_time:
-        stmt += lambda q: q.filter(States.last_updated < end_time)
+        end_time_value = _state_time(schema_version, end_time)
+        stmt += lambda q: q.filter(last_updated < end_time_value)
 
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    stmt += lambda q: q.order_by(States.entity_id, States.last_updated)
-    return stmt
+    return _order_by_entity_and_last_updated(stmt, schema_version, bool(entity_ids))
 
 
 def get_significant_states_with_session(
@@ -275,11 +420,16 @@ def get_significant_states_with_session(
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
     """
+    schema_version = _schema_version(hass)
+    metadata_ids: list[int] | None = None
+    if entity_ids and _uses_states_meta(schema_version):
+        metadata_ids = _get_metadata_ids(session, entity_ids)
     stmt = _significant_states_stmt(
-        _schema_version(hass),
+        schema_version,
         start_time,
         end_time,
         entity_ids,
+        metadata_ids,
         filters,
         significant_changes_only,
         no_attributes,
@@ -290,6 +440,7 @@ def get_significant_states_with_session(
     return _sorted_states_to_dict(
         hass,
         session,
+        schema_version,
         states,
         start_time,
         entity_ids,
@@ -298,6 +449,7 @@ def get_significant_states_with_session(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        metadata_ids=metadata_ids,
     )
 
 
@@ -335,6 +487,7 @@ def _state_changed_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
     entity_id: str | None,
+    metadata_id: int | None,
     no_attributes: bool,
     descending: bool,
     limit: int | None,
@@ -342,22 +495,25 @@ def _state_changed_during_period_stmt(
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, no_attributes, include_last_changed=False
     )
-    stmt += lambda q: q.filter(
-        ((States.last_changed == States.last_updated) | States.last_changed.is_(None))
-        & (States.last_updated > start_time)
-    )
+    uses_states_meta = _uses_states_meta(schema_version)
+    significant_changes = _significant_changes_clause(schema_version)
+    last_updated, _ = _state_time_columns(schema_version)
+    start_time_value = _state_time(schema_version, start_time)
+    stmt += lambda q: q.filter(significant_changes & (last_updated > start_time_value))
     if end_time:
-        stmt += lambda q: q.filter(States.last_updated < end_time)
-    if entity_id:
+        end_time_value = _state_time(schema_version, end_time)
+        stmt += lambda q: q.filter(last_updated < end_time_value)
+    if entity_id and uses_states_meta:
+        stmt += lambda q: q.filter(States.metadata_id == metadata_id)
+    elif entity_id:
         stmt += lambda q: q.filter(States.entity_id == entity_id)
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    if descending:
-        stmt += lambda q: q.order_by(States.entity_id, States.last_updated.desc())
-    else:
-        stmt += lambda q: q.order_by(States.entity_id, States.last_updated)
+    stmt = _order_by_entity_and_last_updated(
+        stmt, schema_version, bool(entity_id), descending
+    )
     if limit:
         stmt += lambda q: q.limit(limit)
     return stmt
@@ -376,13 +532,20 @@ def state_changes_during_period(
     """Return states changes during UTC period start_time - end_time."""
     entity_id = entity_id.lower() if entity_id is not None else None
     entity_ids = [entity_id] if entity_id is not None else None
+    schema_version = _schema_version(hass)
 
     with session_scope(hass=hass) as session:
+        metadata_id: int | None = None
+        if entity_ids and _uses_states_meta(schema_version):
+            if not (metadata_ids := _get_metadata_ids(session, entity_ids)):
+                return {}
+            metadata_id = metadata_ids[0]
         stmt = _state_changed_during_period_stmt(
-            _schema_version(hass),
+            schema_version,
             start_time,
             end_time,
             entity_id,
+            metadata_id,
             no_attributes,
             descending,
             limit,
@@ -395,32 +558,40 @@ def state_changes_during_period(
             _sorted_states_to_dict(
                 hass,
                 session,
+                schema_version,
                 states,
                 start_time,
                 entity_ids,
                 include_start_time_state=include_start_time_state,
+                metadata_ids=[metadata_id] if metadata_id is not None else None,
             ),
         )
 
 
 def _get_last_state_changes_stmt(
-    schema_version: int, number_of_states: int, entity_id: str | None
+    schema_version: int,
+    number_of_states: int,
+    entity_id: str | None,
+    metadata_id: int | None,
 ) -> StatementLambdaElement:
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, False, include_last_changed=False
     )
-    stmt += lambda q: q.filter(
-        (States.last_changed == States.last_updated) | States.last_changed.is_(None)
-    )
-    if entity_id:
+    uses_states_meta = _uses_states_meta(schema_version)
+    significant_changes = _significant_changes_clause(schema_version)
+    stmt += lambda q: q.filter(significant_changes)
+    if entity_id and uses_states_meta:
+        stmt += lambda q: q.filter(States.metadata_id == metadata_id)
+    elif entity_id:
         stmt += lambda q: q.filter(States.entity_id == entity_id)
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    stmt += lambda q: q.order_by(States.entity_id, States.last_updated.desc()).limit(
-        number_of_states
+    stmt = _order_by_entity_and_last_updated(
+        stmt, schema_version, bool(entity_id), descending=True
     )
+    stmt += lambda q: q.limit(number_of_states)
     return stmt
 
 
@@ -431,10 +602,16 @@ def get_last_state_changes(
     start_time = dt_util.utcnow()
     entity_id = entity_id.lower() if entity_id is not None else None
     entity_ids = [entity_id] if entity_id is not None else None
+    schema_version = _schema_version(hass)
 
     with session_scope(hass=hass) as session:
+        metadata_id: int | None = None
+        if entity_ids and _uses_states_meta(schema_version):
+            if not (metadata_ids := _get_metadata_ids(session, entity_ids)):
+                return {}
+            metadata_id = metadata_ids[0]
         stmt = _get_last_state_changes_stmt(
-            _schema_version(hass), number_of_states, entity_id
+            schema_version, number_of_states, entity_id, metadata_id
         )
         states = list(execute_stmt_lambda_element(session, stmt))
         return cast(
@@ -442,6 +619,7 @@ def get_last_state_changes(
             _sorted_states_to_dict(
                 hass,
                 session,
+                schema_version,
                 reversed(states),
                 start_time,
                 entity_ids,
@@ -454,15 +632,52 @@ def _get_states_for_entites_stmt(
     schema_version: int,
     run_start: datetime,
     utc_point_in_time: datetime,
-    entity_ids: list[str],
+    metadata_ids: list[int],
     no_attributes: bool,
 ) -> StatementLambdaElement:
     """Baked query to get states for specific entities."""
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, no_attributes, include_last_changed=True
     )
+    last_updated, _ = _state_time_columns(schema_version)
+    run_start_value = _state_time(schema_version, run_start)
+    utc_point_in_time_value = _state_time(schema_version, utc_point_in_time)
     # We got an include-list of entities, accelerate the query by filtering already
     # in the inner query.
+    stmt += lambda q: q.where(
+        States.state_id
+        == (
+            select(func.max(States.state_id).label("max_state_id"))
+            .filter(
+                (last_updated >= run_start_value)
+                & (last_updated < utc_point_in_time_value)
+            )
+            .filter(States.metadata_id.in_(metadata_ids))
+            .group_by(States.metadata_id)
+            .subquery()
+        ).c.max_state_id
+    )
+    if join_attributes:
+        stmt += lambda q: q.outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
+    return stmt
+
+
+def _legacy_get_states_for_entites_stmt(
+    schema_version: int,
+    run_start: datetime,
+    utc_point_in_time: datetime,
+    entity_ids: list[str],
+    no_attributes: bool,
+) -> StatementLambdaElement:
+    """Baked query to get states for specific entities.
+
+    Used until the states_meta migration has finished.
+    """
+    stmt, join_attributes = lambda_stmt_and_join_attributes(
+        schema_version, no_attributes, include_last_changed=True
+    )
     stmt += lambda q: q.where(
         States.state_id
         == (
@@ -484,10 +699,34 @@ def _get_states_for_entites_stmt(
 
 
 def _generate_most_recent_states_by_date(
+    schema_version: int,
     run_start: datetime,
     utc_point_in_time: datetime,
 ) -> Subquery:
     """Generate the sub query for the most recent states by data."""
+    last_updated, _ = _state_time_columns(schema_version)
+    return (
+        select(
+            States.metadata_id.label("max_metadata_id"),
+            func.max(last_updated).label("max_last_updated"),
+        )
+        .filter(
+            (last_updated >= _state_time(schema_version, run_start))
+            & (last_updated < _state_time(schema_version, utc_point_in_time))
+        )
+        .group_by(States.metadata_id)
+        .subquery()
+    )
+
+
+def _legacy_generate_most_recent_states_by_date(
+    run_start: datetime,
+    utc_point_in_time: datetime,
+) -> Subquery:
+    """Generate the sub query for the most recent states by data.
+
+    Used until the states_meta migration has finished.
+    """
     return (
         select(
             States.entity_id.label("max_entity_id"),
@@ -517,29 +756,86 @@ def _get_states_for_all_stmt(
     # query, then filter out unwanted domains as well as applying the custom filter.
     # This filtering can't be done in the inner query because the domain column is
     # not indexed and we can't control what's in the custom filter.
-    most_recent_states_by_date = _generate_most_recent_states_by_date(
-        run_start, utc_point_in_time
-    )
-    stmt += lambda q: q.where(
-        States.state_id
-        == (
-            select(func.max(States.state_id).label("max_state_id"))
-            .join(
-                most_recent_states_by_date,
-                and_(
-                    States.entity_id == most_recent_states_by_date.c.max_entity_id,
-                    States.last_updated
-                    == most_recent_states_by_date.c.max_last_updated,
-                ),
+    if _uses_states_meta(schema_version):
+        most_recent_states_by_date = _generate_most_recent_states_by_date(
+            schema_version, run_start, utc_point_in_time
+        )
+        last_updated, _ = _state_time_columns(schema_version)
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .join(
+                    most_recent_states_by_date,
+                    and_(
+                        States.metadata_id
+                        == most_recent_states_by_date.c.max_metadata_id,
+                        last_updated == most_recent_states_by_date.c.max_last_updated,
+                    ),
+                )
+                .group_by(States.metadata_id)
+                .subquery()
+            ).c.max_state_id,
+        )
+        stmt = _all_states_filter(stmt, filters)
+        # The rows used to come back in entity_id order since
+        # we grouped by entity_id, keep it that way
+        stmt += lambda q: q.order_by(StatesMeta.entity_id)
+    else:
+        legacy_most_recent_states_by_date = _legacy_generate_most_recent_states_by_date(
+            run_start, utc_point_in_time
+        )
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .join(
+                    legacy_most_recent_states_by_date,
+                    and_(
+                        States.entity_id
+                        == legacy_most_recent_states_by_date.c.max_entity_id,
+                        States.last_updated
+                        == legacy_most_recent_states_by_date.c.max_last_updated,
+                    ),
+                )
+                .group_by(States.entity_id)
+                .subquery()
+            ).c.max_state_id,
+        )
+        stmt += _legacy_ignore_domains_filter
+        if filters and filters.has_config:
+            legacy_entity_filter = filters.states_entity_filter()
+            stmt = stmt.add_criteria(
+                lambda q: q.filter(legacy_entity_filter), track_on=[filters]
             )
-            .group_by(States.entity_id)
-            .subquery()
-        ).c.max_state_id,
-    )
+    if join_attributes:
+        stmt += lambda q: q.outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
+    return stmt
+
+
+def _all_states_filter(
+    stmt: StatementLambdaElement, filters: Filters | None
+) -> StatementLambdaElement:
+    """Filter out ignored domains and entities excluded by the filters."""
     stmt += _ignore_domains_filter
     if filters and filters.has_config:
-        entity_filter = filters.states_entity_filter()
+        entity_filter = filters.states_metadata_entity_filter()
         stmt = stmt.add_criteria(lambda q: q.filter(entity_filter), track_on=[filters])
+    return stmt
+
+
+def _get_states_by_state_ids_stmt(
+    schema_version: int,
+    state_ids: list[int],
+    no_attributes: bool,
+) -> StatementLambdaElement:
+    """Baked query to get states by state_id."""
+    stmt, join_attributes = lambda_stmt_and_join_attributes(
+        schema_version, no_attributes, include_last_changed=True
+    )
+    stmt += lambda q: q.where(States.state_id.in_(state_ids))
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
@@ -547,6 +843,49 @@ def _get_states_for_all_stmt(
     return stmt
 
 
+def _get_rows_from_latest_states(
+    session: Session,
+    schema_version: int,
+    run_start: datetime,
+    utc_point_in_time: datetime,
+    state_ids: list[int],
+    changed_metadata_ids: list[int],
+    all_entities: bool,
+    filters: Filters | None,
+    no_attributes: bool,
+) -> list[Row]:
+    """Return the states at a specific point in time from the latest states.
+
+    The states of entities that have not changed since utc_point_in_time
+    are selected by state_id. Only the entities that changed since then
+    need to find their most recent state with a subquery.
+    """
+    stmts = [
+        _get_states_by_state_ids_stmt(
+            schema_version,
+            state_ids[idx : idx + MAX_STATE_IDS_PER_SELECT],
+            no_attributes,
+        )
+        for idx in range(0, len(state_ids), MAX_STATE_IDS_PER_SELECT)
+    ]
+    if changed_metadata_ids:
+        stmts.append(
+            _get_states_for_entites_stmt(
+                schema_version,
+                run_start,
+                utc_point_in_time,
+                changed_metadata_ids,
+                no_attributes,
+            )
+        )
+    rows: list[Row] = []
+    for stmt in stmts:
+        if all_entities:
+            stmt = _all_states_filter(stmt, filters)
+        rows.extend(execute_stmt_lambda_element(session, stmt))
+    return rows
+
+
 def _get_rows_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -555,14 +894,26 @@ def _get_rows_with_session(
     run: RecorderRuns | None = None,
     filters: Filters | None = None,
     no_attributes: bool = False,
+    metadata_ids: list[int] | None = None,
+    schema_version: int | None = None,
 ) -> Iterable[Row]:
     """Return the states at a specific point in time."""
-    schema_version = _schema_version(hass)
+    if schema_version is None:
+        schema_version = _schema_version(hass)
+    uses_states_meta = _uses_states_meta(schema_version)
+    if entity_ids and uses_states_meta and metadata_ids is None:
+        metadata_ids = _get_metadata_ids(session, entity_ids)
     if entity_ids and len(entity_ids) == 1:
+        if uses_states_meta and not metadata_ids:
+            return []
         return execute_stmt_lambda_element(
             session,
             _get_single_entity_states_stmt(
-                schema_version, utc_point_in_time, entity_ids[0], no_attributes
+                schema_version,
+                utc_point_in_time,
+                entity_ids[0],
+                metadata_ids[0] if metadata_ids else None,
+                no_attributes,
             ),
         )
 
@@ -573,10 +924,33 @@ def _get_rows_with_session(
         # History did not run before utc_point_in_time
         return []
 
+    if uses_states_meta and (
+        latest_states := recorder.get_instance(hass).latest_states.get_before(
+            run.start, utc_point_in_time, metadata_ids if entity_ids else None
+        )
+    ):
+        state_ids, changed_metadata_ids = latest_states
+        return _get_rows_from_latest_states(
+            session,
+            schema_version,
+            run.start,
+            utc_point_in_time,
+            state_ids,
+            changed_metadata_ids,
+            not entity_ids,
+            filters,
+            no_attributes,
+        )
+
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    if entity_ids:
+    if entity_ids and uses_states_meta:
+        assert metadata_ids is not None
         stmt = _get_states_for_entites_stmt(
+            schema_version, run.start, utc_point_in_time, metadata_ids, no_attributes
+        )
+    elif entity_ids:
+        stmt = _legacy_get_states_for_entites_stmt(
             schema_version, run.start, utc_point_in_time, entity_ids, no_attributes
         )
     else:
@@ -591,6 +965,7 @@ def _get_single_entity_states_stmt(
     schema_version: int,
     utc_point_in_time: datetime,
     entity_id: str,
+    metadata_id: int | None,
     no_attributes: bool = False,
 ) -> StatementLambdaElement:
     # Use an entirely different (and extremely fast) query if we only
@@ -598,14 +973,26 @@ def _get_single_entity_states_stmt(
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, no_attributes, include_last_changed=True
     )
-    stmt += (
-        lambda q: q.filter(
-            States.last_updated < utc_point_in_time,
-            States.entity_id == entity_id,
+    if _uses_states_meta(schema_version):
+        last_updated, _ = _state_time_columns(schema_version)
+        utc_point_in_time_value = _state_time(schema_version, utc_point_in_time)
+        stmt += (
+            lambda q: q.filter(
+                last_updated < utc_point_in_time_value,
+                States.metadata_id == metadata_id,
+            )
+            .order_by(last_updated.desc())
+            .limit(1)
+        )
+    else:
+        stmt += (
+            lambda q: q.filter(
+                States.last_updated < utc_point_in_time,
+                States.entity_id == entity_id,
+            )
+            .order_by(States.last_updated.desc())
+            .limit(1)
         )
-        .order_by(States.last_updated.desc())
-        .limit(1)
-    )
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
@@ -613,9 +1000,30 @@ def _get_single_entity_states_stmt(
     return stmt
 
 
+def _row_last_updated_timestamp(row: Row) -> float:
+    """Return the last_updated of a row as a timestamp."""
+    return cast(float, row.last_updated_ts)
+
+
+def _row_last_updated_isoformat(row: Row) -> str:
+    """Return the last_updated of a row as an isoformat string."""
+    return dt_util.utc_from_timestamp(row.last_updated_ts).isoformat()
+
+
+def _legacy_row_last_updated_timestamp(row: Row) -> float:
+    """Return the last_updated of a row with datetime columns as a timestamp."""
+    return process_datetime_to_timestamp(row.last_updated)
+
+
+def _legacy_row_last_updated_isoformat(row: Row) -> str:
+    """Return the last_updated of a row with datetime columns as an isoformat string."""
+    return process_timestamp_to_utc_isoformat(row.last_updated)
+
+
 def _sorted_states_to_dict(
     hass: HomeAssistant,
     session: Session,
+    schema_version: int,
     states: Iterable[Row],
     start_time: datetime,
     entity_ids: list[str] | None,
@@ -624,6 +1032,7 @@ def _sorted_states_to_dict(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    metadata_ids: list[int] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -636,16 +1045,24 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    uses_timestamps = _uses_timestamps(schema_version)
+    _process_row_time: Callable[[Row], float | str]
     if compressed_state_format:
-        state_class = row_to_compressed_state
-        _process_timestamp: Callable[
-            [datetime], float | str
-        ] = process_datetime_to_timestamp
+        if uses_timestamps:
+            state_class = row_to_compressed_state
+            _process_row_time = _row_last_updated_timestamp
+        else:
+            state_class = row_to_compressed_state_pre_schema_32
+            _process_row_time = _legacy_row_last_updated_timestamp
         attr_time = COMPRESSED_STATE_LAST_UPDATED
         attr_state = COMPRESSED_STATE_STATE
     else:
-        state_class = LazyState  # type: ignore[assignment]
-        _process_timestamp = process_timestamp_to_utc_isoformat
+        if uses_timestamps:
+            state_class = LazyState  # type: ignore[assignment]
+            _process_row_time = _row_last_updated_isoformat
+        else:
+            state_class = LazyStatePreSchema32  # type: ignore[assignment]
+            _process_row_time = _legacy_row_last_updated_isoformat
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
@@ -668,6 +1085,8 @@ def _sorted_states_to_dict(
                 entity_ids,
                 filters=filters,
                 no_attributes=no_attributes,
+                metadata_ids=metadata_ids,
+                schema_version=schema_version,
             )
         }
 
@@ -719,7 +1138,7 @@ def _sorted_states_to_dict(
                     #
                     # We use last_updated for for last_changed since its the same
                     #
-                    attr_time: _process_timestamp(row.last_updated),
+                    attr_time: _process_row_time(row),
                 }
             )
             prev_state = state
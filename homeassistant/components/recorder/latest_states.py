@@ -0,0 +1,109 @@
+"""Track the latest state recorded for each entity."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from .bulk_insert import PendingState
+from .models import process_timestamp
+
+
+class LatestStates:
+    """Track the latest state recorded for each entity in the current run.
+
+    The history queries only look at states since the run started
+    when finding the state of an entity at a point in time. Since
+    every state committed in the run passes through here, the state
+    of an entity at a point in time is its latest state unless the
+    entity changed after that point in time, in which case it still
+    has to be found in the database.
+    """
+
+    def __init__(self) -> None:
+        """Init the latest states."""
+        self._run_start_ts: float | None = None
+        self._newest_ts = 0.0
+        self._latest: dict[int, tuple[int, float]] = {}
+
+    def start(self, run_start: datetime) -> None:
+        """Start tracking the states of a new run.
+
+        Must run in the recorder thread.
+        """
+        self._latest = {}
+        self._newest_ts = 0.0
+        self._run_start_ts = run_start.timestamp()
+
+    def update(self, pending_states: Iterable[PendingState]) -> None:
+        """Update the latest states after the pending states were committed.
+
+        Must run in the recorder thread.
+        """
+        latest = self._latest
+        newest_ts = self._newest_ts
+        for pending in pending_states:
+            dbstate = pending.dbstate
+            if dbstate.state_id is None or dbstate.metadata_id is None:
+                continue
+            latest[dbstate.metadata_id] = (dbstate.state_id, dbstate.last_updated_ts)
+            newest_ts = max(newest_ts, dbstate.last_updated_ts)
+        #
+        # The newest timestamp is only moved forward once the
+        # states are in the map so a reader never sees a newest
+        # timestamp that is ahead of the states it has been given
+        #
+        self._newest_ts = newest_ts
+
+    def evict(self, purged_state_ids: set[int]) -> None:
+        """Evict purged states.
+
+        States are purged oldest first so an entity whose latest
+        state was purged has no states left in the database.
+
+        Must run in the recorder thread.
+        """
+        latest = self._latest
+        for metadata_id, (state_id, _) in list(latest.items()):
+            if state_id in purged_state_ids:
+                del latest[metadata_id]
+
+    def get_before(
+        self,
+        run_start: datetime,
+        utc_point_in_time: datetime,
+        metadata_ids: Iterable[int] | None = None,
+    ) -> tuple[list[int], list[int]] | None:
+        """Return the latest states before a point in time.
+
+        Returns the state_ids of the entities that have not changed since
+        utc_point_in_time and the metadata_ids of the entities that have.
+        If metadata_ids is None all entities are returned.
+
+        Returns None if utc_point_in_time is not in the current run or
+        states before it may not have been committed yet.
+
+        Can be called from any thread.
+        """
+        run_start_ts = self._run_start_ts
+        newest_ts = self._newest_ts
+        point_in_time_ts = utc_point_in_time.timestamp()
+        if (
+            run_start_ts is None
+            or process_timestamp(run_start).timestamp() != run_start_ts
+            or point_in_time_ts > newest_ts
+        ):
+            return None
+        latest = self._latest
+        if metadata_ids is None:
+            metadata_ids = latest.copy()
+        state_ids: list[int] = []
+        changed_metadata_ids: list[int] = []
+        for metadata_id in metadata_ids:
+            if not (state := latest.get(metadata_id)):
+                continue
+            state_id, last_updated_ts = state
+            if last_updated_ts >= point_in_time_ts:
+                changed_metadata_ids.append(metadata_id)
+            elif last_updated_ts >= run_start_ts:
+                state_ids.append(state_id)
+        return state_ids, changed_metadata_ids
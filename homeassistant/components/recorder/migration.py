@@ -9,7 +9,18 @@ import logging
 from typing import TYPE_CHECKING
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text
+from sqlalchemy import (
+    Column,
+    ForeignKeyConstraint,
+    Index,
+    MetaData,
+    Table,
+    bindparam,
+    delete,
+    func,
+    text,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import (
     DatabaseError,
@@ -24,19 +35,44 @@ from sqlalchemy.sql.expression import true
 
 from homeassistant.core import HomeAssistant
 
-from .const import SupportedDialect
+from .const import MIGRATION_BATCH_SIZE, SupportedDialect
 from .db_schema import (
+    CONTEXT_ID_BIN_MAX_LENGTH,
     SCHEMA_VERSION,
     TABLE_STATES,
     Base,
+    Events,
+    EventTypes,
+    LogbookEntries,
     SchemaChanges,
+    States,
+    StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
-from .models import process_timestamp
+from .models import (
+    context_id_to_bytes,
+    process_datetime_to_timestamp,
+    process_timestamp,
+    uuid_hex_to_bytes_or_none,
+)
+from .queries import (
+    find_all_event_types,
+    find_all_states_metadata,
+    find_events_context_ids_to_migrate,
+    find_events_without_event_type_id,
+    find_events_without_timestamps,
+    find_states_context_ids_to_migrate,
+    find_states_without_metadata_id,
+    find_states_without_timestamps,
+    insert_logbook_entries_for_states,
+)
 from .statistics import (
+    compile_rollup_statistics,
     delete_statistics_duplicates,
     delete_statistics_meta_duplicates,
     get_start_time,
@@ -137,6 +173,9 @@ def migrate_schema(
         _apply_update(hass, engine, session_maker, new_version, current_version)
         with session_scope(session=session_maker()) as session:
             session.add(SchemaChanges(schema_version=new_version))
+        # History and logbook pick the columns they query by the schema
+        # version, so they move over as soon as each version is done
+        instance.schema_version = new_version
 
         _LOGGER.info("Upgrade to version %s done", new_version)
 
@@ -156,7 +195,32 @@ def _create_index(
     if not index_list:
         _LOGGER.debug("The index %s no longer exists", index_name)
         return
-    index = index_list[0]
+    _create_index_from_definition(session_maker, table_name, index_list[0])
+
+
+def _create_index_for_columns(
+    session_maker: Callable[[], Session],
+    table_name: str,
+    index_name: str,
+    column_names: list[str],
+) -> None:
+    """Create an index that is no longer part of the models.
+
+    Used for the indices that are only queried until a later
+    schema version replaces them.
+    """
+    table = Table(
+        table_name, MetaData(), *(Column(column_name) for column_name in column_names)
+    )
+    index = Index(index_name, *(table.c[column_name] for column_name in column_names))
+    _create_index_from_definition(session_maker, table_name, index)
+
+
+def _create_index_from_definition(
+    session_maker: Callable[[], Session], table_name: str, index: Index
+) -> None:
+    """Create an index from its definition."""
+    index_name = index.name
     _LOGGER.debug("Creating %s index", index_name)
     _LOGGER.warning(
         "Adding index `%s` to database. Note: this can take several "
@@ -579,6 +643,8 @@ def _apply_update(  # noqa: C901
         Base.metadata.drop_all(
             bind=engine,
             tables=[
+                StatisticsMonthly.__table__,
+                StatisticsDaily.__table__,
                 StatisticsShortTerm.__table__,
                 Statistics.__table__,
                 StatisticsMeta.__table__,
@@ -588,6 +654,8 @@ def _apply_update(  # noqa: C901
         StatisticsMeta.__table__.create(engine)
         StatisticsShortTerm.__table__.create(engine)
         Statistics.__table__.create(engine)
+        StatisticsDaily.__table__.create(engine)
+        StatisticsMonthly.__table__.create(engine)
     elif new_version == 19:
         # This adds the statistic runs table, insert a fake run to prevent duplicating
         # statistics.
@@ -639,6 +707,8 @@ def _apply_update(  # noqa: C901
             Base.metadata.drop_all(
                 bind=engine,
                 tables=[
+                    StatisticsMonthly.__table__,
+                    StatisticsDaily.__table__,
                     StatisticsShortTerm.__table__,
                     Statistics.__table__,
                     StatisticsMeta.__table__,
@@ -650,6 +720,8 @@ def _apply_update(  # noqa: C901
             StatisticsMeta.__table__.create(engine)
             StatisticsShortTerm.__table__.create(engine)
             Statistics.__table__.create(engine)
+            StatisticsDaily.__table__.create(engine)
+            StatisticsMonthly.__table__.create(engine)
 
         # Block 5-minute statistics for one hour from the last run, or it will overlap
         # with existing hourly statistics. Don't block on a database with no existing
@@ -786,10 +858,391 @@ def _apply_update(  # noqa: C901
         # Once we require SQLite >= 3.35.5, we should drop the column:
         # ALTER TABLE statistics_meta DROP COLUMN state_unit_of_measurement
         pass
+    elif new_version == 31:
+        # The event_types and states_meta tables are created by create_all
+        _add_columns(session_maker, "events", [f"event_type_id {big_int}"])
+        _add_columns(session_maker, "states", [f"metadata_id {big_int}"])
+        # The backfill walks the primary keys and keeps the string
+        # columns, which are queried until this version is recorded
+        _migrate_event_type_ids(session_maker)
+        _migrate_states_metadata_ids(session_maker)
+        # Schema 32 replaces these indices with the timestamp based ones
+        # so they are created from their own definition
+        _create_index_for_columns(
+            session_maker,
+            "events",
+            "ix_events_event_type_id_time_fired",
+            ["event_type_id", "time_fired"],
+        )
+        _create_index_for_columns(
+            session_maker,
+            "states",
+            "ix_states_metadata_id_last_updated",
+            ["metadata_id", "last_updated"],
+        )
+        # The string columns are no longer queried once this version is recorded
+        _drop_index(session_maker, "events", "ix_events_event_type_time_fired")
+        _drop_index(session_maker, "states", "ix_states_entity_id_last_updated")
+    elif new_version == 32:
+        _add_columns(session_maker, "events", ["time_fired_ts DOUBLE PRECISION"])
+        _add_columns(
+            session_maker,
+            "states",
+            ["last_updated_ts DOUBLE PRECISION", "last_changed_ts DOUBLE PRECISION"],
+        )
+        # The backfill walks the primary keys and keeps the datetime
+        # columns, which are queried until this version is recorded
+        _migrate_events_to_timestamps(session_maker)
+        _migrate_states_to_timestamps(session_maker)
+        _create_index(session_maker, "events", "ix_events_time_fired_ts")
+        _create_index(session_maker, "events", "ix_events_event_type_id_time_fired_ts")
+        _create_index(session_maker, "states", "ix_states_last_updated_ts")
+        _create_index(session_maker, "states", "ix_states_metadata_id_last_updated_ts")
+        # The datetime columns are no longer queried once this version is recorded
+        _drop_index(session_maker, "events", "ix_events_time_fired")
+        _drop_index(session_maker, "events", "ix_events_event_type_id_time_fired")
+        _drop_index(session_maker, "states", "ix_states_last_updated")
+        _drop_index(session_maker, "states", "ix_states_metadata_id_last_updated")
+    elif new_version == 33:
+        context_bin_type = {
+            SupportedDialect.MYSQL: f"BLOB({CONTEXT_ID_BIN_MAX_LENGTH})",
+            SupportedDialect.POSTGRESQL: "BYTEA",
+        }.get(dialect, "BLOB")
+        for table in ("events", "states"):
+            _add_columns(
+                session_maker,
+                table,
+                [
+                    f"context_id_bin {context_bin_type}",
+                    f"context_user_id_bin {context_bin_type}",
+                    f"context_parent_id_bin {context_bin_type}",
+                ],
+            )
+        # The backfill walks the primary keys and keeps the string
+        # columns, which are queried until this version is recorded
+        _migrate_events_context_ids(session_maker)
+        _migrate_states_context_ids(session_maker)
+        _create_index(session_maker, "events", "ix_events_context_id_bin")
+        _create_index(session_maker, "states", "ix_states_context_id_bin")
+        # The string columns are no longer queried once this version is recorded
+        _drop_index(session_maker, "events", "ix_events_context_id")
+        _drop_index(session_maker, "states", "ix_states_context_id")
+    elif new_version == 34:
+        # The statistics_daily and statistics_monthly tables are created by create_all
+        _migrate_statistics_rollups(session_maker)
+    elif new_version == 35:
+        # The logbook_entries table is created by create_all
+        _migrate_logbook_entries(session_maker)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _batched_id_ranges(
+    session_maker: Callable[[], Session], id_column: Column
+) -> Iterable[tuple[int, int]]:
+    """Yield the ranges of ids to migrate a table in batches.
+
+    Walking the primary key keeps every batch a range scan, so
+    the columns being filled do not need an index. The walk starts
+    at the lowest id since purged databases no longer have the
+    low ids.
+    """
+    with session_scope(session=session_maker()) as session:
+        min_id, max_id = session.query(func.min(id_column), func.max(id_column)).one()
+    if max_id is None:
+        return
+    for start_id in range(min_id, max_id + 1, MIGRATION_BATCH_SIZE):
+        yield start_id, start_id + MIGRATION_BATCH_SIZE
+
+
+def _migrate_event_type_ids(session_maker: Callable[[], Session]) -> None:
+    """Link existing events to the event_types table in batches.
+
+    The event_type column is kept since it is queried until the
+    migration to this schema version has been recorded.
+    """
+    with session_scope(session=session_maker()) as session:
+        event_type_to_id: dict[str, int] = {
+            event_type: event_type_id
+            for event_type_id, event_type in session.execute(find_all_event_types())
+        }
+
+    for start_event_id, end_event_id in _batched_id_ranges(
+        session_maker, Events.event_id
+    ):
+        with session_scope(session=session_maker()) as session:
+            if not (
+                events := session.execute(
+                    find_events_without_event_type_id(start_event_id, end_event_id)
+                ).all()
+            ):
+                continue
+            _LOGGER.debug("Migrating %s events to event_types", len(events))
+            if missing := {
+                event_type
+                for _, event_type in events
+                if event_type not in event_type_to_id
+            }:
+                db_event_types = [
+                    EventTypes(event_type=event_type) for event_type in missing
+                ]
+                session.add_all(db_event_types)
+                session.flush()
+                for db_event_type in db_event_types:
+                    event_type_to_id[
+                        db_event_type.event_type
+                    ] = db_event_type.event_type_id
+            session.connection().execute(
+                update(Events)
+                .where(Events.event_id == bindparam("_event_id"))
+                .values(event_type_id=bindparam("_event_type_id")),
+                [
+                    {
+                        "_event_id": event_id,
+                        "_event_type_id": event_type_to_id[event_type],
+                    }
+                    for event_id, event_type in events
+                ],
+            )
+
+
+def _migrate_states_metadata_ids(session_maker: Callable[[], Session]) -> None:
+    """Link existing states to the states_meta table in batches.
+
+    The entity_id column is kept since it is queried until the
+    migration to this schema version has been recorded.
+    """
+    with session_scope(session=session_maker()) as session:
+        entity_id_to_metadata_id: dict[str, int] = {
+            entity_id: metadata_id
+            for metadata_id, entity_id in session.execute(find_all_states_metadata())
+        }
+
+    for start_state_id, end_state_id in _batched_id_ranges(
+        session_maker, States.state_id
+    ):
+        with session_scope(session=session_maker()) as session:
+            if not (
+                states := session.execute(
+                    find_states_without_metadata_id(start_state_id, end_state_id)
+                ).all()
+            ):
+                continue
+            _LOGGER.debug("Migrating %s states to states_meta", len(states))
+            if missing := {
+                entity_id
+                for _, entity_id in states
+                if entity_id not in entity_id_to_metadata_id
+            }:
+                db_states_metas = [
+                    StatesMeta(entity_id=entity_id) for entity_id in missing
+                ]
+                session.add_all(db_states_metas)
+                session.flush()
+                for db_states_meta in db_states_metas:
+                    entity_id_to_metadata_id[
+                        db_states_meta.entity_id
+                    ] = db_states_meta.metadata_id
+            session.connection().execute(
+                update(States)
+                .where(States.state_id == bindparam("_state_id"))
+                .values(metadata_id=bindparam("_metadata_id")),
+                [
+                    {
+                        "_state_id": state_id,
+                        "_metadata_id": entity_id_to_metadata_id[entity_id],
+                    }
+                    for state_id, entity_id in states
+                ],
+            )
+
+
+def _migrate_events_to_timestamps(session_maker: Callable[[], Session]) -> None:
+    """Convert the time_fired of existing events to timestamps in batches.
+
+    The time_fired column is kept since it is queried until the
+    migration to this schema version has been recorded.
+    """
+    for start_event_id, end_event_id in _batched_id_ranges(
+        session_maker, Events.event_id
+    ):
+        with session_scope(session=session_maker()) as session:
+            if not (
+                events := session.execute(
+                    find_events_without_timestamps(start_event_id, end_event_id)
+                ).all()
+            ):
+                continue
+            _LOGGER.debug("Migrating %s events to timestamps", len(events))
+            session.connection().execute(
+                update(Events)
+                .where(Events.event_id == bindparam("_event_id"))
+                .values(time_fired_ts=bindparam("_time_fired_ts")),
+                [
+                    {
+                        "_event_id": event_id,
+                        "_time_fired_ts": process_datetime_to_timestamp(time_fired),
+                    }
+                    for event_id, time_fired in events
+                ],
+            )
+
+
+def _migrate_states_to_timestamps(session_maker: Callable[[], Session]) -> None:
+    """Convert the times of existing states to timestamps in batches.
+
+    The datetime columns are kept since they are queried until the
+    migration to this schema version has been recorded.
+    """
+    for start_state_id, end_state_id in _batched_id_ranges(
+        session_maker, States.state_id
+    ):
+        with session_scope(session=session_maker()) as session:
+            if not (
+                states := session.execute(
+                    find_states_without_timestamps(start_state_id, end_state_id)
+                ).all()
+            ):
+                continue
+            _LOGGER.debug("Migrating %s states to timestamps", len(states))
+            session.connection().execute(
+                update(States)
+                .where(States.state_id == bindparam("_state_id"))
+                .values(
+                    last_updated_ts=bindparam("_last_updated_ts"),
+                    last_changed_ts=bindparam("_last_changed_ts"),
+                ),
+                [
+                    {
+                        "_state_id": state_id,
+                        "_last_updated_ts": process_datetime_to_timestamp(last_updated),
+                        "_last_changed_ts": None
+                        if last_changed is None or last_changed == last_updated
+                        else process_datetime_to_timestamp(last_changed),
+                    }
+                    for state_id, last_updated, last_changed in states
+                ],
+            )
+
+
+def _migrate_events_context_ids(session_maker: Callable[[], Session]) -> None:
+    """Convert the context ids of existing events to binary in batches.
+
+    The string columns are kept since they are queried until the
+    migration to this schema version has been recorded.
+    """
+    for start_event_id, end_event_id in _batched_id_ranges(
+        session_maker, Events.event_id
+    ):
+        with session_scope(session=session_maker()) as session:
+            if not (
+                events := session.execute(
+                    find_events_context_ids_to_migrate(start_event_id, end_event_id)
+                ).all()
+            ):
+                continue
+            _LOGGER.debug("Migrating %s events to binary context ids", len(events))
+            session.connection().execute(
+                update(Events)
+                .where(Events.event_id == bindparam("_event_id"))
+                .values(
+                    context_id_bin=bindparam("_context_id_bin"),
+                    context_user_id_bin=bindparam("_context_user_id_bin"),
+                    context_parent_id_bin=bindparam("_context_parent_id_bin"),
+                ),
+                [
+                    {
+                        "_event_id": event_id,
+                        "_context_id_bin": context_id_to_bytes(context_id),
+                        "_context_user_id_bin": uuid_hex_to_bytes_or_none(
+                            context_user_id
+                        ),
+                        "_context_parent_id_bin": context_id_to_bytes(
+                            context_parent_id
+                        ),
+                    }
+                    for event_id, context_id, context_user_id, context_parent_id in events
+                ],
+            )
+
+
+def _migrate_states_context_ids(session_maker: Callable[[], Session]) -> None:
+    """Convert the context ids of existing states to binary in batches.
+
+    The string columns are kept since they are queried until the
+    migration to this schema version has been recorded.
+    """
+    for start_state_id, end_state_id in _batched_id_ranges(
+        session_maker, States.state_id
+    ):
+        with session_scope(session=session_maker()) as session:
+            if not (
+                states := session.execute(
+                    find_states_context_ids_to_migrate(start_state_id, end_state_id)
+                ).all()
+            ):
+                continue
+            _LOGGER.debug("Migrating %s states to binary context ids", len(states))
+            session.connection().execute(
+                update(States)
+                .where(States.state_id == bindparam("_state_id"))
+                .values(
+                    context_id_bin=bindparam("_context_id_bin"),
+                    context_user_id_bin=bindparam("_context_user_id_bin"),
+                    context_parent_id_bin=bindparam("_context_parent_id_bin"),
+                ),
+                [
+                    {
+                        "_state_id": state_id,
+                        "_context_id_bin": context_id_to_bytes(context_id),
+                        "_context_user_id_bin": uuid_hex_to_bytes_or_none(
+                            context_user_id
+                        ),
+                        "_context_parent_id_bin": context_id_to_bytes(
+                            context_parent_id
+                        ),
+                    }
+                    for state_id, context_id, context_user_id, context_parent_id in states
+                ],
+            )
+
+
+def _migrate_statistics_rollups(session_maker: Callable[[], Session]) -> None:
+    """Compile the daily and monthly statistics from the hourly statistics."""
+    with session_scope(session=session_maker()) as session:
+        metadata_ids = [
+            metadata_id for (metadata_id,) in session.query(StatisticsMeta.id)
+        ]
+    _LOGGER.debug("Compiling daily and monthly statistics for %s", metadata_ids)
+    # Each statistic is rolled up in its own transaction to
+    # avoid holding all the hourly statistics in memory
+    for metadata_id in metadata_ids:
+        with session_scope(session=session_maker()) as session:
+            compile_rollup_statistics(session, [metadata_id])
+
+
+def _migrate_logbook_entries(session_maker: Callable[[], Session]) -> None:
+    """Write the logbook entries of the existing states in batches."""
+    with session_scope(session=session_maker()) as session:
+        # Remove the entries of an earlier attempt that did not finish
+        session.execute(delete(LogbookEntries))
+        max_state_id: int | None = session.query(func.max(States.state_id)).scalar()
+    if max_state_id is None:
+        return
+    for start_state_id in range(0, max_state_id + 1, MIGRATION_BATCH_SIZE):
+        with session_scope(session=session_maker()) as session:
+            _LOGGER.debug(
+                "Migrating logbook entries of states %s to %s",
+                start_state_id,
+                start_state_id + MIGRATION_BATCH_SIZE,
+            )
+            session.execute(
+                insert_logbook_entries_for_states(
+                    start_state_id, start_state_id + MIGRATION_BATCH_SIZE
+                )
+            )
+
+
 def _initialize_database(session: Session) -> bool:
     """Initialize a new database, or a database created before introducing schema changes.
 
@@ -805,7 +1258,7 @@ def _initialize_database(session: Session) -> bool:
     indexes = inspector.get_indexes("events")
 
     for index in indexes:
-        if index["column_names"] == ["time_fired"]:
+        if index["column_names"] in (["time_fired"], ["time_fired_ts"]):
             # Schema addition from version 1 detected. New DB.
             session.add(StatisticsRuns(start=get_start_time()))
             session.add(SchemaChanges(schema_version=SCHEMA_VERSION))
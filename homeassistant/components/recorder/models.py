@@ -4,6 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 import logging
 from typing import Any, TypedDict, overload
+from uuid import UUID
 
 from sqlalchemy.engine.row import Row
 
@@ -16,6 +17,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.core import Context, State
 from homeassistant.helpers.json import json_loads
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import bytes_to_ulid, ulid_to_bytes
 
 # pylint: disable=invalid-name
 
@@ -120,6 +122,52 @@ def process_datetime_to_timestamp(ts: datetime) -> float:
     return ts.timestamp()
 
 
+def ulid_to_bytes_or_none(ulid: str | None) -> bytes | None:
+    """Convert a ulid to bytes."""
+    if ulid is None:
+        return None
+    try:
+        return ulid_to_bytes(ulid)
+    except ValueError:
+        return None
+
+
+def bytes_to_ulid_or_none(_bytes: bytes | None) -> str | None:
+    """Convert bytes to a ulid."""
+    if _bytes is None:
+        return None
+    return bytes_to_ulid(_bytes)
+
+
+def uuid_hex_to_bytes_or_none(uuid_hex: str | None) -> bytes | None:
+    """Convert a uuid hex to bytes."""
+    if uuid_hex is None:
+        return None
+    try:
+        return UUID(hex=uuid_hex).bytes
+    except ValueError:
+        return None
+
+
+def bytes_to_uuid_hex_or_none(_bytes: bytes | None) -> str | None:
+    """Convert bytes to a uuid hex."""
+    if _bytes is None:
+        return None
+    return UUID(bytes=_bytes).hex
+
+
+def context_id_to_bytes(context_id: str | None) -> bytes | None:
+    """Convert a context_id stored as a string to bytes.
+
+    Context ids are ulids, but older contexts used uuid hex strings.
+    """
+    if context_id is None:
+        return None
+    if len(context_id) == 32:
+        return uuid_hex_to_bytes_or_none(context_id)
+    return ulid_to_bytes_or_none(context_id)
+
+
 class LazyState(State):
     """A lazy version of core State."""
 
@@ -172,6 +220,85 @@ class LazyState(State):
         """Set context."""
         self._context = value
 
+    @property  # type: ignore[override]
+    def last_changed(self) -> datetime:
+        """Last changed datetime."""
+        if self._last_changed is None:
+            if (last_changed_ts := self._row.last_changed_ts) is not None:
+                self._last_changed = dt_util.utc_from_timestamp(last_changed_ts)
+            else:
+                self._last_changed = self.last_updated
+        return self._last_changed
+
+    @last_changed.setter
+    def last_changed(self, value: datetime) -> None:
+        """Set last changed datetime."""
+        self._last_changed = value
+
+    @property  # type: ignore[override]
+    def last_updated(self) -> datetime:
+        """Last updated datetime."""
+        if self._last_updated is None:
+            self._last_updated = dt_util.utc_from_timestamp(self._row.last_updated_ts)
+        return self._last_updated
+
+    @last_updated.setter
+    def last_updated(self, value: datetime) -> None:
+        """Set last updated datetime."""
+        self._last_updated = value
+
+    def as_dict(self) -> dict[str, Any]:  # type: ignore[override]
+        """Return a dict representation of the LazyState.
+
+        Async friendly.
+
+        To be used for JSON serialization.
+        """
+        if self._last_changed is None and self._last_updated is None:
+            last_updated_ts = self._row.last_updated_ts
+            last_updated_isoformat = dt_util.utc_from_timestamp(
+                last_updated_ts
+            ).isoformat()
+            if (
+                last_changed_ts := self._row.last_changed_ts
+            ) is None or last_changed_ts == last_updated_ts:
+                last_changed_isoformat = last_updated_isoformat
+            else:
+                last_changed_isoformat = dt_util.utc_from_timestamp(
+                    last_changed_ts
+                ).isoformat()
+        else:
+            last_updated_isoformat = self.last_updated.isoformat()
+            if self.last_changed == self.last_updated:
+                last_changed_isoformat = last_updated_isoformat
+            else:
+                last_changed_isoformat = self.last_changed.isoformat()
+        return {
+            "entity_id": self.entity_id,
+            "state": self.state,
+            "attributes": self._attributes or self.attributes,
+            "last_changed": last_changed_isoformat,
+            "last_updated": last_updated_isoformat,
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        """Return the comparison."""
+        return (
+            other.__class__ in [self.__class__, State]
+            and self.entity_id == other.entity_id
+            and self.state == other.state
+            and self.attributes == other.attributes
+        )
+
+
+class LazyStatePreSchema32(LazyState):
+    """A lazy version of core State for rows with datetime columns.
+
+    Used until the migration to the timestamp columns has finished.
+    """
+
+    __slots__: list[str] = []
+
     @property  # type: ignore[override]
     def last_changed(self) -> datetime:
         """Last changed datetime."""
@@ -233,15 +360,6 @@ class LazyState(State):
             "last_updated": last_updated_isoformat,
         }
 
-    def __eq__(self, other: Any) -> bool:
-        """Return the comparison."""
-        return (
-            other.__class__ in [self.__class__, State]
-            and self.entity_id == other.entity_id
-            and self.state == other.state
-            and self.attributes == other.attributes
-        )
-
 
 def decode_attributes_from_row(
     row: Row, attr_cache: dict[str, dict[str, Any]]
@@ -270,6 +388,31 @@ def row_to_compressed_state(
         COMPRESSED_STATE_STATE: row.state,
         COMPRESSED_STATE_ATTRIBUTES: decode_attributes_from_row(row, attr_cache),
     }
+    if start_time:
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time.timestamp()
+    else:
+        row_last_updated_ts: float = row.last_updated_ts
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = row_last_updated_ts
+        if (
+            row_last_changed_ts := row.last_changed_ts
+        ) and row_last_updated_ts != row_last_changed_ts:
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
+    return comp_state
+
+
+def row_to_compressed_state_pre_schema_32(
+    row: Row,
+    attr_cache: dict[str, dict[str, Any]],
+    start_time: datetime | None = None,
+) -> dict[str, Any]:
+    """Convert a database row with datetime columns to a compressed state.
+
+    Used until the migration to the timestamp columns has finished.
+    """
+    comp_state = {
+        COMPRESSED_STATE_STATE: row.state,
+        COMPRESSED_STATE_ATTRIBUTES: decode_attributes_from_row(row, attr_cache),
+    }
     if start_time:
         comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time.timestamp()
     else:
@@ -9,7 +9,6 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
-from sqlalchemy.sql.expression import distinct
 
 from homeassistant.const import EVENT_STATE_CHANGED
 
@@ -22,12 +21,17 @@ from .queries import (
     data_ids_exist_in_events_sqlite,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_types_rows,
+    delete_logbook_entries_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
+    delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    find_all_event_types,
+    find_all_states_metadata,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
@@ -35,6 +39,8 @@ from .queries import (
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unused_event_type_ids,
+    find_unused_states_metadata_ids,
 )
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
@@ -125,6 +131,7 @@ def purge_old_data(
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
             return False
 
+        _purge_old_states_meta_and_event_types(instance, session)
         _purge_old_recorder_runs(instance, session, purge_before)
     if repack:
         repack_database(instance)
@@ -446,11 +453,15 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     disconnected_rows = session.execute(disconnect_states_rows(state_ids))
     _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
+    deleted_rows = session.execute(delete_logbook_entries_rows(state_ids))
+    _LOGGER.debug("Deleted %s logbook entries", deleted_rows)
+
     deleted_rows = session.execute(delete_states_rows(state_ids))
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
     # Evict eny entries in the old_states cache referring to a purged state
     _evict_purged_states_from_old_states_cache(instance, state_ids)
+    instance.latest_states.evict(state_ids)
 
 
 def _evict_purged_states_from_old_states_cache(
@@ -572,21 +583,21 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
 
     # Check if excluded entity_ids are in database
-    excluded_entity_ids: list[str] = [
-        entity_id
-        for (entity_id,) in session.query(distinct(States.entity_id)).all()
+    excluded_states_meta: dict[int, str] = {
+        metadata_id: entity_id
+        for metadata_id, entity_id in session.execute(find_all_states_metadata())
         if not instance.entity_filter(entity_id)
-    ]
-    if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(instance, session, excluded_entity_ids, using_sqlite)
+    }
+    if len(excluded_states_meta) > 0:
+        _purge_filtered_states(instance, session, excluded_states_meta, using_sqlite)
         return False
 
     # Check if excluded event_types are in database
-    excluded_event_types: list[str] = [
-        event_type
-        for (event_type,) in session.query(distinct(Events.event_type)).all()
+    excluded_event_types: dict[int, str] = {
+        event_type_id: event_type
+        for event_type_id, event_type in session.execute(find_all_event_types())
         if event_type in instance.exclude_t
-    ]
+    }
     if len(excluded_event_types) > 0:
         _purge_filtered_events(instance, session, excluded_event_types)
         return False
@@ -597,21 +608,25 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    excluded_entity_ids: list[str],
+    excluded_states_meta: dict[int, str],
     using_sqlite: bool,
 ) -> None:
     """Remove filtered states and linked events."""
+    rows = (
+        session.query(States.state_id, States.attributes_id, States.event_id)
+        .filter(States.metadata_id.in_(list(excluded_states_meta)))
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
+    )
+    if not rows:
+        # All the states are gone, remove the entity_ids
+        # so they are no longer found as excluded
+        _purge_unused_states_meta(instance, session, excluded_states_meta)
+        return
     state_ids: list[int]
     attributes_ids: list[int]
     event_ids: list[int]
-    state_ids, attributes_ids, event_ids = zip(
-        *(
-            session.query(States.state_id, States.attributes_id, States.event_id)
-            .filter(States.entity_id.in_(excluded_entity_ids))
-            .limit(MAX_ROWS_TO_PURGE)
-            .all()
-        )
-    )
+    state_ids, attributes_ids, event_ids = zip(*rows)
     event_ids = [id_ for id_ in event_ids if id_ is not None]
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
@@ -625,18 +640,22 @@ def _purge_filtered_states(
 
 
 def _purge_filtered_events(
-    instance: Recorder, session: Session, excluded_event_types: list[str]
+    instance: Recorder, session: Session, excluded_event_types: dict[int, str]
 ) -> None:
     """Remove filtered events and linked states."""
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
-    event_ids, data_ids = zip(
-        *(
-            session.query(Events.event_id, Events.data_id)
-            .filter(Events.event_type.in_(excluded_event_types))
-            .limit(MAX_ROWS_TO_PURGE)
-            .all()
-        )
+    rows = (
+        session.query(Events.event_id, Events.data_id)
+        .filter(Events.event_type_id.in_(list(excluded_event_types)))
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
     )
+    if not rows:
+        # All the events are gone, remove the event_types
+        # so they are no longer found as excluded
+        _purge_unused_event_types(instance, session, excluded_event_types)
+        return
+    event_ids, data_ids = zip(*rows)
     _LOGGER.debug(
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
@@ -650,25 +669,79 @@ def _purge_filtered_events(
         session, set(data_ids), using_sqlite
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
-    if EVENT_STATE_CHANGED in excluded_event_types:
+    if EVENT_STATE_CHANGED in excluded_event_types.values():
         session.query(StateAttributes).delete(synchronize_session=False)
         instance._state_attributes_ids = {}  # pylint: disable=protected-access
 
 
+def _purge_unused_states_meta(
+    instance: Recorder, session: Session, states_meta: dict[int, str]
+) -> None:
+    """Remove states_meta rows that are no longer referenced by any state."""
+    for metadata_ids_chunk in chunked(states_meta, MAX_ROWS_TO_PURGE):
+        unused_metadata_ids = [
+            metadata_id
+            for (metadata_id,) in session.execute(
+                find_unused_states_metadata_ids(metadata_ids_chunk)
+            )
+        ]
+        if not unused_metadata_ids:
+            continue
+        session.execute(delete_states_meta_rows(unused_metadata_ids))
+        for metadata_id in unused_metadata_ids:
+            # pylint: disable-next=protected-access
+            instance._states_meta_ids.pop(states_meta[metadata_id], None)
+        _LOGGER.debug("Deleted %s states_meta", len(unused_metadata_ids))
+
+
+def _purge_unused_event_types(
+    instance: Recorder, session: Session, event_types: dict[int, str]
+) -> None:
+    """Remove event_types rows that are no longer referenced by any event."""
+    for event_type_ids_chunk in chunked(event_types, MAX_ROWS_TO_PURGE):
+        unused_event_type_ids = [
+            event_type_id
+            for (event_type_id,) in session.execute(
+                find_unused_event_type_ids(event_type_ids_chunk)
+            )
+        ]
+        if not unused_event_type_ids:
+            continue
+        session.execute(delete_event_types_rows(unused_event_type_ids))
+        for event_type_id in unused_event_type_ids:
+            # pylint: disable-next=protected-access
+            instance._event_type_ids.pop(event_types[event_type_id], None)
+        _LOGGER.debug("Deleted %s event_types", len(unused_event_type_ids))
+
+
+def _purge_old_states_meta_and_event_types(
+    instance: Recorder, session: Session
+) -> None:
+    """Remove entity_ids and event_types that no longer have any rows."""
+    _purge_unused_states_meta(
+        instance, session, dict(session.execute(find_all_states_metadata()).all())
+    )
+    _purge_unused_event_types(
+        instance, session, dict(session.execute(find_all_event_types()).all())
+    )
+
+
 @retryable_database_job("purge")
 def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool]) -> bool:
     """Purge states and events of specified entities."""
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
     with session_scope(session=instance.get_session()) as session:
-        selected_entity_ids: list[str] = [
-            entity_id
-            for (entity_id,) in session.query(distinct(States.entity_id)).all()
+        selected_states_meta: dict[int, str] = {
+            metadata_id: entity_id
+            for metadata_id, entity_id in session.execute(find_all_states_metadata())
             if entity_filter(entity_id)
-        ]
-        _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
-        if len(selected_entity_ids) > 0:
+        }
+        _LOGGER.debug("Purging entity data for %s", list(selected_states_meta.values()))
+        if len(selected_states_meta) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(instance, session, selected_entity_ids, using_sqlite)
+            _purge_filtered_states(
+                instance, session, selected_states_meta, using_sqlite
+            )
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
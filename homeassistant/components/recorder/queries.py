@@ -4,21 +4,41 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    case,
+    delete,
+    distinct,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.sql.dml import Insert
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
 from .const import MAX_ROWS_TO_PURGE
 from .db_schema import (
+    MAX_LENGTH_LOGBOOK_ENTRY_ICON,
+    OLD_FORMAT_ATTRS_JSON,
+    OLD_STATE,
+    SHARED_ATTRS_JSON,
     EventData,
     Events,
+    EventTypes,
+    LogbookEntries,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
 
+UNIT_OF_MEASUREMENT_JSON_LIKE = '%"unit_of_measurement":%'
+
 
 def find_shared_attributes_id(
     data_hash: int, shared_attrs: str
@@ -40,6 +60,50 @@ def find_shared_data_id(attr_hash: int, shared_data: str) -> StatementLambdaElem
     )
 
 
+def find_event_type_id(event_type: str) -> StatementLambdaElement:
+    """Find an event_type_id by event_type."""
+    return lambda_stmt(
+        lambda: select(EventTypes.event_type_id).filter(
+            EventTypes.event_type == event_type
+        )
+    )
+
+
+def find_event_type_ids(event_types: Iterable[str]) -> StatementLambdaElement:
+    """Find event_type_ids by event_type."""
+    return lambda_stmt(
+        lambda: select(EventTypes.event_type_id, EventTypes.event_type).filter(
+            EventTypes.event_type.in_(event_types)
+        )
+    )
+
+
+def find_states_metadata_id(entity_id: str) -> StatementLambdaElement:
+    """Find a metadata_id by entity_id."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id).filter(StatesMeta.entity_id == entity_id)
+    )
+
+
+def find_states_metadata_ids(entity_ids: Iterable[str]) -> StatementLambdaElement:
+    """Find metadata_ids by entity_id."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id).filter(
+            StatesMeta.entity_id.in_(entity_ids)
+        )
+    )
+
+
+def find_all_states_metadata() -> StatementLambdaElement:
+    """Find all metadata_ids and entity_ids."""
+    return lambda_stmt(lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id))
+
+
+def find_all_event_types() -> StatementLambdaElement:
+    """Find all event_type_ids and event_types."""
+    return lambda_stmt(lambda: select(EventTypes.event_type_id, EventTypes.event_type))
+
+
 def _state_attrs_exist(attr: int | None) -> Select:
     """Check if a state attributes id exists in the states table."""
     return select(func.min(States.attributes_id)).where(States.attributes_id == attr)
@@ -513,6 +577,33 @@ def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def delete_logbook_entries_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
+    """Delete logbook_entries rows."""
+    return lambda_stmt(
+        lambda: delete(LogbookEntries)
+        .where(LogbookEntries.state_id.in_(state_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_meta_rows(metadata_ids: Iterable[int]) -> StatementLambdaElement:
+    """Delete states_meta rows."""
+    return lambda_stmt(
+        lambda: delete(StatesMeta)
+        .where(StatesMeta.metadata_id.in_(metadata_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_event_types_rows(event_type_ids: Iterable[int]) -> StatementLambdaElement:
+    """Delete event_types rows."""
+    return lambda_stmt(
+        lambda: delete(EventTypes)
+        .where(EventTypes.event_type_id.in_(event_type_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_data_rows(data_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete event_data rows."""
     return lambda_stmt(
@@ -580,18 +671,20 @@ def delete_recorder_runs_rows(
 
 def find_events_to_purge(purge_before: datetime) -> StatementLambdaElement:
     """Find events to purge."""
+    purge_before_ts = purge_before.timestamp()
     return lambda_stmt(
         lambda: select(Events.event_id, Events.data_id)
-        .filter(Events.time_fired < purge_before)
+        .filter(Events.time_fired_ts < purge_before_ts)
         .limit(MAX_ROWS_TO_PURGE)
     )
 
 
 def find_states_to_purge(purge_before: datetime) -> StatementLambdaElement:
     """Find states to purge."""
+    purge_before_ts = purge_before.timestamp()
     return lambda_stmt(
         lambda: select(States.state_id, States.attributes_id)
-        .filter(States.last_updated < purge_before)
+        .filter(States.last_updated_ts < purge_before_ts)
         .limit(MAX_ROWS_TO_PURGE)
     )
 
@@ -627,12 +720,13 @@ def find_legacy_event_state_and_attributes_and_data_ids_to_purge(
     purge_before: datetime,
 ) -> StatementLambdaElement:
     """Find the latest row in the legacy format to purge."""
+    purge_before_ts = purge_before.timestamp()
     return lambda_stmt(
         lambda: select(
             Events.event_id, Events.data_id, States.state_id, States.attributes_id
         )
         .outerjoin(States, Events.event_id == States.event_id)
-        .filter(Events.time_fired < purge_before)
+        .filter(Events.time_fired_ts < purge_before_ts)
         .limit(MAX_ROWS_TO_PURGE)
     )
 
@@ -640,3 +734,162 @@ def find_legacy_event_state_and_attributes_and_data_ids_to_purge(
 def find_legacy_row() -> StatementLambdaElement:
     """Check if there are still states in the table with an event_id."""
     return lambda_stmt(lambda: select(func.max(States.event_id)))
+
+
+def find_states_without_metadata_id(
+    start_state_id: int, end_state_id: int
+) -> StatementLambdaElement:
+    """Find the states in a range of state_ids not linked to states_meta yet."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.entity_id)
+        .filter(States.state_id >= start_state_id)
+        .filter(States.state_id < end_state_id)
+        .filter(States.metadata_id.is_(None))
+        .filter(States.entity_id.is_not(None))
+    )
+
+
+def find_events_without_event_type_id(
+    start_event_id: int, end_event_id: int
+) -> StatementLambdaElement:
+    """Find the events in a range of event_ids not linked to event_types yet."""
+    return lambda_stmt(
+        lambda: select(Events.event_id, Events.event_type)
+        .filter(Events.event_id >= start_event_id)
+        .filter(Events.event_id < end_event_id)
+        .filter(Events.event_type_id.is_(None))
+        .filter(Events.event_type.is_not(None))
+    )
+
+
+def find_states_without_timestamps(
+    start_state_id: int, end_state_id: int
+) -> StatementLambdaElement:
+    """Find the states in a range of state_ids without timestamps yet."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.last_updated, States.last_changed)
+        .filter(States.state_id >= start_state_id)
+        .filter(States.state_id < end_state_id)
+        .filter(States.last_updated_ts.is_(None))
+        .filter(States.last_updated.is_not(None))
+    )
+
+
+def find_events_without_timestamps(
+    start_event_id: int, end_event_id: int
+) -> StatementLambdaElement:
+    """Find the events in a range of event_ids without timestamps yet."""
+    return lambda_stmt(
+        lambda: select(Events.event_id, Events.time_fired)
+        .filter(Events.event_id >= start_event_id)
+        .filter(Events.event_id < end_event_id)
+        .filter(Events.time_fired_ts.is_(None))
+        .filter(Events.time_fired.is_not(None))
+    )
+
+
+def find_events_context_ids_to_migrate(
+    start_event_id: int, end_event_id: int
+) -> StatementLambdaElement:
+    """Find the events in a range of event_ids without binary context ids yet."""
+    return lambda_stmt(
+        lambda: select(
+            Events.event_id,
+            Events.context_id,
+            Events.context_user_id,
+            Events.context_parent_id,
+        )
+        .filter(Events.event_id >= start_event_id)
+        .filter(Events.event_id < end_event_id)
+        .filter(Events.context_id_bin.is_(None))
+        .filter(Events.context_id.is_not(None))
+    )
+
+
+def find_states_context_ids_to_migrate(
+    start_state_id: int, end_state_id: int
+) -> StatementLambdaElement:
+    """Find the states in a range of state_ids without binary context ids yet."""
+    return lambda_stmt(
+        lambda: select(
+            States.state_id,
+            States.context_id,
+            States.context_user_id,
+            States.context_parent_id,
+        )
+        .filter(States.state_id >= start_state_id)
+        .filter(States.state_id < end_state_id)
+        .filter(States.context_id_bin.is_(None))
+        .filter(States.context_id.is_not(None))
+    )
+
+
+def insert_logbook_entries_for_states(start_state_id: int, end_state_id: int) -> Insert:
+    """Insert the logbook entries of the states in a range of state_ids.
+
+    A state has a logbook entry when its value changed from the value of
+    its old state.
+    """
+    icon = func.coalesce(
+        SHARED_ATTRS_JSON["icon"].as_string(), OLD_FORMAT_ATTRS_JSON["icon"].as_string()
+    )
+    return insert(LogbookEntries).from_select(
+        ["state_id", "metadata_id", "last_updated_ts", "icon", "has_unit"],
+        select(
+            States.state_id,
+            States.metadata_id,
+            States.last_updated_ts,
+            case(
+                (func.length(icon) <= MAX_LENGTH_LOGBOOK_ENTRY_ICON, icon),
+                else_=None,
+            ),
+            case(
+                (
+                    StateAttributes.shared_attrs.like(UNIT_OF_MEASUREMENT_JSON_LIKE),
+                    True,
+                ),
+                (States.attributes.like(UNIT_OF_MEASUREMENT_JSON_LIKE), True),
+                else_=False,
+            ),
+        )
+        .join(OLD_STATE, States.old_state_id == OLD_STATE.state_id)
+        .outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+        .where((States.state_id >= start_state_id) & (States.state_id < end_state_id))
+        .where(States.state.is_not(None) & (States.state != OLD_STATE.state))
+        .where(
+            States.last_changed_ts.is_(None)
+            | (States.last_changed_ts == States.last_updated_ts)
+        ),
+    )
+
+
+def find_unused_states_metadata_ids(
+    metadata_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find which metadata_ids are no longer referenced by the states table."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id)
+        .filter(StatesMeta.metadata_id.in_(metadata_ids))
+        .filter(
+            ~select(States.state_id)
+            .filter(States.metadata_id == StatesMeta.metadata_id)
+            .exists()
+        )
+    )
+
+
+def find_unused_event_type_ids(
+    event_type_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find which event_type_ids are no longer referenced by the events table."""
+    return lambda_stmt(
+        lambda: select(EventTypes.event_type_id)
+        .filter(EventTypes.event_type_id.in_(event_type_ids))
+        .filter(
+            ~select(Events.event_id)
+            .filter(Events.event_type_id == EventTypes.event_type_id)
+            .exists()
+        )
+    )
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
@@ -49,7 +49,9 @@ from .const import DOMAIN, MAX_ROWS_TO_PURGE, SupportedDialect
 from .db_schema import (
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -93,6 +95,28 @@ QUERY_STATISTICS_SHORT_TERM = [
     StatisticsShortTerm.sum,
 ]
 
+QUERY_STATISTICS_DAILY = [
+    StatisticsDaily.metadata_id,
+    StatisticsDaily.start,
+    StatisticsDaily.mean,
+    StatisticsDaily.min,
+    StatisticsDaily.max,
+    StatisticsDaily.last_reset,
+    StatisticsDaily.state,
+    StatisticsDaily.sum,
+]
+
+QUERY_STATISTICS_MONTHLY = [
+    StatisticsMonthly.metadata_id,
+    StatisticsMonthly.start,
+    StatisticsMonthly.mean,
+    StatisticsMonthly.min,
+    StatisticsMonthly.max,
+    StatisticsMonthly.last_reset,
+    StatisticsMonthly.state,
+    StatisticsMonthly.sum,
+]
+
 QUERY_STATISTICS_SUMMARY_MEAN = [
     StatisticsShortTerm.metadata_id,
     func.avg(StatisticsShortTerm.mean),
@@ -137,6 +161,10 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 
+# The first schema version with the statistics_daily
+# and statistics_monthly tables
+ROLLUP_STATISTICS_SCHEMA_VERSION = 34
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -699,6 +727,8 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
         if start.minute == 55:
             # A full hour is ready, summarize it
             _compile_hourly_statistics(session, start)
+            # Summarize the day and month if the hour completed them
+            _compile_completed_rollup_statistics(session, start.replace(minute=0))
 
         session.add(StatisticsRuns(start=start))
 
@@ -707,7 +737,7 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
 def _adjust_sum_statistics(
     session: Session,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[StatisticsBase],
     metadata_id: int,
     start_time: datetime,
     adj: float,
@@ -1069,6 +1099,133 @@ def _reduce_statistics_per_month(
     return _reduce_statistics(stats, same_month, month_start_end, timedelta(days=31))
 
 
+ROLLUP_PERIODS: tuple[
+    tuple[
+        type[StatisticsDaily | StatisticsMonthly],
+        Callable[[datetime], tuple[datetime, datetime]],
+    ],
+    ...,
+] = ((StatisticsDaily, day_start_end), (StatisticsMonthly, month_start_end))
+
+
+def _first_hour(time: datetime) -> datetime:
+    """Return the start of the first hour starting at or after time."""
+    hour = time.replace(minute=0, second=0, microsecond=0)
+    return hour if hour == time else hour + timedelta(hours=1)
+
+
+def _rollup_statistics_rows(
+    stats: Iterable[Row],
+    period_start_end: Callable[[datetime], tuple[datetime, datetime]],
+) -> Iterator[tuple[int, StatisticData]]:
+    """Roll up hourly statistics sorted by metadata_id and start per period.
+
+    The values are reduced the same way _reduce_statistics reduces
+    them so the rolled up statistics can be used in its place.
+    """
+    for (metadata_id, period_start), group in groupby(
+        stats,
+        lambda stat: (
+            stat.metadata_id,
+            period_start_end(process_timestamp(stat.start))[0],
+        ),
+    ):
+        period_stats = list(group)
+        last_stat = period_stats[-1]
+        statistic: StatisticData = {
+            "start": _first_hour(period_start),
+            "last_reset": process_timestamp(last_stat.last_reset),
+        }
+        if mean_values := [stat.mean for stat in period_stats if stat.mean is not None]:
+            statistic["mean"] = mean(mean_values)
+        if min_values := [stat.min for stat in period_stats if stat.min is not None]:
+            statistic["min"] = min(min_values)
+        if max_values := [stat.max for stat in period_stats if stat.max is not None]:
+            statistic["max"] = max(max_values)
+        if last_stat.state is not None:
+            statistic["state"] = last_stat.state
+        if last_stat.sum is not None:
+            statistic["sum"] = last_stat.sum
+        yield metadata_id, statistic
+
+
+def _compile_rollup_statistics(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    rollup_periods: Iterable[
+        tuple[
+            type[StatisticsDaily | StatisticsMonthly],
+            Callable[[datetime], tuple[datetime, datetime]],
+        ]
+    ] = ROLLUP_PERIODS,
+) -> None:
+    """Replace the rolled up statistics for the periods in start_time - end_time.
+
+    start_time and end_time must be period boundaries of all the rollup_periods.
+    """
+    if metadata_ids is not None and not metadata_ids:
+        return
+    stmt = _statistics_during_period_stmt(start_time, end_time, metadata_ids)
+    stats = execute_stmt_lambda_element(session, stmt)
+    for table, period_start_end in rollup_periods:
+        query = session.query(table).filter(table.start >= start_time)
+        if end_time is not None:
+            query = query.filter(table.start < end_time)
+        if metadata_ids is not None:
+            query = query.filter(table.metadata_id.in_(metadata_ids))
+        query.delete(synchronize_session=False)
+        for metadata_id, statistic in _rollup_statistics_rows(stats, period_start_end):
+            session.add(table.from_stats(metadata_id, statistic))
+
+
+def _compile_completed_rollup_statistics(session: Session, start: datetime) -> None:
+    """Roll up the day and month completed by the hour starting at start."""
+    for table, period_start_end in ROLLUP_PERIODS:
+        period_start, period_end = period_start_end(start)
+        if start + timedelta(hours=1) < period_end:
+            continue
+        _LOGGER.debug(
+            "Compiling %s for %s-%s", table.__tablename__, period_start, period_end
+        )
+        _compile_rollup_statistics(
+            session, period_start, period_end, None, ((table, period_start_end),)
+        )
+
+
+def compile_rollup_statistics(session: Session, metadata_ids: list[int]) -> None:
+    """Compile the daily and monthly statistics from all hourly statistics."""
+    first_start = (
+        session.query(func.min(Statistics.start))
+        .filter(Statistics.metadata_id.in_(metadata_ids))
+        .scalar()
+    )
+    if first_start is None:
+        return
+    start_time, _ = month_start_end(process_timestamp(first_start))
+    _compile_rollup_statistics(session, start_time, None, metadata_ids)
+
+
+def _adjust_rollup_statistics(
+    session: Session, metadata_id: int, start_time: datetime, adj: float
+) -> None:
+    """Adjust the rolled up statistics after adjusting hourly statistics."""
+    for table, period_start_end in ROLLUP_PERIODS:
+        # Every hour of the periods starting after start_time was adjusted
+        _adjust_sum_statistics(session, table, metadata_id, start_time, adj)
+        period_start, period_end = period_start_end(start_time)
+        if _first_hour(period_start) < start_time:
+            # Only some of the hours of the period start_time is in were adjusted
+            _compile_rollup_statistics(
+                session,
+                period_start,
+                period_end,
+                [metadata_id],
+                ((table, period_start_end),),
+            )
+
+
 def _statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1113,6 +1270,116 @@ def _statistics_during_period_stmt_short_term(
     return stmt
 
 
+def _statistics_during_period_stmt_daily(
+    start_time: datetime,
+    end_time: datetime,
+    metadata_ids: list[int] | None,
+) -> StatementLambdaElement:
+    """Prepare a database query for daily statistics during a given period.
+
+    This prepares a lambda_stmt query, so we don't insert the parameters yet.
+    """
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_DAILY)
+        .filter(StatisticsDaily.start >= start_time)
+        .filter(StatisticsDaily.start < end_time)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(StatisticsDaily.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(StatisticsDaily.metadata_id, StatisticsDaily.start)
+    return stmt
+
+
+def _statistics_during_period_stmt_monthly(
+    start_time: datetime,
+    end_time: datetime,
+    metadata_ids: list[int] | None,
+) -> StatementLambdaElement:
+    """Prepare a database query for monthly statistics during a given period.
+
+    This prepares a lambda_stmt query, so we don't insert the parameters yet.
+    """
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_MONTHLY)
+        .filter(StatisticsMonthly.start >= start_time)
+        .filter(StatisticsMonthly.start < end_time)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(StatisticsMonthly.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(StatisticsMonthly.metadata_id, StatisticsMonthly.start)
+    return stmt
+
+
+def _get_statistics_with_rollups(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period: Literal["day", "week", "month"],
+) -> list[Row]:
+    """Return hourly statistics, rolled up where they cover a full period.
+
+    Periods which are completely inside start_time - end_time and have been
+    compiled are read from the daily or monthly statistics. The hourly
+    statistics are only read for the partial periods at the start and end.
+    """
+    hourly_stmt = _statistics_during_period_stmt(start_time, end_time, metadata_ids)
+    if get_instance(hass).schema_version < ROLLUP_STATISTICS_SCHEMA_VERSION or not (
+        last_run := session.query(func.max(StatisticsRuns.start)).scalar()
+    ):
+        return execute_stmt_lambda_element(session, hourly_stmt)
+
+    rollup_stmt: Callable[
+        [datetime, datetime, list[int] | None], StatementLambdaElement
+    ] = _statistics_during_period_stmt_daily
+    rollup_start_end = day_start_end
+    if period == "month":
+        rollup_stmt = _statistics_during_period_stmt_monthly
+        rollup_start_end = month_start_end
+    period_start_end = {
+        "day": day_start_end,
+        "week": week_start_end,
+        "month": month_start_end,
+    }[period]
+
+    # Hourly statistics are compiled up to the end of the hour of the last run
+    compiled_end = (process_timestamp(last_run) + timedelta(minutes=5)).replace(
+        minute=0
+    )
+    period_start, period_end = period_start_end(start_time)
+    if (rollup_start := _first_hour(period_start)) < start_time:
+        rollup_start = _first_hour(period_end)
+    rollup_end = _first_hour(
+        period_start_end(min(end_time, compiled_end) if end_time else compiled_end)[0]
+    )
+    if rollup_start >= rollup_end:
+        return execute_stmt_lambda_element(session, hourly_stmt)
+
+    rollup_stats = execute_stmt_lambda_element(
+        session, rollup_stmt(rollup_start, rollup_end, metadata_ids)
+    )
+    for stat in rollup_stats:
+        stat_start = process_timestamp(stat.start)
+        if stat_start != _first_hour(rollup_start_end(stat_start)[0]):
+            # The time zone changed after the statistics were rolled up
+            return execute_stmt_lambda_element(session, hourly_stmt)
+
+    stats = [
+        *execute_stmt_lambda_element(
+            session,
+            _statistics_during_period_stmt(start_time, rollup_start, metadata_ids),
+        ),
+        *rollup_stats,
+        *execute_stmt_lambda_element(
+            session,
+            _statistics_during_period_stmt(rollup_end, end_time, metadata_ids),
+        ),
+    ]
+    stats.sort(key=lambda stat: (stat.metadata_id, stat.start))
+    return stats
+
+
 def _get_max_mean_min_statistic_in_sub_period(
     session: Session,
     result: dict[str, float],
@@ -1514,10 +1781,16 @@ def statistics_during_period(
             stmt = _statistics_during_period_stmt_short_term(
                 start_time, end_time, metadata_ids
             )
+            stats = execute_stmt_lambda_element(session, stmt)
+        elif period in ("day", "week", "month"):
+            table = Statistics
+            stats = _get_statistics_with_rollups(
+                hass, session, start_time, end_time, metadata_ids, period
+            )
         else:
             table = Statistics
             stmt = _statistics_during_period_stmt(start_time, end_time, metadata_ids)
-        stats = execute_stmt_lambda_element(session, stmt)
+            stats = execute_stmt_lambda_element(session, stmt)
 
         if not stats:
             return {}
@@ -1966,7 +2239,9 @@ def import_statistics(
             session, statistic_ids=[metadata["statistic_id"]]
         )
         metadata_id = _update_or_add_metadata(session, metadata, old_metadata_dict)
+        starts: list[datetime] = []
         for stat in statistics:
+            starts.append(stat["start"])
             if stat_id := _statistics_exists(
                 session, table, metadata_id, stat["start"]
             ):
@@ -1974,6 +2249,15 @@ def import_statistics(
             else:
                 _insert_statistics(session, table, metadata_id, stat)
 
+        if table == Statistics and starts:
+            # Roll up the months the imported statistics are in again
+            _compile_rollup_statistics(
+                session,
+                month_start_end(min(starts))[0],
+                month_start_end(max(starts))[1],
+                [metadata_id],
+            )
+
     return True
 
 
@@ -2014,6 +2298,13 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_rollup_statistics(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0),
+            sum_adjustment,
+        )
+
     return True
 
 
@@ -2065,7 +2356,12 @@ def change_statistics_unit(
         metadata_id = metadata[0]
 
         convert = _get_unit_converter(old_unit, new_unit)
-        for table in (StatisticsShortTerm, Statistics):
+        for table in (
+            StatisticsShortTerm,
+            Statistics,
+            StatisticsDaily,
+            StatisticsMonthly,
+        ):
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
         session.query(StatisticsMeta).filter(
             StatisticsMeta.statistic_id == statistic_id
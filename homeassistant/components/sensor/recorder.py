@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterable, MutableMapping
+from collections.abc import Callable, Iterable, MutableMapping
 import datetime
 import itertools
 import logging
 import math
+import operator
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -86,7 +87,10 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
 
 
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    values: list[float],
+    timestamps: list[float],
+    start: datetime.datetime,
+    end: datetime.datetime,
 ) -> float:
     """Calculate a time weighted average.
 
@@ -94,33 +98,20 @@ def _time_weighted_average(
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    return accumulated / (end - start).total_seconds()
+    start_ts = start.timestamp()
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_times = [ts if ts > start_ts else start_ts for ts in timestamps]
+    # Each value is weighted by the duration until the next state change, the
+    # last value by the duration until the end of the period
+    durations = map(
+        operator.sub,
+        itertools.chain(itertools.islice(start_times, 1, None), (end.timestamp(),)),
+        start_times,
+    )
+    accumulated = sum(map(operator.mul, values, durations))
+    # The start time is adjusted if there was no last known state
+    return accumulated / (end.timestamp() - start_times[0])
 
 
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
@@ -141,7 +132,7 @@ def _equivalent_units(units: set[str | None]) -> bool:
 def _parse_float(state: str) -> float:
     """Parse a float string, throw on inf or nan."""
     fstate = float(state)
-    if math.isnan(fstate) or math.isinf(fstate):
+    if not math.isfinite(fstate):
         raise ValueError
     return fstate
 
@@ -215,6 +206,10 @@ def _normalize_states(
 
     for fstate, state in fstates:
         state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if state_unit == statistics_unit:
+            # Nothing to convert, which is the case for almost all states
+            valid_fstates.append((fstate, state))
+            continue
         # Exclude states with unsupported unit from statistics
         if state_unit not in converter.VALID_UNITS:
             if WARN_UNSUPPORTED_UNIT not in hass.data:
@@ -363,6 +358,27 @@ def _last_reset_as_utc_isoformat(last_reset_s: Any, entity_id: str) -> str | Non
     return dt_util.as_utc(last_reset).isoformat()
 
 
+def _memoized_last_reset_parser(entity_id: str) -> Callable[[Any], str | None]:
+    """Return a last_reset parser which remembers the valid last_resets it parsed.
+
+    The last_reset of a sensor rarely changes, so most states of a period have
+    the same last_reset.
+    """
+    parsed: dict[str, str] = {}
+
+    def _parse(last_reset_s: Any) -> str | None:
+        if not isinstance(last_reset_s, str):
+            return _last_reset_as_utc_isoformat(last_reset_s, entity_id)
+        if last_reset_s in parsed:
+            return parsed[last_reset_s]
+        last_reset = _last_reset_as_utc_isoformat(last_reset_s, entity_id)
+        if last_reset is not None:
+            parsed[last_reset_s] = last_reset
+        return last_reset
+
+    return _parse
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> statistics.PlatformCompiledStatistics:
@@ -391,6 +407,12 @@ def _compile_statistics(  # noqa: C901
     )
 
     # Get history between start and end
+    #
+    # The states are not loaded as bare value and timestamp columns: the unit
+    # of every state is needed to normalize it, and the sum statistics need the
+    # last_reset attribute and the states themselves for reset detection and
+    # its warnings. The LazyState rows only decode the attributes once per
+    # shared attributes row and the values are reduced to lists below.
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
@@ -492,14 +514,16 @@ def _compile_statistics(  # noqa: C901
         }
 
         # Make calculations
+        values = [fstate for fstate, _ in fstates]
         stat: StatisticData = {"start": start}
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
+            stat["max"] = max(values)
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
+            stat["min"] = min(values)
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(fstates, start, end)
+            timestamps = [state.last_updated.timestamp() for _, state in fstates]
+            stat["mean"] = _time_weighted_average(values, timestamps, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -511,70 +535,81 @@ def _compile_statistics(  # noqa: C901
                 new_state = old_state = last_stats[entity_id][0]["state"]
                 _sum = last_stats[entity_id][0]["sum"] or 0.0
 
-            for fstate, state in fstates:
-                reset = False
-                if (
-                    state_class != STATE_CLASS_TOTAL_INCREASING
-                    and (
-                        last_reset := _last_reset_as_utc_isoformat(
-                            state.attributes.get("last_reset"), entity_id
+            if (
+                state_class == STATE_CLASS_TOTAL_INCREASING
+                and new_state is not None
+                and 0 <= new_state <= values[0]
+                and all(map(operator.le, values, itertools.islice(values, 1, None)))
+            ):
+                # The sensor has compiled history and has only increased since,
+                # there is no reset to detect and nothing to warn about
+                new_state = values[-1]
+            else:
+                parse_last_reset = _memoized_last_reset_parser(entity_id)
+                for fstate, state in fstates:
+                    reset = False
+                    if (
+                        state_class != STATE_CLASS_TOTAL_INCREASING
+                        and (
+                            last_reset := parse_last_reset(
+                                state.attributes.get("last_reset")
+                            )
                         )
-                    )
-                    != old_last_reset
-                    and last_reset is not None
-                ):
-                    if old_state is None:
+                        != old_last_reset
+                        and last_reset is not None
+                    ):
+                        if old_state is None:
+                            _LOGGER.info(
+                                "Compiling initial sum statistics for %s, zero point set to %s",
+                                entity_id,
+                                fstate,
+                            )
+                        else:
+                            _LOGGER.info(
+                                "Detected new cycle for %s, last_reset set to %s (old last_reset %s)",
+                                entity_id,
+                                last_reset,
+                                old_last_reset,
+                            )
+                        reset = True
+                    elif old_state is None and last_reset is None:
+                        reset = True
                         _LOGGER.info(
                             "Compiling initial sum statistics for %s, zero point set to %s",
                             entity_id,
                             fstate,
                         )
+                    elif state_class == STATE_CLASS_TOTAL_INCREASING:
+                        try:
+                            if old_state is None or reset_detected(
+                                hass, entity_id, fstate, new_state, state
+                            ):
+                                reset = True
+                                _LOGGER.info(
+                                    "Detected new cycle for %s, value dropped from %s to %s, "
+                                    "triggered by state with last_updated set to %s",
+                                    entity_id,
+                                    new_state,
+                                    state.last_updated.isoformat(),
+                                    fstate,
+                                )
+                        except HomeAssistantError:
+                            continue
+
+                    if reset:
+                        # The sensor has been reset, update the sum
+                        if old_state is not None:
+                            _sum += new_state - old_state
+                        # ..and update the starting point
+                        new_state = fstate
+                        old_last_reset = last_reset
+                        # Force a new cycle for an existing sensor to start at 0
+                        if old_state is not None:
+                            old_state = 0.0
+                        else:
+                            old_state = new_state
                     else:
-                        _LOGGER.info(
-                            "Detected new cycle for %s, last_reset set to %s (old last_reset %s)",
-                            entity_id,
-                            last_reset,
-                            old_last_reset,
-                        )
-                    reset = True
-                elif old_state is None and last_reset is None:
-                    reset = True
-                    _LOGGER.info(
-                        "Compiling initial sum statistics for %s, zero point set to %s",
-                        entity_id,
-                        fstate,
-                    )
-                elif state_class == STATE_CLASS_TOTAL_INCREASING:
-                    try:
-                        if old_state is None or reset_detected(
-                            hass, entity_id, fstate, new_state, state
-                        ):
-                            reset = True
-                            _LOGGER.info(
-                                "Detected new cycle for %s, value dropped from %s to %s, "
-                                "triggered by state with last_updated set to %s",
-                                entity_id,
-                                new_state,
-                                state.last_updated.isoformat(),
-                                fstate,
-                            )
-                    except HomeAssistantError:
-                        continue
-
-                if reset:
-                    # The sensor has been reset, update the sum
-                    if old_state is not None:
-                        _sum += new_state - old_state
-                    # ..and update the starting point
-                    new_state = fstate
-                    old_last_reset = last_reset
-                    # Force a new cycle for an existing sensor to start at 0
-                    if old_state is not None:
-                        old_state = 0.0
-                    else:
-                        old_state = new_state
-                else:
-                    new_state = fstate
+                        new_state = fstate
 
             if new_state is None or old_state is None:
                 # No valid updates
@@ -34,9 +34,11 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_KEYFRAME_EXECUTOR,
     ATTR_SETTINGS,
     ATTR_STREAMS,
     CONF_EXTRA_PART_WAIT_TIME,
@@ -48,6 +50,7 @@ from .const import (
     DOMAIN,
     FORMAT_CONTENT_TYPE,
     HLS_PROVIDER,
+    KEYFRAME_DECODE_WORKERS,
     MAX_SEGMENTS,
     OUTPUT_FORMATS,
     OUTPUT_IDLE_TIMEOUT,
@@ -218,6 +221,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = []
+    # Decode keyframes for all streams in a bounded pool, so image requests
+    # for many cameras can't saturate the default executor
+    keyframe_executor = InterruptibleThreadPoolExecutor(
+        max_workers=KEYFRAME_DECODE_WORKERS, thread_name_prefix="StreamKeyFrame"
+    )
+    hass.data[DOMAIN][ATTR_KEYFRAME_EXECUTOR] = keyframe_executor
     conf = DOMAIN_SCHEMA(config.get(DOMAIN, {}))
     if conf[CONF_LL_HLS]:
         assert isinstance(conf[CONF_SEGMENT_DURATION], float)
@@ -251,6 +260,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ]:
             await asyncio.wait(awaitables)
         _LOGGER.debug("Stopped stream workers")
+        # Late image requests fall back to the shared executor once this is gone
+        hass.data[DOMAIN].pop(ATTR_KEYFRAME_EXECUTOR, None)
+        await hass.async_add_executor_job(keyframe_executor.shutdown)
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
 
@@ -281,7 +293,10 @@ class Stream:
         self._thread_quit = threading.Event()
         self._outputs: dict[str, StreamOutput] = {}
         self._fast_restart_once = False
-        self._keyframe_converter = KeyFrameConverter(hass, stream_settings)
+        self._diagnostics = Diagnostics()
+        self._keyframe_converter = KeyFrameConverter(
+            hass, stream_settings, self._diagnostics
+        )
         self._available: bool = True
         self._update_callback: Callable[[], None] | None = None
         self._logger = (
@@ -289,7 +304,6 @@ class Stream:
             if stream_label
             else _LOGGER
         )
-        self._diagnostics = Diagnostics()
 
     @property
     def orientation(self) -> int:
@@ -536,8 +550,8 @@ class Stream:
         Fetch an image from the Stream and return it as a jpeg in bytes.
 
         Calls async_get_image from KeyFrameConverter. async_get_image should only be
-        called directly from the main loop and not from an executor thread as it uses
-        hass.add_executor_job underneath the hood.
+        called directly from the main loop and not from an executor thread as it
+        schedules the decoding in the keyframe executor underneath the hood.
         """
 
         self.add_provider(HLS_PROVIDER)
@@ -2,6 +2,7 @@
 DOMAIN = "stream"
 
 ATTR_ENDPOINTS = "endpoints"
+ATTR_KEYFRAME_EXECUTOR = "keyframe_executor"
 ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
 
@@ -35,6 +36,7 @@ MAX_TIMESTAMP_GAP = 10000  # seconds - anything from 10 to 50000 is probably rea
 
 MAX_MISSING_DTS = 6  # Number of packets missing DTS to allow
 SOURCE_TIMEOUT = 30  # Timeout for reading stream source
+KEYFRAME_DECODE_WORKERS = 2  # Threads shared by all streams to decode keyframes
 
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
 STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
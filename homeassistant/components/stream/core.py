@@ -6,6 +6,7 @@ from collections import deque
 from collections.abc import Callable, Coroutine, Iterable
 import datetime
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -19,6 +20,7 @@ from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
 from .const import (
+    ATTR_KEYFRAME_EXECUTOR,
     ATTR_STREAMS,
     DOMAIN,
     SEGMENT_DURATION_ADJUSTER,
@@ -29,6 +31,7 @@ if TYPE_CHECKING:
     from av import CodecContext, Packet
 
     from . import Stream
+    from .diagnostics import Diagnostics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -128,6 +131,10 @@ class Segment:
         """Return reconstructed data for all parts as bytes, without init."""
         return b"".join([part.data for part in self.parts])
 
+    def get_data_with_init(self) -> bytes:
+        """Return reconstructed data for all parts as bytes, with init."""
+        return b"".join([self.init, *(part.data for part in self.parts)])
+
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
 
@@ -406,14 +413,20 @@ class KeyFrameConverter:
     An overview of the thread and state interaction:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
-        get_image schedules _generate_image in an executor thread
+        get_image schedules _generate_image in the keyframe executor of all streams
         _generate_image will try to create an image from the packet
         _generate_image will clear the packet, so there will only be one attempt per packet
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+    Requests made while there is no new packet return the previous image at once
     """
 
-    def __init__(self, hass: HomeAssistant, stream_settings: StreamSettings) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        stream_settings: StreamSettings,
+        diagnostics: Diagnostics | None = None,
+    ) -> None:
         """Initialize."""
 
         # Keep import here so that we can import stream integration without installing reqs
@@ -427,6 +440,8 @@ class KeyFrameConverter:
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
         self._stream_settings = stream_settings
+        self._diagnostics = diagnostics
+        self._requests_waiting = 0
 
     def create_codec_context(self, codec_context: CodecContext) -> None:
         """
@@ -493,6 +508,35 @@ class KeyFrameConverter:
             )
             self._image = bytes(self._turbojpeg.encode(bgr_array))
 
+    def _update_requests_waiting(self, delta: int) -> None:
+        """Update the number of image requests waiting for a decode."""
+        self._requests_waiting += delta
+        if self._diagnostics:
+            self._diagnostics.set_value(
+                "keyframe_requests_waiting", self._requests_waiting
+            )
+
+    async def _async_generate_image(
+        self, width: int | None, height: int | None
+    ) -> None:
+        """Generate the keyframe image in the keyframe executor.
+
+        The keyframe executor is removed when Home Assistant stops, any request
+        arriving after that runs in the shared executor instead.
+        """
+        start = time.monotonic()
+        if executor := self._hass.data.get(DOMAIN, {}).get(ATTR_KEYFRAME_EXECUTOR):
+            await self._hass.loop.run_in_executor(
+                executor, self._generate_image, width, height
+            )
+        else:
+            await self._hass.async_add_executor_job(self._generate_image, width, height)
+        if self._diagnostics:
+            self._diagnostics.increment("keyframe_decode")
+            self._diagnostics.set_value(
+                "keyframe_decode_seconds", round(time.monotonic() - start, 3)
+            )
+
     async def async_get_image(
         self,
         width: int | None = None,
@@ -500,7 +544,20 @@ class KeyFrameConverter:
     ) -> bytes | None:
         """Fetch an image from the Stream and return it as a jpeg in bytes."""
 
-        # Use a lock to ensure only one thread is working on the keyframe at a time
-        async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+        if self.packet is None and not self._lock.locked():
+            # Nothing new to decode, skip the trip to the executor
+            return self._image
+
+        self._update_requests_waiting(1)
+        try:
+            # Use a lock to ensure only one thread is working on the keyframe at a time
+            await self._lock.acquire()
+        finally:
+            self._update_requests_waiting(-1)
+        try:
+            # Requests waiting on the same packet are served by a single decode
+            if self.packet is not None:
+                await self._async_generate_image(width, height)
+        finally:
+            self._lock.release()
         return self._image
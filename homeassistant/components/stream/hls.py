@@ -415,9 +415,16 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
+        # Write the parts out one by one instead of joining them into a copy of
+        # the segment. The segment may still be growing, so work from a snapshot
+        parts = list(segment.parts)
+        response = web.StreamResponse(
             headers={
                 "Content-Type": "video/iso.segment",
             },
         )
+        response.content_length = sum(len(part.data) for part in parts)
+        await response.prepare(request)
+        for part in parts:
+            await response.write(part.data)
+        return response
@@ -112,7 +112,7 @@ def _get_debug_traces(hass: HomeAssistant, key: str) -> list[dict[str, Any]]:
 
     if traces_for_key := _get_data(hass).get(key):
         for trace in traces_for_key.values():
-            traces.append(trace.as_short_dict())
+            traces.append({**trace.as_short_dict(), "size": trace.approximate_size()})
 
     return traces
 
@@ -4,9 +4,11 @@ from __future__ import annotations
 import abc
 from collections import deque
 import datetime as dt
+import json
 from typing import Any
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -24,6 +26,20 @@ class BaseTrace(abc.ABC):
     context: Context
     key: str
     run_id: str
+    _size: int | None = None
+
+    def approximate_size(self) -> int:
+        """Return the approximate size of this trace in bytes.
+
+        This is the length of the trace serialized the way it is stored, it is
+        worked out when first asked for and kept once the trace has stopped.
+        """
+        if self._size is not None:
+            return self._size
+        size = len(json.dumps(self.as_extended_dict(), cls=ExtendedJSONEncoder))
+        if self.as_short_dict()["state"] == "stopped":
+            self._size = size
+        return size
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
@@ -46,6 +46,7 @@ from homeassistant.util.json import (
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
+from .entity_subscriptions import async_get_entity_subscriptions
 
 
 @callback
@@ -243,35 +244,33 @@ def handle_get_states(
     """Handle get states command."""
     states = _async_get_allowed_states(hass, connection)
 
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.result_message(msg["id"], states)
-    try:
-        connection.send_message(JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
+    # JSON serialize each state on its own so we can recover if it blows up
+    # due to the state machine containing unserializable data. This command
+    # is required to succeed for the UI to show. The JSON is cached on the
+    # state objects so it is shared with the other connections.
+    serialized_states = []
+    serialize_failed = False
+    for state in states:
+        try:
+            serialized_states.append(state.as_dict_json())
+        except (ValueError, TypeError):
+            serialize_failed = True
+
+    if serialize_failed:
         connection.logger.error(
             "Unable to serialize to JSON. Bad data found at %s",
             format_unserializable_data(
-                find_paths_unserializable_data(response, dump=JSON_DUMP)
+                find_paths_unserializable_data(
+                    messages.result_message(msg["id"], states), dump=JSON_DUMP
+                )
             ),
         )
-    del response
-
-    # If we can't serialize, we'll filter out unserializable states
-    serialized = []
-    for state in states:
-        try:
-            serialized.append(JSON_DUMP(state))
-        except (ValueError, TypeError):
-            # Error is already logged above
-            pass
 
-    # We now have partially serialized states. Craft some JSON.
-    response2 = JSON_DUMP(messages.result_message(msg["id"], ["TO_REPLACE"]))
-    response2 = response2.replace('"TO_REPLACE"', ", ".join(serialized))
-    connection.send_message(response2)
+    # Craft the JSON from the serialized states
+    response = JSON_DUMP(messages.result_message(msg["id"], ["TO_REPLACE"]))
+    connection.send_message(
+        response.replace('"TO_REPLACE"', ",".join(serialized_states), 1)
+    )
 
 
 @callback
@@ -287,64 +286,56 @@ def handle_subscribe_entities(
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
 
-    @callback
-    def forward_entity_changes(event: Event) -> None:
-        """Forward entity state changed events to websocket."""
-        if not connection.user.permissions.check_entity(
-            event.data["entity_id"], POLICY_READ
-        ):
-            return
-        if entity_ids and event.data["entity_id"] not in entity_ids:
-            return
-
-        connection.send_message(
-            lambda: messages.cached_state_diff_message(msg["id"], event)
-        )
-
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
-    )
+    connection.subscriptions[msg["id"]] = async_get_entity_subscriptions(
+        hass
+    ).async_subscribe(connection, msg["id"], entity_ids)
     connection.send_result(msg["id"])
-    data: dict[str, dict[str, dict]] = {
-        messages.ENTITY_EVENT_ADD: {
-            state.entity_id: messages.compressed_state_dict_add(state)
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        }
-    }
 
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.event_message(msg["id"], data)
-    try:
-        connection.send_message(JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
+    # JSON serialize each state on its own so we can recover if it blows up
+    # due to the state machine containing unserializable data. This command
+    # is required to succeed for the UI to show.
+    serialized_states = []
+    cannot_serialize: list[State] = []
+    for state in states:
+        if entity_ids and state.entity_id not in entity_ids:
+            continue
+        try:
+            serialized_states.append(
+                f'"{state.entity_id}":{state.as_compressed_state_json()}'
+            )
+        except (ValueError, TypeError):
+            cannot_serialize.append(state)
+
+    if cannot_serialize:
         connection.logger.error(
             "Unable to serialize to JSON. Bad data found at %s",
             format_unserializable_data(
-                find_paths_unserializable_data(response, dump=JSON_DUMP)
+                find_paths_unserializable_data(
+                    messages.event_message(
+                        msg["id"],
+                        {
+                            messages.ENTITY_EVENT_ADD: {
+                                state.entity_id: state.as_compressed_state()
+                                for state in cannot_serialize
+                            }
+                        },
+                    ),
+                    dump=JSON_DUMP,
+                )
             ),
         )
-    del response
-
-    add_entities = data[messages.ENTITY_EVENT_ADD]
-    cannot_serialize: list[str] = []
-    for entity_id, state_dict in add_entities.items():
-        try:
-            JSON_DUMP(state_dict)
-        except (ValueError, TypeError):
-            cannot_serialize.append(entity_id)
-
-    for entity_id in cannot_serialize:
-        del add_entities[entity_id]
 
-    connection.send_message(JSON_DUMP(messages.event_message(msg["id"], data)))
+    # Craft the JSON from the serialized states
+    response = JSON_DUMP(
+        messages.event_message(msg["id"], {messages.ENTITY_EVENT_ADD: "TO_REPLACE"})
+    )
+    connection.send_message(
+        response.replace('"TO_REPLACE"', "{" + ",".join(serialized_states) + "}", 1)
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -0,0 +1,124 @@
+"""Shared fan-out of state changes to subscribe_entities connections."""
+from __future__ import annotations
+
+from typing import Final
+
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from . import messages
+from .connection import ActiveConnection
+from .const import DOMAIN
+
+DATA_ENTITY_SUBSCRIPTIONS: Final = f"{DOMAIN}.entity_subscriptions"
+
+
+class EntitySubscriber:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = ("connection", "iden", "entity_ids")
+
+    def __init__(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> None:
+        """Initialize the subscriber."""
+        self.connection = connection
+        self.iden = str(msg_id).encode()
+        self.entity_ids = entity_ids
+
+
+class EntitySubscriptions:
+    """Dispatch state changes to every subscribe_entities subscription.
+
+    A single state_changed listener is shared by all connections. The
+    state diff is serialized once per state change and the permission
+    check is done once per distinct set of permissions, so adding more
+    connections only adds the cost of writing the bytes to them.
+    """
+
+    __slots__ = ("hass", "_all_entities", "_by_entity_id", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the entity subscriptions."""
+        self.hass = hass
+        self._all_entities: list[EntitySubscriber] = []
+        self._by_entity_id: dict[str, list[EntitySubscriber]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to state changes of entity_ids or all entities."""
+        subscriber = EntitySubscriber(connection, msg_id, entity_ids)
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, []).append(subscriber)
+        else:
+            self._all_entities.append(subscriber)
+
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscriber."""
+            self._async_remove(subscriber)
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_remove(self, subscriber: EntitySubscriber) -> None:
+        """Remove a subscriber and stop listening once there are none left."""
+        if subscriber.entity_ids:
+            for entity_id in subscriber.entity_ids:
+                subscribers = self._by_entity_id[entity_id]
+                subscribers.remove(subscriber)
+                if not subscribers:
+                    del self._by_entity_id[entity_id]
+        else:
+            self._all_entities.remove(subscriber)
+
+        if not self._all_entities and not self._by_entity_id and self._unsub:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Fan out a state change to the subscribers that may read it."""
+        entity_id: str = event.data["entity_id"]
+        if entity_subscribers := self._by_entity_id.get(entity_id):
+            subscribers = self._all_entities + entity_subscribers
+        elif self._all_entities:
+            subscribers = self._all_entities[:]
+        else:
+            return
+
+        template: bytes | None = None
+        # Connections of the same user share a permissions object and
+        # all owners share one so the check is done once per object
+        can_read: dict[int, bool] = {}
+        for subscriber in subscribers:
+            permissions = subscriber.connection.user.permissions
+            if (allowed := can_read.get(id(permissions))) is None:
+                allowed = can_read[id(permissions)] = permissions.check_entity(
+                    entity_id, POLICY_READ
+                )
+            if not allowed:
+                continue
+            if template is None:
+                template = messages.cached_state_diff_message_template(event)
+            subscriber.connection.send_message(
+                template.replace(messages.IDEN_JSON_TEMPLATE_BYTES, subscriber.iden, 1)
+            )
+
+
+@callback
+def async_get_entity_subscriptions(hass: HomeAssistant) -> EntitySubscriptions:
+    """Return the shared entity subscriptions."""
+    if (subscriptions := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        subscriptions = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = EntitySubscriptions(hass)
+    return subscriptions
@@ -5,6 +5,7 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import datetime as dt
+from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
 
@@ -31,7 +32,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import message_to_json_bytes
 
 if TYPE_CHECKING:
     from .connection import ActiveConnection
@@ -81,12 +82,19 @@ class WebSocketHandler:
         to_write = self._to_write
         logger = self._logger
         wsock = self.wsock
+        # Messages are sent as text frames. send_str only accepts str so use
+        # the writer directly which also accepts the json bytes as they are
+        # instead of decoding them to a str just to encode them again.
+        # pylint: disable-next=protected-access
+        send_text = partial(wsock._writer.send, binary=False)  # type: ignore[union-attr]
         try:
             with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
                 while not self.wsock.closed:
                     if (process := await to_write.get()) is None:
                         return
-                    message = process if isinstance(process, str) else process()
+                    message = (
+                        process if isinstance(process, (bytes, str)) else process()
+                    )
 
                     if (
                         to_write.empty()
@@ -95,20 +103,24 @@ class WebSocketHandler:
                         not in self.connection.supported_features
                     ):
                         logger.debug("Sending %s", message)
-                        await wsock.send_str(message)
+                        await send_text(message)
                         continue
 
-                    messages: list[str] = [message]
+                    messages: list[bytes] = [_message_to_bytes(message)]
                     while not to_write.empty():
                         if (process := to_write.get_nowait()) is None:
                             return
                         messages.append(
-                            process if isinstance(process, str) else process()
+                            _message_to_bytes(
+                                process
+                                if isinstance(process, (bytes, str))
+                                else process()
+                            )
                         )
 
-                    coalesced_messages = "[" + ",".join(messages) + "]"
+                    coalesced_messages = b"[" + b",".join(messages) + b"]"
                     self._logger.debug("Sending %s", coalesced_messages)
-                    await self.wsock.send_str(coalesced_messages)
+                    await send_text(coalesced_messages)
         finally:
             # Clean up the peaker checker when we shut down the writer
             if self._peak_checker_unsub is not None:
@@ -116,7 +128,10 @@ class WebSocketHandler:
                 self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any] | Callable[[], str]) -> None:
+    def _send_message(
+        self,
+        message: bytes | str | dict[str, Any] | Callable[[], bytes | str],
+    ) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -124,7 +139,7 @@ class WebSocketHandler:
         Async friendly.
         """
         if isinstance(message, dict):
-            message = message_to_json(message)
+            message = message_to_json_bytes(message)
 
         try:
             self._to_write.put_nowait(message)
@@ -295,3 +310,8 @@ class WebSocketHandler:
                 async_dispatcher_send(self.hass, SIGNAL_WEBSOCKET_DISCONNECTED)
 
         return wsock
+
+
+def _message_to_bytes(message: bytes | str) -> bytes:
+    """Return the message as bytes."""
+    return message if isinstance(message, bytes) else message.encode("utf-8")
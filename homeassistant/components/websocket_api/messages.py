@@ -7,23 +7,24 @@ from typing import Any, Final
 
 import voluptuous as vol
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, json_bytes
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
 )
+from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.yaml.loader import JSON_TYPE
 
 from . import const
-from .const import (
-    COMPRESSED_STATE_ATTRIBUTES,
-    COMPRESSED_STATE_CONTEXT,
-    COMPRESSED_STATE_LAST_CHANGED,
-    COMPRESSED_STATE_LAST_UPDATED,
-    COMPRESSED_STATE_STATE,
-)
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
+IDEN_JSON_TEMPLATE_BYTES: Final = b'"__IDEN__"'
 
 STATE_DIFF_ADDITIONS = "+"
 STATE_DIFF_REMOVALS = "-"
@@ -67,7 +69,7 @@ def event_message(iden: JSON_TYPE | int, event: Any) -> dict[str, Any]:
     return {"id": iden, "type": "event", "event": event}
 
 
-def cached_event_message(iden: int, event: Event) -> str:
+def cached_event_message(iden: int, event: Event) -> bytes:
     """Return an event message.
 
     Serialize to json once per message.
@@ -76,20 +78,22 @@ def cached_event_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    return _cached_event_message(event).replace(
+        IDEN_JSON_TEMPLATE_BYTES, str(iden).encode(), 1
+    )
 
 
 @lru_cache(maxsize=128)
-def _cached_event_message(event: Event) -> str:
+def _cached_event_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
 
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    return message_to_json_bytes(event_message(IDEN_TEMPLATE, event))
 
 
-def cached_state_diff_message(iden: int, event: Event) -> str:
+def cached_state_diff_message(iden: int, event: Event) -> bytes:
     """Return an event message.
 
     Serialize to json once per message.
@@ -98,17 +102,28 @@ def cached_state_diff_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    return _cached_state_diff_message(event).replace(
+        IDEN_JSON_TEMPLATE_BYTES, str(iden).encode(), 1
+    )
+
+
+def cached_state_diff_message_template(event: Event) -> bytes:
+    """Return the serialized state diff message of an event.
+
+    The id of the message is IDEN_JSON_TEMPLATE_BYTES which
+    must be replaced with the iden of each subscription.
+    """
+    return _cached_state_diff_message(event)
 
 
 @lru_cache(maxsize=128)
-def _cached_state_diff_message(event: Event) -> str:
+def _cached_state_diff_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
 
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
+    return message_to_json_bytes(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
 
 
 def _state_diff_event(event: Event) -> dict:
@@ -169,32 +184,29 @@ def _state_diff(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
-def compressed_state_dict_add(state: State) -> dict[str, Any]:
+def compressed_state_dict_add(state: State) -> ReadOnlyDict[str, Any]:
     """Build a compressed dict of a state for adds.
 
     Omits the lu (last_updated) if it matches (lc) last_changed.
 
     Sends c (context) as a string if it only contains an id.
     """
-    if state.context.parent_id is None and state.context.user_id is None:
-        context: dict[str, Any] | str = state.context.id
-    else:
-        context = state.context.as_dict()
-    compressed_state: dict[str, Any] = {
-        COMPRESSED_STATE_STATE: state.state,
-        COMPRESSED_STATE_ATTRIBUTES: state.attributes,
-        COMPRESSED_STATE_CONTEXT: context,
-        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
-    }
-    if state.last_changed != state.last_updated:
-        compressed_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
-    return compressed_state
+    return state.as_compressed_state()
 
 
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
+    return message_to_json_bytes(message).decode("utf-8")
+
+
+def message_to_json_bytes(message: dict[str, Any]) -> bytes:
+    """Serialize a websocket message to json bytes.
+
+    The websocket writer sends the bytes as they are so
+    there is no need to decode them to a str first.
+    """
     try:
-        return JSON_DUMP(message)
+        return json_bytes(message)
     except (ValueError, TypeError):
         _LOGGER.error(
             "Unable to serialize to JSON. Bad data found at %s",
@@ -202,7 +214,7 @@ def message_to_json(message: dict[str, Any]) -> str:
                 find_paths_unserializable_data(message, dump=JSON_DUMP)
             ),
         )
-        return JSON_DUMP(
+        return json_bytes(
             error_message(
                 message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
             )
@@ -407,6 +407,9 @@ class Strobe(t.enum8):
 
 STARTUP_FAILURE_DELAY_S = 3
 STARTUP_RETRIES = 3
+# Limit the number of devices refreshed from the network at the same time so
+# background refreshes leave room on the radio for user initiated requests
+STARTUP_REFRESH_CONCURRENCY = 4
 
 EZSP_OVERWRITE_EUI64 = (
     "i_understand_i_can_update_eui64_only_once_and_i_still_want_to_do_it"
@@ -146,6 +146,7 @@ class ZHADevice(LogMixin):
             )
         )
         self.status: DeviceStatus = DeviceStatus.CREATED
+        self.refresh_latency: float | None = None
         self._channels = channels.Channels(self)
 
     @property
@@ -498,7 +499,10 @@ class ZHADevice(LogMixin):
     async def async_initialize(self, from_cache: bool = False) -> None:
         """Initialize channels."""
         self.debug("started initialization")
+        start = time.monotonic()
         await self._channels.async_initialize(from_cache)
+        if not from_cache:
+            self.refresh_latency = time.monotonic() - start
         self.debug("power source: %s", self.power_source)
         self.status = DeviceStatus.INITIALIZED
         self.debug("completed initialization")
@@ -61,6 +61,7 @@ from .const import (
     SIGNAL_GROUP_MEMBERSHIP_CHANGE,
     SIGNAL_REMOVE,
     STARTUP_FAILURE_DELAY_S,
+    STARTUP_REFRESH_CONCURRENCY,
     STARTUP_RETRIES,
     UNKNOWN_MANUFACTURER,
     UNKNOWN_MODEL,
@@ -143,6 +144,9 @@ class ZHAGateway:
         self.config_entry = config_entry
         self._unsubs: list[Callable[[], None]] = []
         self.initialized: bool = False
+        self._refresh_semaphore = asyncio.Semaphore(STARTUP_REFRESH_CONCURRENCY)
+        self.refreshes_queued: int = 0
+        self.refreshes_in_flight: int = 0
 
     async def async_initialize(self) -> None:
         """Initialize controller and connect radio."""
@@ -237,17 +241,36 @@ class ZHAGateway:
         async def fetch_updated_state() -> None:
             """Fetch updated state for mains powered devices."""
             _LOGGER.debug("Fetching current state for mains powered devices")
-            await asyncio.gather(
-                *(
-                    dev.async_initialize(from_cache=False)
-                    for dev in self.devices.values()
-                    if dev.is_mains_powered
-                )
+            # Refresh devices which are expected to respond first, so devices
+            # which will time out don't hold up the rest of the network
+            devices = sorted(
+                (dev for dev in self.devices.values() if dev.is_mains_powered),
+                key=lambda dev: not dev.available,
             )
+            await asyncio.gather(*(self._async_refresh_device(dev) for dev in devices))
 
         # background the fetching of state for mains powered devices
         asyncio.create_task(fetch_updated_state())
 
+    async def _async_refresh_device(self, zha_device: ZHADevice) -> None:
+        """Fetch the current state of a device in the background.
+
+        At most STARTUP_REFRESH_CONCURRENCY devices are refreshed at the same
+        time. Requests made on behalf of the user don't go through this limit.
+        """
+        self.refreshes_queued += 1
+        try:
+            await self._refresh_semaphore.acquire()
+        finally:
+            self.refreshes_queued -= 1
+
+        self.refreshes_in_flight += 1
+        try:
+            await zha_device.async_initialize(from_cache=False)
+        finally:
+            self.refreshes_in_flight -= 1
+            self._refresh_semaphore.release()
+
     def device_joined(self, device: zigpy.device.Device) -> None:
         """Handle device joined.
 
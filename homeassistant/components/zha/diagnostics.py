@@ -50,6 +50,7 @@ KEYS_TO_REDACT = {
 
 ATTRIBUTES = "attributes"
 CLUSTER_DETAILS = "cluster_details"
+REFRESH_LATENCY = "refresh_latency"
 UNSUPPORTED_ATTRIBUTES = "unsupported_attributes"
 
 
@@ -78,6 +79,10 @@ async def async_get_config_entry_diagnostics(
             "config": config,
             "config_entry": config_entry.as_dict(),
             "application_state": shallow_asdict(gateway.application_controller.state),
+            "device_refresh": {
+                "queued": gateway.refreshes_queued,
+                "in_flight": gateway.refreshes_in_flight,
+            },
             "versions": {
                 "bellows": bellows.__version__,
                 "zigpy": zigpy.__version__,
@@ -99,6 +104,7 @@ async def async_get_device_diagnostics(
     zha_device: ZHADevice = async_get_zha_device(hass, device.id)
     device_info: dict[str, Any] = zha_device.zha_device_info
     device_info[CLUSTER_DETAILS] = get_endpoint_cluster_attr_data(zha_device)
+    device_info[REFRESH_LATENCY] = zha_device.refresh_latency
     return async_redact_data(device_info, KEYS_TO_REDACT)
 
 
@@ -49,6 +49,11 @@ from .const import (
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     EVENT_CALL_SERVICE,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_CLOSE,
@@ -854,6 +859,8 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        # EVENT_STATE_CHANGED listeners indexed by entity_id
+        self._state_changed_listeners: dict[str, list[_FilterableJob]] = {}
         self._hass = hass
 
     @callback
@@ -862,7 +869,18 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        if self._state_changed_listeners:
+            # A listener can be registered for multiple entities
+            entity_listeners = {
+                filterable_job
+                for filterable_jobs in self._state_changed_listeners.values()
+                for filterable_job in filterable_jobs
+            }
+            listeners[EVENT_STATE_CHANGED] = listeners.get(
+                EVENT_STATE_CHANGED, 0
+            ) + len(entity_listeners)
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -906,12 +924,25 @@ class EventBus:
         if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
+        entity_listeners: list[_FilterableJob] | None = None
+        if (
+            event_type == EVENT_STATE_CHANGED
+            and self._state_changed_listeners
+            and event_data is not None
+        ):
+            entity_listeners = self._state_changed_listeners.get(
+                event_data.get("entity_id")  # type: ignore[arg-type]
+            )
+
         event = Event(event_type, event_data, origin, time_fired, context)
         if not event.context.origin_event:
             event.context.origin_event = event
 
         _LOGGER.debug("Bus:Handling %s", event)
 
+        if entity_listeners:
+            self._async_fire_state_changed(entity_listeners[:], event)
+
         if not listeners:
             return
 
@@ -931,6 +962,44 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_fire_state_changed(
+        self, entity_listeners: list[_FilterableJob], event: Event
+    ) -> None:
+        """Run the state changed listeners of the entity of an event."""
+        scheduled = False
+        for job, _, run_immediately in entity_listeners:
+            if run_immediately:
+                try:
+                    job.target(event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error running job: %s", job)
+            elif not scheduled:
+                # Schedule all the other listeners of the entity together
+                scheduled = True
+                self._hass.loop.call_soon(self._async_run_state_changed_jobs, event)
+
+    @callback
+    def _async_run_state_changed_jobs(self, event: Event) -> None:
+        """Run the scheduled state changed listeners of an entity.
+
+        The listeners are looked up when they are run so listeners added
+        after the event was fired still see it.
+        """
+        entity_id = event.data["entity_id"]
+        if not (entity_listeners := self._state_changed_listeners.get(entity_id)):
+            return
+
+        for job, _, run_immediately in entity_listeners[:]:
+            if run_immediately:
+                continue
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing state change for %s", entity_id
+                )
+
     def listen(
         self,
         event_type: str,
@@ -994,6 +1063,66 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_state_changed(
+        self,
+        entity_ids: str | Iterable[str],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for EVENT_STATE_CHANGED events of specific entities.
+
+        The listeners are indexed by entity_id so firing a state changed
+        event only looks at the listeners of that entity instead of
+        running an event filter for every listener. Entity ids must be
+        lowercase.
+
+        If run_immediately is passed, the callback will be run
+        right away instead of using call_soon. Only use this if
+        the callback results in scheduling another task.
+
+        This method must be run in the event loop.
+        """
+        if run_immediately and not is_callback(listener):
+            raise HomeAssistantError(f"Event listener {listener} is not a callback")
+        if isinstance(entity_ids, str):
+            entity_ids = (entity_ids,)
+        else:
+            entity_ids = tuple(entity_ids)
+        filterable_job = _FilterableJob(HassJob(listener), None, run_immediately)
+        for entity_id in entity_ids:
+            self._state_changed_listeners.setdefault(entity_id, []).append(
+                filterable_job
+            )
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_state_changed_listener(entity_ids, filterable_job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_state_changed_listener(
+        self, entity_ids: Iterable[str], filterable_job: _FilterableJob
+    ) -> None:
+        """Remove a listener of state changes of specific entities.
+
+        This method must be run in the event loop.
+        """
+        for entity_id in entity_ids:
+            try:
+                self._state_changed_listeners[entity_id].remove(filterable_job)
+
+                # delete entity_id list if empty
+                if not self._state_changed_listeners[entity_id]:
+                    self._state_changed_listeners.pop(entity_id)
+            except (KeyError, ValueError):
+                # KeyError is key entity_id listener did not exist
+                # ValueError if listener did not exist within entity_id
+                _LOGGER.exception(
+                    "Unable to remove unknown job listener %s", filterable_job
+                )
+
     def listen_once(
         self,
         event_type: str,
@@ -1105,6 +1234,9 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_as_compressed_state",
+        "_as_compressed_state_json",
     ]
 
     def __init__(
@@ -1140,6 +1272,9 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._as_compressed_state: ReadOnlyDict[str, Any] | None = None
+        self._as_compressed_state_json: str | None = None
 
     def __hash__(self) -> int:
         """Make the state hashable.
@@ -1181,6 +1316,55 @@ class State:
             )
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return a JSON string of the State.
+
+        The JSON is only built once so every consumer serializing
+        the same state shares it.
+        """
+        if not self._as_dict_json:
+            # pylint: disable-next=import-outside-toplevel
+            from .helpers.json import json_dumps
+
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
+    def as_compressed_state(self) -> ReadOnlyDict[str, Any]:
+        """Build a compressed dict of a state for adds.
+
+        Omits the lu (last_updated) if it matches (lc) last_changed.
+
+        Sends c (context) as a string if it only contains an id.
+
+        The dict is cached and shared, so it is read only.
+        """
+        if not self._as_compressed_state:
+            if self.context.parent_id is None and self.context.user_id is None:
+                context: ReadOnlyDict[str, Any] | str = self.context.id
+            else:
+                context = ReadOnlyDict(self.context.as_dict())
+            compressed_state: dict[str, Any] = {
+                COMPRESSED_STATE_STATE: self.state,
+                COMPRESSED_STATE_ATTRIBUTES: self.attributes,
+                COMPRESSED_STATE_CONTEXT: context,
+                COMPRESSED_STATE_LAST_CHANGED: self.last_changed.timestamp(),
+            }
+            if self.last_changed != self.last_updated:
+                compressed_state[
+                    COMPRESSED_STATE_LAST_UPDATED
+                ] = self.last_updated.timestamp()
+            self._as_compressed_state = ReadOnlyDict(compressed_state)
+        return self._as_compressed_state
+
+    def as_compressed_state_json(self) -> str:
+        """Return a JSON string of the compressed state."""
+        if not self._as_compressed_state_json:
+            # pylint: disable-next=import-outside-toplevel
+            from .helpers.json import json_dumps
+
+            self._as_compressed_state_json = json_dumps(self.as_compressed_state())
+        return self._as_compressed_state_json
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
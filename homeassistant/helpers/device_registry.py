@@ -5,7 +5,7 @@ from collections import UserDict
 from collections.abc import Coroutine
 import logging
 import time
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import attr
 
@@ -244,10 +244,91 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Maintains two additional indexes:
+    - area_id -> device ids
+    - config_entry_id -> device ids
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
+
+    def __setitem__(self, key: str, entry: DeviceEntry) -> None:
+        """Add an item."""
+        old_entry = self.get(key)
+        super().__setitem__(key, entry)
+        if old_entry is None:
+            self._update_indexes(key, None, set(), entry.area_id, entry.config_entries)
+        else:
+            self._update_indexes(
+                key,
+                old_entry.area_id,
+                old_entry.config_entries,
+                entry.area_id,
+                entry.config_entries,
+            )
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        entry = self[key]
+        self._update_indexes(key, entry.area_id, entry.config_entries, None, set())
+        super().__delitem__(key)
+
+    def _update_indexes(
+        self,
+        key: str,
+        old_area_id: str | None,
+        old_config_entries: set[str],
+        area_id: str | None,
+        config_entries: set[str],
+    ) -> None:
+        """Move a device id to the new values in the indexes.
+
+        The device id keeps its position for the values which are unchanged.
+        """
+        if old_area_id != area_id:
+            if old_area_id is not None:
+                _remove_from_index(self._area_id_index, old_area_id, key)
+            if area_id is not None:
+                self._area_id_index.setdefault(area_id, {})[key] = True
+        for config_entry_id in old_config_entries - config_entries:
+            _remove_from_index(self._config_entry_id_index, config_entry_id, key)
+        for config_entry_id in config_entries - old_config_entries:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[key] = True
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for an area."""
+        return [self.data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for a config entry."""
+        return [
+            self.data[key]
+            for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
+def _remove_from_index(
+    index: dict[str, dict[str, Literal[True]]], value: str, key: str
+) -> None:
+    """Remove a key from a value in a multi-value index."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
 
     def __init__(self, hass: HomeAssistant) -> None:
@@ -542,7 +623,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -630,7 +711,7 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in self.devices.get_devices_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -671,9 +752,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in self.devices.get_devices_for_area_id(area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -704,7 +784,7 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -712,11 +792,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
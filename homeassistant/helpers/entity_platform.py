@@ -4,8 +4,10 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
+import random
 from typing import TYPE_CHECKING, Any, Protocol
 from urllib.parse import urlparse
 
@@ -42,7 +44,7 @@ from . import (
 )
 from .device_registry import DeviceRegistry
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -57,6 +59,9 @@ SLOW_ADD_MIN_TIMEOUT = 500
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+# Platforms start polling up to this fraction of their scan interval early
+# so platforms sharing a scan interval do not poll at the same time
+POLLING_JITTER = 0.25
 
 _LOGGER = getLogger(__name__)
 
@@ -100,6 +105,25 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+@dataclass
+class PollingStats:
+    """Latency statistics for the polling of a platform."""
+
+    polls: int = 0
+    overruns: int = 0
+    last_duration: float | None = None
+    max_duration: float = 0.0
+
+    @callback
+    def async_record(self, duration: float, overrun: bool) -> None:
+        """Record the duration of a poll."""
+        self.polls += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        if overrun:
+            self.overruns += 1
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -132,6 +156,7 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        self.polling_stats = PollingStats()
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -448,10 +473,8 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
+        self._async_schedule_polling(
+            self.scan_interval * (1 - random.random() * POLLING_JITTER)
         )
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
@@ -783,12 +806,55 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
+    @callback
+    def _async_schedule_polling(self, delay: timedelta) -> None:
+        """Schedule the next poll of the polling entities."""
+        self._async_unsub_polling = async_call_later(
+            self.hass, delay, self._async_handle_polling_interval
+        )
+
+    async def _async_handle_polling_interval(self, now: datetime) -> None:
+        """Poll the entities and schedule the next poll.
+
+        The next poll is scheduled relative to the start of this one, unless
+        this one took longer than the scan interval. In that case the platform
+        is given a full scan interval of rest after the poll completes instead
+        of polling again right away.
+        """
+        unsub_polling = self._async_unsub_polling
+        start = self.hass.loop.time()
+        await self._update_entity_states(now)
+        duration = self.hass.loop.time() - start
+
+        overrun = duration > self.scan_interval.total_seconds()
+        self.polling_stats.async_record(duration, overrun)
+        if overrun:
+            self.logger.warning(
+                "Updating %s %s took longer than the scheduled update interval %s",
+                self.platform_name,
+                self.domain,
+                self.scan_interval,
+            )
+            delay = self.scan_interval
+        else:
+            delay = self.scan_interval - timedelta(seconds=duration)
+
+        # Polling was stopped, or stopped and restarted, while updating
+        if self._async_unsub_polling is unsub_polling:
+            self._async_schedule_polling(delay)
+
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
         To protect from flooding the executor, we will update async entities
         in parallel and other entities sequential.
 
+        The entities of a platform are updated in the same tick on purpose.
+        Many platforms fetch shared data in the update of the first entity,
+        often behind a Throttle, and expect the other entities to read it in
+        the same round. Spreading the entities over the scan interval would
+        break that. PARALLEL_UPDATES bounds how many of them run at once.
+
         This method must be run in the event loop.
         """
         if self._process_updates is None:
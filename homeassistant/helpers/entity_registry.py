@@ -12,7 +12,7 @@ from __future__ import annotations
 from collections import UserDict
 from collections.abc import Callable, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import attr
 import voluptuous as vol
@@ -242,9 +242,12 @@ class EntityRegistryStore(storage.Store):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains five additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> entity_ids
+    - area_id -> entity_ids
+    - config_entry_id -> entity_ids
     """
 
     def __init__(self) -> None:
@@ -252,24 +255,52 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry = self.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._update_multi_indexes(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self._update_multi_indexes(key, entry, None)
         super().__delitem__(key)
 
+    def _update_multi_indexes(
+        self, key: str, old_entry: RegistryEntry | None, entry: RegistryEntry | None
+    ) -> None:
+        """Update the indexes which map a value to multiple entity_ids."""
+        _update_index(
+            self._device_id_index,
+            key,
+            old_entry and old_entry.device_id,
+            entry and entry.device_id,
+        )
+        _update_index(
+            self._area_id_index,
+            key,
+            old_entry and old_entry.area_id,
+            entry and entry.area_id,
+        )
+        _update_index(
+            self._config_entry_id_index,
+            key,
+            old_entry and old_entry.config_entry_id,
+            entry and entry.config_entry_id,
+        )
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
@@ -278,6 +309,44 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries for a device."""
+        return [self.data[key] for key in self._device_id_index.get(device_id, ())]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for an area."""
+        return [self.data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for a config entry."""
+        return [
+            self.data[key]
+            for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
+def _update_index(
+    index: dict[str, dict[str, Literal[True]]],
+    key: str,
+    old_value: str | None,
+    value: str | None,
+) -> None:
+    """Move a key from the old value to the value in a multi-value index.
+
+    The key keeps its position in the index when the value is unchanged.
+    """
+    if old_value == value:
+        return
+    if old_value is not None:
+        keys = index[old_value]
+        del keys[key]
+        if not keys:
+            del index[old_value]
+    if value is not None:
+        index.setdefault(value, {})[key] = True
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -879,19 +948,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry):
+            self.async_remove(entry.entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -926,9 +990,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.entities.get_entries_for_device_id(device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -937,7 +1000,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -945,11 +1008,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -1032,10 +1091,7 @@ async def async_migrate_entries(
     """Migrator of unique IDs."""
     ent_reg = async_get(hass)
 
-    for entry in ent_reg.entities.values():
-        if entry.config_entry_id != config_entry_id:
-            continue
-
+    for entry in async_entries_for_config_entry(ent_reg, config_entry_id):
         updates = entry_callback(entry)
 
         if updates is not None:
@@ -25,7 +25,7 @@ from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     TemplateError,
@@ -57,6 +57,8 @@ CONF_SERVICE_ENTITY_ID = "entity_id"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+TARGET_RESOLUTION_CACHE = "service_target_resolution_cache"
+MAX_TARGET_CACHE_SIZE = 256
 
 
 class ServiceParams(TypedDict):
@@ -329,6 +331,98 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
+@dataclasses.dataclass(frozen=True)
+class _ResolvedTarget:
+    """Devices and entities a set of targeted devices and areas resolves to."""
+
+    missing_devices: frozenset[str]
+    missing_areas: frozenset[str]
+    referenced_devices: frozenset[str]
+    indirectly_referenced: frozenset[str]
+
+
+@callback
+def _async_get_target_cache(
+    hass: HomeAssistant,
+) -> dict[tuple[frozenset[str], frozenset[str]], _ResolvedTarget]:
+    """Return the target resolution cache, creating it on first use.
+
+    The cache is cleared whenever the entity, device or area registry changes.
+    """
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is not None:
+        return cache
+
+    cache = hass.data[TARGET_RESOLUTION_CACHE] = {}
+
+    @callback
+    def _async_clear_cache(event: Event) -> None:
+        """Clear the cache when a registry is updated."""
+        cache.clear()
+
+    for event_type in (
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(event_type, _async_clear_cache, run_immediately=True)
+
+    return cache
+
+
+def _is_targetable(ent_entry: entity_registry.RegistryEntry) -> bool:
+    """Return if an entity can be targeted indirectly through a device or area.
+
+    Entities which are hidden or which are config or diagnostic entities are not.
+    """
+    return ent_entry.entity_category is None and ent_entry.hidden_by is None
+
+
+@callback
+def _async_resolve_target(
+    hass: HomeAssistant, device_ids: set[str], area_ids: set[str]
+) -> _ResolvedTarget:
+    """Resolve targeted devices and areas to devices and entities."""
+    ent_reg = entity_registry.async_get(hass)
+    dev_reg = device_registry.async_get(hass)
+    area_reg = area_registry.async_get(hass)
+
+    missing_devices = {
+        device_id for device_id in device_ids if device_id not in dev_reg.devices
+    }
+    missing_areas = {area_id for area_id in area_ids if area_id not in area_reg.areas}
+
+    # Find devices for targeted areas
+    referenced_devices = set(device_ids)
+    for area_id in area_ids:
+        for device_entry in dev_reg.devices.get_devices_for_area_id(area_id):
+            referenced_devices.add(device_entry.id)
+
+    indirectly_referenced: set[str] = set()
+    for area_id in area_ids:
+        for ent_entry in ent_reg.entities.get_entries_for_area_id(area_id):
+            # The entity's area matches a targeted area
+            if _is_targetable(ent_entry):
+                indirectly_referenced.add(ent_entry.entity_id)
+
+    for device_id in referenced_devices:
+        for ent_entry in ent_reg.entities.get_entries_for_device_id(device_id):
+            if _is_targetable(ent_entry) and (
+                # The entity's device matches a device referenced by an area and
+                # the entity has no explicitly set area
+                not ent_entry.area_id
+                # The entity's device matches a targeted device
+                or device_id in device_ids
+            ):
+                indirectly_referenced.add(ent_entry.entity_id)
+
+    return _ResolvedTarget(
+        frozenset(missing_devices),
+        frozenset(missing_areas),
+        frozenset(referenced_devices),
+        frozenset(indirectly_referenced),
+    )
+
+
 @bind_hass
 def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
@@ -349,45 +443,19 @@ def async_extract_referenced_entity_ids(
     if not selector.device_ids and not selector.area_ids:
         return selected
 
-    ent_reg = entity_registry.async_get(hass)
-    dev_reg = device_registry.async_get(hass)
-    area_reg = area_registry.async_get(hass)
-
-    for device_id in selector.device_ids:
-        if device_id not in dev_reg.devices:
-            selected.missing_devices.add(device_id)
-
-    for area_id in selector.area_ids:
-        if area_id not in area_reg.areas:
-            selected.missing_areas.add(area_id)
-
-    # Find devices for targeted areas
-    selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
-
-    if not selector.area_ids and not selected.referenced_devices:
-        return selected
-
-    for ent_entry in ent_reg.entities.values():
-        # Do not add entities which are hidden or which are config or diagnostic entities
-        if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
-            continue
+    cache = _async_get_target_cache(hass)
+    key = (frozenset(selector.device_ids), frozenset(selector.area_ids))
+    if (resolved := cache.get(key)) is None:
+        if len(cache) >= MAX_TARGET_CACHE_SIZE:
+            cache.clear()
+        resolved = cache[key] = _async_resolve_target(
+            hass, selector.device_ids, selector.area_ids
+        )
 
-        if (
-            # The entity's area matches a targeted area
-            ent_entry.area_id in selector.area_ids
-            # The entity's device matches a device referenced by an area and the entity
-            # has no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # The entity's device matches a targeted device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
 
     return selected
 
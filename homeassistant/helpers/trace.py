@@ -29,13 +29,18 @@ class TraceElement:
         if variables is None:
             variables = {}
         last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
-        changed_variables = {
-            key: value
+        # Share the previous snapshot if no variable was replaced, the changed
+        # variables are only worked out when the trace is serialized
+        if len(variables) == len(last_variables) and all(
+            key in last_variables and last_variables[key] is value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
-        }
-        self._variables = changed_variables
+        ):
+            variables = last_variables
+        else:
+            variables = dict(variables)
+        variables_cv.set(variables)
+        self._last_variables: dict[str, Any] = last_variables
+        self._variables: dict[str, Any] = variables
 
     def __repr__(self) -> str:
         """Container for trace data."""
@@ -59,6 +64,18 @@ class TraceElement:
         old_result = self._result or {}
         self._result = {**old_result, **kwargs}
 
+    def _changed_variables(self) -> dict[str, Any]:
+        """Return the variables which changed since the previous trace element."""
+        if self._variables is self._last_variables:
+            return {}
+        last_variables = self._last_variables
+        return {
+            key: value
+            for key, value in self._variables.items()
+            if key not in last_variables
+            or (last_variables[key] is not value and last_variables[key] != value)
+        }
+
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
         result: dict[str, Any] = {"path": self.path, "timestamp": self._timestamp}
@@ -69,8 +86,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self._changed_variables():
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error)
         if self._result is not None:
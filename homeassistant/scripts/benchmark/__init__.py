@@ -8,6 +8,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import time
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -224,6 +225,59 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_machine_set_with_listeners(hass):
+    """Set 100k states of 5k entities with 2k entity state changed listeners."""
+    entity_count = 5000
+    listener_count = 2000
+    states_to_set = 10**5
+    count = 0
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    def _make_filter(entity_id):
+        @core.callback
+        def _filter(event):
+            return event.data["entity_id"] == entity_id
+
+        return _filter
+
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(entity_count)]
+    listener_entity_ids = entity_ids[:listener_count]
+
+    async def _set_states() -> float:
+        nonlocal count
+        count = 0
+        start = timer()
+        for idx in range(states_to_set):
+            hass.states.async_set(entity_ids[idx % entity_count], str(idx))
+        await hass.async_block_till_done()
+        runtime = timer() - start
+        assert count == states_to_set * listener_count // entity_count
+        return runtime
+
+    unsubs = [
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, listener, event_filter=_make_filter(entity_id)
+        )
+        for entity_id in listener_entity_ids
+    ]
+    filtered_runtime = await _set_states()
+    print(f"Filtered listeners: {states_to_set / filtered_runtime:.0f} states/s")
+    for unsub in unsubs:
+        unsub()
+
+    for entity_id in listener_entity_ids:
+        hass.bus.async_listen_state_changed(entity_id, listener)
+    indexed_runtime = await _set_states()
+    print(f"Indexed listeners: {states_to_set / indexed_runtime:.0f} states/s")
+    return indexed_runtime
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -311,6 +365,353 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_states_cached(hass):
+    """Serialize 10k states for 10 websocket connections with the cached JSON."""
+    # pylint: disable=import-outside-toplevel
+    import tracemalloc
+
+    state_count = 10**4
+    connection_count = 10
+
+    tracemalloc.start()
+    states = [
+        core.State(
+            f"light.kitchen_{idx}",
+            "on",
+            {"friendly_name": "Kitchen Lights", "brightness": idx % 255},
+        )
+        for idx in range(state_count)
+    ]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Memory: {memory / state_count:.0f} bytes per state")
+
+    start = timer()
+    for _ in range(connection_count):
+        for state in states:
+            JSON_DUMP(state)
+    uncached_runtime = timer() - start
+    print(
+        "Uncached: "
+        f"{uncached_runtime / state_count * 10**6:.1f}µs per state for"
+        f" {connection_count} connections"
+    )
+
+    start = timer()
+    for _ in range(connection_count):
+        for state in states:
+            state.as_dict_json()
+    cached_runtime = timer() - start
+    print(
+        "Cached: "
+        f"{cached_runtime / state_count * 10**6:.1f}µs per state for"
+        f" {connection_count} connections"
+    )
+    return cached_runtime
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Write 100k states to sqlite with the ORM and with bulk inserts."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_insert import (
+        PendingState,
+        bulk_insert_states,
+    )
+    from homeassistant.components.recorder.const import SupportedDialect
+    from homeassistant.components.recorder.db_schema import Base, States, StatesMeta
+
+    states_to_write = 10**5
+    # One second of state changes at 300 state changes per second
+    # with multiple changes per entity in every commit
+    commit_size = 300
+    entity_count = 100
+
+    def _write_states(bulk: bool) -> float:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            states_meta = [
+                StatesMeta(entity_id=f"sensor.benchmark_{idx}")
+                for idx in range(entity_count)
+            ]
+            session.add_all(states_meta)
+            session.commit()
+            metadata_ids = [meta.metadata_id for meta in states_meta]
+            old_states: dict[str, States] = {}
+
+            start = timer()
+            for commit_start in range(0, states_to_write, commit_size):
+                pending_states = []
+                for idx in range(commit_start, commit_start + commit_size):
+                    entity_idx = idx % entity_count
+                    entity_id = f"sensor.benchmark_{entity_idx}"
+                    dbstate = States(
+                        state=str(idx),
+                        last_updated_ts=time.time(),
+                        metadata_id=metadata_ids[entity_idx],
+                    )
+                    pending_state = PendingState(dbstate, entity_id)
+                    if old_state := old_states.get(entity_id):
+                        if old_state.state_id:
+                            dbstate.old_state_id = old_state.state_id
+                        elif bulk:
+                            pending_state.old_state_pending = True
+                        else:
+                            dbstate.old_state = old_state
+                    old_states[entity_id] = dbstate
+                    pending_states.append(pending_state)
+                    if not bulk:
+                        session.add(dbstate)
+                if bulk:
+                    bulk_insert_states(session, SupportedDialect.SQLITE, pending_states)
+                session.commit()
+                if not bulk:
+                    for pending_state in pending_states:
+                        session.expunge(pending_state.dbstate)
+            runtime = timer() - start
+        engine.dispose()
+        return runtime
+
+    orm_runtime = _write_states(False)
+    print(f"ORM unit of work: {states_to_write / orm_runtime:.0f} states/s")
+    bulk_runtime = _write_states(True)
+    print(f"Bulk insert: {states_to_write / bulk_runtime:.0f} states/s")
+    return bulk_runtime
+
+
+@benchmark
+async def sensor_compile_mean_statistics(hass):
+    """Reduce 5 minutes of states of 1k measurement sensors to statistics."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.components.sensor.recorder import (
+        _normalize_states,
+        _time_weighted_average,
+    )
+    from homeassistant.util import dt as dt_util
+
+    sensor_count = 1000
+    # A sensor reporting every second
+    states_per_sensor = 300
+    end = dt_util.utcnow().replace(second=0, microsecond=0)
+    start = end - timedelta(minutes=5)
+    attributes = {"state_class": "measurement", "unit_of_measurement": "°C"}
+    histories = {
+        f"sensor.benchmark_{idx}": [
+            core.State(
+                f"sensor.benchmark_{idx}",
+                str(20 + (idx + offset) % 10 / 10),
+                attributes,
+                last_updated=start + timedelta(seconds=offset),
+            )
+            for offset in range(states_per_sensor)
+        ]
+        for idx in range(sensor_count)
+    }
+
+    start_time = timer()
+    for entity_id, entity_history in histories.items():
+        _, fstates = _normalize_states(hass, None, {}, entity_history, entity_id)
+        values = [fstate for fstate, _ in fstates]
+        timestamps = [state.last_updated.timestamp() for _, state in fstates]
+        _ = (
+            min(values),
+            max(values),
+            _time_weighted_average(values, timestamps, start, end),
+        )
+    runtime = timer() - start_time
+    print(f"{runtime / sensor_count * 10**6:.1f}µs per sensor")
+    return runtime
+
+
+@benchmark
+async def registry_entries_lookup(hass):
+    """Look up the entities and devices of 3k devices in a 20k entity registry."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.device_registry import (
+        ActiveDeviceRegistryItems,
+        DeviceEntry,
+    )
+    from homeassistant.helpers.entity_registry import (
+        EntityRegistryItems,
+        RegistryEntry,
+    )
+
+    entity_count = 20000
+    device_count = 3000
+    area_count = 30
+    config_entry_count = 300
+
+    devices = ActiveDeviceRegistryItems()
+    for idx in range(device_count):
+        device = DeviceEntry(
+            area_id=f"area_{idx % area_count}",
+            config_entries={f"config_entry_{idx % config_entry_count}"},
+        )
+        devices[device.id] = device
+    device_ids = list(devices)
+    entities = EntityRegistryItems()
+    for idx in range(entity_count):
+        device_id = device_ids[idx % device_count]
+        entry = RegistryEntry(
+            entity_id=f"sensor.benchmark_{idx}",
+            unique_id=str(idx),
+            platform="benchmark",
+            config_entry_id=next(iter(devices[device_id].config_entries)),
+            device_id=device_id,
+        )
+        entities[entry.entity_id] = entry
+
+    start = timer()
+    for device_id in device_ids:
+        _ = [entry for entry in entities.values() if entry.device_id == device_id]
+    for idx in range(area_count):
+        _ = [device for device in devices.values() if device.area_id == f"area_{idx}"]
+    scan_runtime = timer() - start
+    print(f"Scanning every entry: {scan_runtime}s")
+
+    start = timer()
+    for device_id in device_ids:
+        entities.get_entries_for_device_id(device_id)
+    for idx in range(area_count):
+        devices.get_devices_for_area_id(f"area_{idx}")
+    index_runtime = timer() - start
+    print(f"Indexed lookups: {index_runtime}s")
+    return index_runtime
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match 100k messages against 5k subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    from homeassistant.components.mqtt.client import Subscription, TopicTrie
+
+    subscription_count = 5000
+    messages_to_match = 10**5
+    # The linear scan is too slow to replay every message
+    linear_messages_to_match = 10**3
+
+    topics = []
+    for idx in range(subscription_count // 5):
+        topics.append(f"zigbee2mqtt/device_{idx}")
+        topics.append(f"zigbee2mqtt/device_{idx}/availability")
+        topics.append(f"tele/tasmota_{idx}/+")
+        topics.append(f"stat/tasmota_{idx}/RESULT")
+        topics.append(f"homeassistant/+/device_{idx}/#")
+    subscriptions = [Subscription(topic, core.HassJob(print)) for topic in topics]
+    messages = [
+        (
+            f"zigbee2mqtt/device_{idx % 1000}",
+            f"tele/tasmota_{idx % 1000}/SENSOR",
+            f"stat/tasmota_{idx % 1000}/RESULT",
+            f"homeassistant/sensor/device_{idx % 1000}/temperature/config",
+            f"unmatched/device_{idx % 1000}",
+        )[idx % 5]
+        for idx in range(messages_to_match)
+    ]
+
+    matchers = []
+    for subscription in subscriptions:
+        matcher = MQTTMatcher()
+        matcher[subscription.topic] = True
+        matchers.append((subscription, matcher))
+
+    start = timer()
+    for topic in messages[:linear_messages_to_match]:
+        _ = [
+            subscription
+            for subscription, matcher in matchers
+            if next(matcher.iter_match(topic), False)
+        ]
+    linear_runtime = timer() - start
+    print(f"Linear scan: {linear_messages_to_match / linear_runtime:.0f} messages/s")
+
+    trie = TopicTrie()
+    for subscription in subscriptions:
+        trie.add(subscription)
+
+    start = timer()
+    for topic in messages:
+        trie.match(topic)
+    trie_runtime = timer() - start
+    print(f"Topic trie: {messages_to_match / trie_runtime:.0f} messages/s")
+    return trie_runtime
+
+
+@benchmark
+async def bluetooth_cooldown_callback(hass):
+    """Replay 100k advertisements from 1k devices through a cooldown callback."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from unittest.mock import MagicMock
+
+    from homeassistant.components.bluetooth.manager import _CooldownCallback
+    from homeassistant.components.bluetooth.models import (
+        BluetoothChange,
+        BluetoothServiceInfoBleak,
+    )
+
+    advertisement_count = 10**5
+    device_count = 1000
+    # Most devices keep their address, the rest use a new one every time
+    static_device_count = 900
+    cooldown = 0.05
+
+    trace = []
+    for idx in range(advertisement_count):
+        device = idx % device_count
+        if device < static_device_count:
+            address = f"AA:BB:CC:{device // 256:02X}:{device % 256:02X}:00"
+        else:
+            address = ":".join(f"{byte:02X}" for byte in idx.to_bytes(6, "big"))
+        trace.append(
+            BluetoothServiceInfoBleak(
+                name=f"device_{device}",
+                address=address,
+                rssi=-60 - idx % 30,
+                manufacturer_data={89: idx.to_bytes(4, "little")},
+                service_data={},
+                service_uuids=[],
+                source="local",
+                device=MagicMock(),
+                advertisement=MagicMock(),
+                connectable=True,
+                time=idx / 1000,
+            )
+        )
+
+    calls = 0
+
+    def _callback(
+        service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        nonlocal calls
+        calls += 1
+
+    cooldown_callback = _CooldownCallback(hass, _callback, cooldown)
+    start = timer()
+    for idx, service_info in enumerate(trace):
+        cooldown_callback(service_info, BluetoothChange.ADVERTISEMENT)
+        # Let the loop run the pending calls whose cooldown has ended
+        if not idx % 1000:
+            await asyncio.sleep(0)
+    runtime = timer() - start
+
+    # Deliver what is still waiting for its cooldown to end
+    await asyncio.sleep(cooldown * 2)
+    print(f"Replayed {advertisement_count} advertisements, {calls} callbacks")
+    print(f"Addresses tracked after replay: {len(cooldown_callback._last_calls)}")
+    cooldown_callback.async_cancel()
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -4,6 +4,12 @@ from __future__ import annotations
 from random import getrandbits
 import time
 
+_ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODING = {
+    **{char: idx for idx, char in enumerate(_ENCODING)},
+    **{char.lower(): idx for idx, char in enumerate(_ENCODING)},
+}
+
 
 def ulid_hex() -> str:
     """Generate a ULID in lowercase hex that will work for a UUID.
@@ -38,13 +44,17 @@ def ulid(timestamp: float | None = None) -> str:
     ulid_bytes = int((timestamp or time.time()) * 1000).to_bytes(
         6, byteorder="big"
     ) + int(getrandbits(80)).to_bytes(10, byteorder="big")
+    return bytes_to_ulid(ulid_bytes)
+
 
+def bytes_to_ulid(ulid_bytes: bytes) -> str:
+    """Convert 16 bytes to a ULID string."""
     # This is base32 crockford encoding with the loop unrolled for performance
     #
     # This code is adapted from:
     # https://github.com/ahawker/ulid/blob/06289583e9de4286b4d80b4ad000d137816502ca/ulid/base32.py#L102
     #
-    enc = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+    enc = _ENCODING
     return (
         enc[(ulid_bytes[0] & 224) >> 5]
         + enc[ulid_bytes[0] & 31]
@@ -73,3 +83,21 @@ def ulid(timestamp: float | None = None) -> str:
         + enc[((ulid_bytes[14] & 3) << 3) | ((ulid_bytes[15] & 224) >> 5)]
         + enc[ulid_bytes[15] & 31]
     )
+
+
+def ulid_to_bytes(value: str) -> bytes:
+    """Convert a ULID string to 16 bytes.
+
+    Raises ValueError if the string is not a valid ULID.
+    """
+    if len(value) != 26:
+        raise ValueError(f"ULID must be 26 characters: {value}")
+    int_value = 0
+    try:
+        for char in value:
+            int_value = (int_value << 5) | _DECODING[char]
+    except KeyError as ex:
+        raise ValueError(f"ULID contains an invalid character: {value}") from ex
+    if int_value >> 128:
+        raise ValueError(f"ULID is out of range: {value}")
+    return int_value.to_bytes(16, byteorder="big")
@@ -486,7 +486,7 @@ def mock_device_registry(
 ) -> device_registry.DeviceRegistry:
     """Mock the Device Registry."""
     registry = device_registry.DeviceRegistry(hass)
-    registry.devices = device_registry.DeviceRegistryItems()
+    registry.devices = device_registry.ActiveDeviceRegistryItems()
     if mock_entries is None:
         mock_entries = {}
     for key, entry in mock_entries.items():
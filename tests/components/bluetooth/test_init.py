@@ -1293,6 +1293,65 @@ async def test_register_callback_by_address(
         assert service_info.manufacturer_id == 89
 
 
+async def test_register_callback_with_cooldown(
+    hass, mock_bleak_scanner_start, enable_bluetooth
+):
+    """Test registering a callback with a cooldown delivers the latest advertisement."""
+    mock_bt = []
+    callbacks = []
+
+    def _fake_subscriber(
+        service_info: BluetoothServiceInfo, change: BluetoothChange
+    ) -> None:
+        """Fake subscriber for the BleakScanner."""
+        callbacks.append((service_info, change))
+
+    with patch(
+        "homeassistant.components.bluetooth.async_get_bluetooth", return_value=mock_bt
+    ):
+        await async_setup_with_default_adapter(hass)
+
+    with patch.object(hass.config_entries.flow, "async_init"):
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        cancel = bluetooth.async_register_callback(
+            hass,
+            _fake_subscriber,
+            {ADDRESS: "44:44:33:11:23:45"},
+            BluetoothScanningMode.ACTIVE,
+            cooldown=10,
+        )
+
+        switchbot_device = BLEDevice("44:44:33:11:23:45", "wohand")
+        for data in (b"\x01", b"\x02", b"\x03"):
+            switchbot_adv = generate_advertisement_data(
+                local_name="wohand", manufacturer_data={89: data}
+            )
+            inject_advertisement(hass, switchbot_device, switchbot_adv)
+        await hass.async_block_till_done()
+
+        assert len(callbacks) == 1
+        assert callbacks[0][0].manufacturer_data == {89: b"\x01"}
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+        await hass.async_block_till_done()
+
+        assert len(callbacks) == 2
+        assert callbacks[1][0].manufacturer_data == {89: b"\x03"}
+
+        switchbot_adv = generate_advertisement_data(
+            local_name="wohand", manufacturer_data={89: b"\x04"}
+        )
+        inject_advertisement(hass, switchbot_device, switchbot_adv)
+        cancel()
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=22))
+        await hass.async_block_till_done()
+
+    assert len(callbacks) == 2
+
+
 async def test_register_callback_by_address_connectable_only(
     hass, mock_bleak_scanner_start, enable_bluetooth
 ):
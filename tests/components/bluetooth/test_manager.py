@@ -9,6 +9,7 @@ from bluetooth_adapters import AdvertisementHistory
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.manager import (
     FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS,
+    _CooldownCallback,
 )
 from homeassistant.setup import async_setup_component
 
@@ -384,3 +385,29 @@ async def test_connectable_advertisement_can_be_retrieved_with_best_path_is_non_
         bluetooth.async_ble_device_from_address(hass, address, True)
         is switchbot_device_poor_signal
     )
+
+
+async def test_cooldown_callback_forgets_expired_addresses(hass):
+    """Test the cooldown callback does not track addresses forever."""
+    callbacks = []
+    now = hass.loop.time()
+
+    with patch.object(hass.loop, "time", return_value=now):
+        cooldown_callback = _CooldownCallback(
+            hass, lambda *args: callbacks.append(args), 10
+        )
+        for idx in range(100):
+            cooldown_callback(
+                MagicMock(address=f"44:44:33:11:23:{idx:02X}"),
+                bluetooth.BluetoothChange.ADVERTISEMENT,
+            )
+    assert len(callbacks) == 100
+    assert len(cooldown_callback._last_calls) == 100
+
+    with patch.object(hass.loop, "time", return_value=now + 11):
+        cooldown_callback(
+            MagicMock(address="44:44:33:11:23:45"),
+            bluetooth.BluetoothChange.ADVERTISEMENT,
+        )
+    assert len(callbacks) == 101
+    assert cooldown_callback._last_calls == {"44:44:33:11:23:45": now + 11}
@@ -11,6 +11,7 @@ from homeassistant.components.camera.const import (
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_TTL,
 )
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
@@ -174,6 +175,136 @@ async def test_get_image_from_camera_not_jpeg(hass, image_mock_url):
     assert image.content == b"png"
 
 
+async def test_get_image_coalesces_requests(hass, image_mock_url):
+    """Test concurrent requests for an image share one fetch from the camera."""
+    release = asyncio.Event()
+
+    async def async_camera_image(width=None, height=None):
+        await release.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=async_camera_image,
+    ) as mock_camera_image:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*tasks)
+
+        assert [image.content for image in images] == [b"Test"] * 3
+        assert len(mock_camera_image.mock_calls) == 1
+
+        # Without a snapshot TTL a later request fetches a new image
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_camera_image.mock_calls) == 2
+
+        demo_camera = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+        demo_camera._attr_snapshot_ttl = 60
+        await camera.async_get_image(hass, "camera.demo_camera")
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_camera_image.mock_calls) == 3
+
+    assert demo_camera.snapshot_cache.get_diagnostics() == {"hits": 3, "misses": 3}
+
+
+async def test_get_image_scaled_served_from_cache(hass, image_mock_url):
+    """Test a scaled image is served from the cache with a snapshot TTL pref."""
+    await hass.data[camera.DATA_CAMERA_PREFS].async_update(
+        "camera.demo_camera", snapshot_ttl=60
+    )
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Valid jpeg",
+    ) as mock_camera:
+        for _ in range(3):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=4, height=3
+            )
+            assert image.content == EMPTY_8_6_JPEG
+
+        assert len(mock_camera.mock_calls) == 1
+        assert len(turbo_jpeg.scale_with_quality.mock_calls) == 1
+
+        # The unscaled image is cached separately
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Valid jpeg"
+        assert len(mock_camera.mock_calls) == 2
+
+    demo_camera = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+    assert demo_camera.snapshot_cache.get_diagnostics() == {"hits": 2, "misses": 2}
+
+
+async def test_get_image_shared_fetch_uses_longest_timeout(hass, image_mock_url):
+    """Test a shared fetch is extended to the longest timeout of its callers."""
+    release = asyncio.Event()
+
+    async def async_camera_image(width=None, height=None):
+        await release.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=async_camera_image,
+    ):
+        short_request = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera", timeout=5)
+        )
+        await asyncio.sleep(0)
+        long_request = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera", timeout=30)
+        )
+        await asyncio.sleep(0)
+
+        demo_camera = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+        _, fetch_timeout = demo_camera.snapshot_cache._requests[(None, None)]
+        assert fetch_timeout.deadline > hass.loop.time() + 25
+
+        release.set()
+        assert (await short_request).content == b"Test"
+        assert (await long_request).content == b"Test"
+
+
+async def test_websocket_update_snapshot_ttl_prefs(hass, hass_ws_client, mock_camera):
+    """Test updating the snapshot TTL camera preference."""
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {
+            "id": 8,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            "snapshot_ttl": 30,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"][PREF_SNAPSHOT_TTL] == 30
+
+    prefs = hass.data[camera.DATA_CAMERA_PREFS].get("camera.demo_camera")
+    assert prefs.snapshot_ttl == 30
+
+    await client.send_json(
+        {
+            "id": 9,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            "snapshot_ttl": camera.MAX_SNAPSHOT_TTL + 1,
+        }
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera, mock_stream_source):
     """Fetch stream source from camera entity."""
 
@@ -255,6 +255,38 @@ async def test_registered_devices(hass):
     )
 
 
+async def test_dhcp_match_macaddress_indexed_by_oui(hass):
+    """Test matchers are indexed by the fixed OUI of the macaddress pattern."""
+    integration_matchers = [
+        {"domain": "mock-domain", "macaddress": "B8B7F1*"},
+        {"domain": "other-domain", "macaddress": "AABBCC*"},
+        {"domain": "wildcard-domain", "macaddress": "B8B7?1*"},
+        {"domain": "hostname-domain", "hostname": "connect"},
+        {"domain": "registered-domain", "registered_devices": True},
+    ]
+    matchers = dhcp.index_integration_matchers(integration_matchers)
+    assert matchers.registered_devices_domains == {"registered-domain"}
+    assert matchers.oui_matchers == {
+        "B8B7F1": [integration_matchers[0]],
+        "AABBCC": [integration_matchers[1]],
+    }
+    assert matchers.no_oui_matchers == integration_matchers[2:4]
+
+    async_handle_dhcp_packet = await _async_get_handle_dhcp_packet(
+        hass, integration_matchers
+    )
+    packet = Ether(RAW_DHCP_REQUEST)
+
+    with patch.object(hass.config_entries.flow, "async_init") as mock_init:
+        await async_handle_dhcp_packet(packet)
+
+    assert {call[1][0] for call in mock_init.mock_calls} == {
+        "mock-domain",
+        "wildcard-domain",
+        "hostname-domain",
+    }
+
+
 async def test_dhcp_match_hostname(hass):
     """Test matching based on hostname only."""
     integration_matchers = [{"domain": "mock-domain", "hostname": "connect"}]
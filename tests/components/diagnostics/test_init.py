@@ -6,12 +6,13 @@ import pytest
 
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.helpers.device_registry import async_get
+from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.setup import async_setup_component
 
 from . import _get_diagnostics_for_config_entry, _get_diagnostics_for_device
 
-from tests.common import MockConfigEntry, mock_platform
+from tests.common import MockConfigEntry, MockEntityPlatform, mock_platform
 
 
 @pytest.fixture(autouse=True)
@@ -93,6 +94,7 @@ async def test_download_diagnostics(hass, hass_client):
             "name": "fake_integration",
             "requirements": [],
         },
+        "polling": [],
         "data": {"config_entry": "info"},
     }
 
@@ -114,10 +116,44 @@ async def test_download_diagnostics(hass, hass_client):
             "name": "fake_integration",
             "requirements": [],
         },
+        "polling": [],
         "data": {"device": "info"},
     }
 
 
+async def test_download_diagnostics_polling_stats(hass, hass_client):
+    """Test download diagnostics includes the polling stats of the config entry."""
+    config_entry = MockConfigEntry(domain="fake_integration")
+    config_entry.add_to_hass(hass)
+    other_config_entry = MockConfigEntry(domain="fake_integration")
+    other_config_entry.add_to_hass(hass)
+    platform = MockEntityPlatform(
+        hass, domain="sensor", platform_name="fake_integration"
+    )
+    platform.config_entry = config_entry
+    other_platform = MockEntityPlatform(
+        hass, domain="light", platform_name="fake_integration"
+    )
+    other_platform.config_entry = other_config_entry
+    assert async_get_platforms(hass, "fake_integration") == [platform, other_platform]
+    platform.polling_stats.async_record(1.5, False)
+    platform.polling_stats.async_record(20.0, True)
+
+    diagnostics = await _get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+    assert diagnostics["polling"] == [
+        {
+            "domain": "sensor",
+            "scan_interval": 15.0,
+            "polls": 2,
+            "overruns": 1,
+            "last_duration": 20.0,
+            "max_duration": 20.0,
+        }
+    ]
+
+
 async def test_failure_scenarios(hass, hass_client):
     """Test failure scenarios."""
     client = await hass_client()
@@ -0,0 +1,231 @@
+"""The tests for the history websocket api."""
+import asyncio
+from unittest.mock import ANY
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.websocket_api.const import TYPE_RESULT
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import async_wait_recording_done
+
+
+async def test_history_stream_historical_only(recorder_mock, hass, hass_ws_client):
+    """Test history stream with an end_time in the past."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_first_state = hass.states.get("sensor.one")
+    hass.states.async_set("sensor.two", "on", attributes={"any": "attr"})
+    sensor_two_state = hass.states.get("sensor.two")
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "changed"})
+    sensor_one_last_state = hass.states.get("sensor.one")
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == TYPE_RESULT
+
+    response = await client.receive_json()
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert response["event"] == {
+        "start_time": now.timestamp(),
+        "end_time": end_time.timestamp(),
+        "states": {
+            "sensor.one": [
+                {
+                    "a": {},
+                    "lu": sensor_one_first_state.last_updated.timestamp(),
+                    "s": "on",
+                },
+                {"lu": sensor_one_last_state.last_updated.timestamp(), "s": "off"},
+            ],
+            "sensor.two": [
+                {"a": {}, "lu": sensor_two_state.last_updated.timestamp(), "s": "on"}
+            ],
+        },
+    }
+
+
+async def test_history_stream_live(recorder_mock, hass, hass_ws_client):
+    """Test history stream sends the history and then the live state changes."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_state = hass.states.get("sensor.one")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    init_listeners = hass.bus.async_listeners()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": True,
+            "no_attributes": False,
+            "minimal_response": False,
+        }
+    )
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == TYPE_RESULT
+
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert response["event"]["partial"] is True
+    assert response["event"]["states"] == {
+        "sensor.one": [
+            {
+                "a": {"any": "attr"},
+                "lu": sensor_one_state.last_updated.timestamp(),
+                "s": "on",
+            }
+        ]
+    }
+
+    await get_instance(hass).async_block_till_done()
+    await hass.async_block_till_done()
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert "partial" not in response["event"]
+    assert response["event"]["states"] == {}
+
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    sensor_one_state = hass.states.get("sensor.one")
+    # An attribute only change is not significant
+    hass.states.async_set("sensor.one", "off", attributes={"any": "changed"})
+    hass.states.async_set("sensor.two", "on", attributes={"other": "attr"})
+    sensor_two_state = hass.states.get("sensor.two")
+    hass.states.async_set("sensor.not_streamed", "on")
+
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert response["event"] == {
+        "states": {
+            "sensor.one": [
+                {
+                    "a": {"any": "attr"},
+                    "lu": sensor_one_state.last_updated.timestamp(),
+                    "s": "off",
+                }
+            ],
+            "sensor.two": [
+                {
+                    "a": {"other": "attr"},
+                    "lu": sensor_two_state.last_updated.timestamp(),
+                    "s": "on",
+                }
+            ],
+        }
+    }
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert response["id"] == 2
+    assert response["type"] == TYPE_RESULT
+    assert response["success"]
+
+    # Check our listener got unsubscribed
+    assert hass.bus.async_listeners() == init_listeners
+
+
+async def test_history_stream_minimal_response_live(
+    recorder_mock, hass, hass_ws_client
+):
+    """Test history stream live state changes with minimal_response."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "significant_changes_only": False,
+            "minimal_response": True,
+        }
+    )
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert response["success"]
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert response["event"]["partial"] is True
+    await get_instance(hass).async_block_till_done()
+    await hass.async_block_till_done()
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert "partial" not in response["event"]
+
+    hass.states.async_set("sensor.one", "on", attributes={"any": "changed"})
+    hass.states.async_set("sensor.one", "off", attributes={"any": "changed"})
+
+    response = await asyncio.wait_for(client.receive_json(), 2)
+    assert response["id"] == 1
+    assert response["event"] == {"states": {"sensor.one": [{"lu": ANY, "s": "off"}]}}
+
+
+async def test_history_stream_bad_start_time(recorder_mock, hass, hass_ws_client):
+    """Test history stream bad start time."""
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": "cats",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+async def test_history_stream_end_time_before_start_time(
+    recorder_mock, hass, hass_ws_client
+):
+    """Test history stream with an end_time before the start_time."""
+    await async_setup_component(hass, "history", {})
+    now = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "end_time": (now.replace(year=now.year - 1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_end_time"
@@ -315,10 +315,10 @@ def create_state_changed_event_from_old_new(
         [
             "event_type"
             "event_data"
-            "time_fired"
-            "context_id"
-            "context_user_id"
-            "context_parent_id"
+            "time_fired_ts"
+            "context_id_bin"
+            "context_user_id_bin"
+            "context_parent_id_bin"
             "state"
             "entity_id"
             "domain"
@@ -336,17 +336,17 @@ def create_state_changed_event_from_old_new(
     row.shared_data = "{}"
     row.attributes = attributes_json
     row.shared_attrs = attributes_json
-    row.time_fired = event_time_fired
+    row.time_fired_ts = dt_util.utc_to_timestamp(event_time_fired)
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
     row.domain = entity_id and ha.split_entity_id(entity_id)[0]
     row.context_only = False
-    row.context_id = None
+    row.context_id_bin = None
     row.friendly_name = None
     row.icon = None
     row.old_format_icon = None
-    row.context_user_id = None
-    row.context_parent_id = None
+    row.context_user_id_bin = None
+    row.context_parent_id_bin = None
     row.old_state_id = old_state and 1
     row.state_id = new_state and 1
     return LazyEventPartialState(row, {})
@@ -462,6 +462,29 @@ async def test_logbook_view_period_entity(recorder_mock, hass, hass_client, set_
     assert response_json[0]["entity_id"] == entity_id_test
 
 
+async def test_logbook_view_during_migration(recorder_mock, hass, hass_client):
+    """Test the logbook does not query columns that are still being migrated."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    with patch.object(recorder.get_instance(hass), "schema_version", 32):
+        response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == []
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert response.status == HTTPStatus.OK
+    assert len(await response.json()) == 1
+
+
 async def test_logbook_describe_event(recorder_mock, hass, hass_client):
     """Test teaching logbook about a new event."""
 
@@ -903,7 +926,7 @@ async def test_logbook_entity_context_id(recorder_mock, hass, hass_client):
     await async_recorder_block_till_done(hass)
 
     context = ha.Context(
-        id="ac5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVAAA",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
 
@@ -964,7 +987,7 @@ async def test_logbook_entity_context_id(recorder_mock, hass, hass_client):
 
     # A service call
     light_turn_off_service_context = ha.Context(
-        id="9c5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVDDD",
         user_id="9400facee45711eaa9308bfd3d19e474",
     )
     hass.states.async_set("light.switch", STATE_ON)
@@ -1057,7 +1080,7 @@ async def test_logbook_context_id_automation_script_started_manually(
     # An Automation
     automation_entity_id_test = "automation.alarm"
     automation_context = ha.Context(
-        id="fc5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X276W5TEDDD",
         user_id="f400facee45711eaa9308bfd3d19e474",
     )
     hass.bus.async_fire(
@@ -1066,7 +1089,7 @@ async def test_logbook_context_id_automation_script_started_manually(
         context=automation_context,
     )
     script_context = ha.Context(
-        id="ac5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVAAA",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
     hass.bus.async_fire(
@@ -1078,7 +1101,7 @@ async def test_logbook_context_id_automation_script_started_manually(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
 
     script_2_context = ha.Context(
-        id="1234",
+        id="01GTDGKBCH00GW0X476W5TV888",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
     hass.bus.async_fire(
@@ -1109,12 +1132,12 @@ async def test_logbook_context_id_automation_script_started_manually(
     assert json_dict[0]["entity_id"] == "automation.alarm"
     assert "context_entity_id" not in json_dict[0]
     assert json_dict[0]["context_user_id"] == "f400facee45711eaa9308bfd3d19e474"
-    assert json_dict[0]["context_id"] == "fc5bd62de45711eaaeb351041eec8dd9"
+    assert json_dict[0]["context_id"] == "01GTDGKBCH00GW0X276W5TEDDD"
 
     assert json_dict[1]["entity_id"] == "script.mock_script"
     assert "context_entity_id" not in json_dict[1]
     assert json_dict[1]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
-    assert json_dict[1]["context_id"] == "ac5bd62de45711eaaeb351041eec8dd9"
+    assert json_dict[1]["context_id"] == "01GTDGKBCH00GW0X476W5TVAAA"
 
     assert json_dict[2]["domain"] == "homeassistant"
 
@@ -1122,7 +1145,7 @@ async def test_logbook_context_id_automation_script_started_manually(
     assert json_dict[3]["name"] == "Mock script"
     assert "context_entity_id" not in json_dict[1]
     assert json_dict[3]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
-    assert json_dict[3]["context_id"] == "1234"
+    assert json_dict[3]["context_id"] == "01GTDGKBCH00GW0X476W5TV888"
 
     assert json_dict[4]["entity_id"] == "switch.new"
     assert json_dict[4]["state"] == "off"
@@ -1144,7 +1167,7 @@ async def test_logbook_entity_context_parent_id(recorder_mock, hass, hass_client
     await async_recorder_block_till_done(hass)
 
     context = ha.Context(
-        id="ac5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVAAA",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
 
@@ -1157,8 +1180,8 @@ async def test_logbook_entity_context_parent_id(recorder_mock, hass, hass_client
     )
 
     child_context = ha.Context(
-        id="2798bfedf8234b5e9f4009c91f48f30c",
-        parent_id="ac5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVEEE",
+        parent_id="01GTDGKBCH00GW0X476W5TVAAA",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
     hass.bus.async_fire(
@@ -1209,8 +1232,8 @@ async def test_logbook_entity_context_parent_id(recorder_mock, hass, hass_client
 
     # A state change via service call with the script as the parent
     light_turn_off_service_context = ha.Context(
-        id="9c5bd62de45711eaaeb351041eec8dd9",
-        parent_id="2798bfedf8234b5e9f4009c91f48f30c",
+        id="01GTDGKBCH00GW0X476W5TVDDD",
+        parent_id="01GTDGKBCH00GW0X476W5TVEEE",
         user_id="9400facee45711eaa9308bfd3d19e474",
     )
     hass.states.async_set("light.switch", STATE_ON)
@@ -1234,8 +1257,8 @@ async def test_logbook_entity_context_parent_id(recorder_mock, hass, hass_client
 
     # An event with a parent event, but the parent event isn't available
     missing_parent_context = ha.Context(
-        id="fc40b9a0d1f246f98c34b33c76228ee6",
-        parent_id="c8ce515fe58e442f8664246c65ed964f",
+        id="01GTDGKBCH00GW0X276W5TVFFF",
+        parent_id="01GTDGKBCH00GW0X476W5TVBBB",
         user_id="485cacf93ef84d25a99ced3126b921d2",
     )
     logbook.async_log_entry(
@@ -1356,7 +1379,7 @@ async def test_logbook_context_from_template(recorder_mock, hass, hass_client):
     await hass.async_block_till_done()
 
     switch_turn_off_context = ha.Context(
-        id="9c5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVDDD",
         user_id="9400facee45711eaa9308bfd3d19e474",
     )
     hass.states.async_set(
@@ -1437,7 +1460,7 @@ async def test_logbook_(recorder_mock, hass, hass_client):
     await hass.async_block_till_done()
 
     switch_turn_off_context = ha.Context(
-        id="9c5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVDDD",
         user_id="9400facee45711eaa9308bfd3d19e474",
     )
     hass.states.async_set(
@@ -1617,7 +1640,7 @@ async def test_logbook_multiple_entities(recorder_mock, hass, hass_client):
     await hass.async_block_till_done()
 
     switch_turn_off_context = ha.Context(
-        id="9c5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVDDD",
         user_id="9400facee45711eaa9308bfd3d19e474",
     )
     hass.states.async_set(
@@ -2293,7 +2316,7 @@ async def test_get_events(recorder_mock, hass, hass_ws_client):
     hass.states.async_set("light.kitchen", STATE_ON, {"brightness": 400})
     await hass.async_block_till_done()
     context = ha.Context(
-        id="ac5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVAAA",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
 
@@ -2373,7 +2396,7 @@ async def test_get_events(recorder_mock, hass, hass_ws_client):
             "id": 5,
             "type": "logbook/get_events",
             "start_time": now.isoformat(),
-            "context_id": "ac5bd62de45711eaaeb351041eec8dd9",
+            "context_id": "01GTDGKBCH00GW0X476W5TVAAA",
         }
     )
     response = await client.receive_json()
@@ -2538,7 +2561,7 @@ async def test_get_events_with_device_ids(recorder_mock, hass, hass_ws_client):
     hass.states.async_set("light.kitchen", STATE_ON, {"brightness": 400})
     await hass.async_block_till_done()
     context = ha.Context(
-        id="ac5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVAAA",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
 
@@ -2625,7 +2648,7 @@ async def test_logbook_select_entities_context_id(recorder_mock, hass, hass_clie
     await async_recorder_block_till_done(hass)
 
     context = ha.Context(
-        id="ac5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVAAA",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
 
@@ -2684,7 +2707,7 @@ async def test_logbook_select_entities_context_id(recorder_mock, hass, hass_clie
 
     # A service call
     light_turn_off_service_context = ha.Context(
-        id="9c5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVDDD",
         user_id="9400facee45711eaa9308bfd3d19e474",
     )
     hass.states.async_set("light.switch", STATE_ON)
@@ -2763,7 +2786,7 @@ async def test_get_events_with_context_state(recorder_mock, hass, hass_ws_client
     hass.states.async_set("light.kitchen2", STATE_OFF)
 
     context = ha.Context(
-        id="ac5bd62de45711eaaeb351041eec8dd9",
+        id="01GTDGKBCH00GW0X476W5TVAAA",
         user_id="b400facee45711eaa9308bfd3d19e474",
     )
     hass.states.async_set("binary_sensor.is_light", STATE_OFF, context=context)
@@ -1175,6 +1175,95 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0][0].payload == "test-payload"
 
 
+async def test_subscribe_overlapping_wildcards_in_subscription_order(
+    hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
+):
+    """Test overlapping subscriptions are called in the order they were made."""
+    await mqtt_mock_entry_no_yaml_config()
+    unsub_subtree = await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+    await mqtt.async_subscribe(hass, "+/bier/on", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/bier/on", record_calls)
+    await mqtt.async_subscribe(hass, "#", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+
+    await hass.async_block_till_done()
+    assert [call[0].subscribed_topic for call in calls] == [
+        "test-topic/#",
+        "test-topic/+/on",
+        "+/bier/on",
+        "test-topic/bier/on",
+        "#",
+    ]
+
+    calls.clear()
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+    async_fire_mqtt_message(hass, "$test-topic/bier/on", "test-payload")
+
+    await hass.async_block_till_done()
+    assert [call[0].subscribed_topic for call in calls] == ["#"]
+
+
+async def test_received_messages_are_handled_in_batches(
+    hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
+):
+    """Test messages received by the paho client are handled in a batch."""
+    await mqtt_mock_entry_no_yaml_config()
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    mqtt_client = hass.data["mqtt"].client
+
+    with patch.object(
+        hass.data["mqtt"].state_write_requests, "process_write_state_requests"
+    ) as mock_process_write_state_requests:
+        for idx in range(3):
+            mqtt_client._mqtt_on_message(
+                None, None, ReceiveMessage(f"test-topic/{idx}", b"payload", 0, False)
+            )
+        assert len(calls) == 0
+        await hass.async_block_till_done()
+
+    assert [call[0].topic for call in calls] == [
+        "test-topic/0",
+        "test-topic/1",
+        "test-topic/2",
+    ]
+    assert len({call[0].timestamp for call in calls}) == 1
+    assert len(mock_process_write_state_requests.mock_calls) == 1
+
+
+async def test_received_messages_batch_survives_failing_subscriber(
+    hass, mqtt_mock_entry_no_yaml_config, calls, record_calls, caplog
+):
+    """Test a failing subscriber does not stop the rest of the batch."""
+    await mqtt_mock_entry_no_yaml_config()
+
+    @callback
+    def _raise_on_first(msg: ReceiveMessage) -> None:
+        if msg.topic == "test-topic/0":
+            raise ValueError("subscriber failed")
+
+    await mqtt.async_subscribe(hass, "test-topic/#", _raise_on_first)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    mqtt_client = hass.data["mqtt"].client
+
+    with patch.object(
+        hass.data["mqtt"].state_write_requests, "process_write_state_requests"
+    ) as mock_process_write_state_requests:
+        for idx in range(3):
+            mqtt_client._mqtt_on_message(
+                None, None, ReceiveMessage(f"test-topic/{idx}", b"payload", 0, False)
+            )
+        await hass.async_block_till_done()
+
+    assert "Exception while handling message on test-topic/0" in caplog.text
+    assert "test-topic/1" in [call[0].topic for call in calls]
+    assert "test-topic/2" in [call[0].topic for call in calls]
+    assert len(mqtt_client._pending_messages) == 0
+    assert len(mock_process_write_state_requests.mock_calls) == 1
+
+
 async def test_subscribe_special_characters(
     hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
 ):
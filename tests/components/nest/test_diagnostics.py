@@ -160,5 +160,7 @@ async def test_camera_diagnostics(
     # Test that only non identifiable device information is returned
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "devices": [CAMERA_DIAGNOSTIC_DATA],
-        "camera": {"camera.camera": {}},
+        "camera": {
+            "camera.camera": {"snapshot_cache": {"hits": 0, "misses": 0}},
+        },
     }
@@ -17,8 +17,13 @@ from homeassistant.components.recorder.db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.models import (
+    LazyState,
+    LazyStatePreSchema32,
+    process_timestamp,
 )
-from homeassistant.components.recorder.models import LazyState, process_timestamp
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, State
@@ -40,10 +45,17 @@ async def _async_get_states(
     """Get states from the database."""
 
     def _get_states_with_session():
+        if (
+            recorder.get_instance(hass).schema_version
+            < history.TIMESTAMP_SCHEMA_VERSION
+        ):
+            state_class = LazyStatePreSchema32
+        else:
+            state_class = LazyState
         with session_scope(hass=hass) as session:
             attr_cache = {}
             return [
-                LazyState(row, attr_cache)
+                state_class(row, attr_cache)
                 for row in history._get_rows_with_session(
                     hass,
                     session,
@@ -72,15 +84,18 @@ def _add_db_entries(
                     event_data="{}",
                     origin="LOCAL",
                     time_fired=point,
+                    time_fired_ts=dt_util.utc_to_timestamp(point),
                 )
             )
             session.add(
                 States(
                     entity_id=entity_id,
+                    states_meta_rel=StatesMeta(entity_id=entity_id),
                     state="on",
                     attributes='{"name":"the light"}',
                     last_changed=None,
                     last_updated=point,
+                    last_updated_ts=dt_util.utc_to_timestamp(point),
                     event_id=1001 + idx,
                     attributes_id=1002 + idx,
                 )
@@ -714,6 +729,48 @@ async def test_state_changes_during_period_query_during_migration_to_schema_25(
         assert state.attributes == {"name": "the light"}
 
 
+async def test_get_states_uses_latest_states(
+    async_setup_recorder_instance: SetupRecorderInstanceT, hass: ha.HomeAssistant
+):
+    """Test the states at a point in time are found from the latest states."""
+    instance = await async_setup_recorder_instance(hass, {})
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("sensor.two", "on")
+    await async_wait_recording_done(hass)
+    sensor_one_state = hass.states.get("sensor.one")
+    sensor_two_state = hass.states.get("sensor.two")
+    point = dt_util.utcnow()
+    hass.states.async_set("sensor.two", "off")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        metadata_ids = history._get_metadata_ids(session, ["sensor.one", "sensor.two"])
+    state_ids, changed_metadata_ids = instance.latest_states.get_before(
+        instance.run_history.current.start, point, metadata_ids
+    )
+    assert len(state_ids) == 1
+    assert len(changed_metadata_ids) == 1
+    # Nothing newer than the latest committed state is known
+    assert (
+        instance.latest_states.get_before(
+            instance.run_history.current.start,
+            dt_util.utcnow() + timedelta(seconds=1),
+        )
+        is None
+    )
+
+    states = await _async_get_states(hass, point, ["sensor.one", "sensor.two"])
+    assert {state.entity_id: state.state for state in states} == {
+        "sensor.one": sensor_one_state.state,
+        "sensor.two": sensor_two_state.state,
+    }
+    states = await _async_get_states(hass, point)
+    assert {state.entity_id: state.state for state in states} == {
+        "sensor.one": sensor_one_state.state,
+        "sensor.two": sensor_two_state.state,
+    }
+
+
 async def test_get_states_query_during_migration_to_schema_25(
     async_setup_recorder_instance: SetupRecorderInstanceT,
     hass: ha.HomeAssistant,
@@ -819,6 +876,111 @@ async def test_get_states_query_during_migration_to_schema_25_multiple_entities(
         assert hist[1].attributes == {"name": "the light"}
 
 
+async def test_get_states_query_during_migration_to_schema_31(
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    hass: ha.HomeAssistant,
+):
+    """Test we can query data prior to schema 31 and during migration to schema 31."""
+    instance = await async_setup_recorder_instance(hass, {})
+
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=1)
+    entity_id_1 = "light.test"
+    entity_id_2 = "switch.test"
+    entity_ids = [entity_id_1, entity_id_2]
+
+    def _add_legacy_db_entries():
+        with session_scope(hass=hass) as session:
+            for entity_id in entity_ids:
+                session.add(
+                    States(
+                        entity_id=entity_id,
+                        state="on",
+                        attributes='{"name":"the light"}',
+                        last_changed=None,
+                        last_updated=point,
+                    )
+                )
+
+    await instance.async_add_executor_job(_add_legacy_db_entries)
+
+    with patch.object(instance, "schema_version", 30):
+        hist = await _async_get_states(hass, end, entity_ids)
+        assert [state.entity_id for state in hist] == entity_ids
+        assert hist[0].attributes == {"name": "the light"}
+
+        hist = await _async_get_states(hass, end, [entity_id_1])
+        assert [state.entity_id for state in hist] == [entity_id_1]
+
+        hist = history.state_changes_during_period(
+            hass, start, end, entity_id_2, include_start_time_state=False
+        )
+        assert hist[entity_id_2][0].state == "on"
+
+    # Rows that have not been migrated yet are not
+    # found once the schema has been updated
+    hist = history.state_changes_during_period(
+        hass, start, end, entity_id_2, include_start_time_state=False
+    )
+    assert hist == {}
+
+
+async def test_get_states_query_during_migration_to_schema_32(
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    hass: ha.HomeAssistant,
+):
+    """Test we can query data prior to schema 32 and during migration to schema 32."""
+    instance = await async_setup_recorder_instance(hass, {})
+
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=1)
+    entity_id_1 = "light.test"
+    entity_id_2 = "switch.test"
+    entity_ids = [entity_id_1, entity_id_2]
+
+    def _add_pre_schema_32_db_entries():
+        with session_scope(hass=hass) as session:
+            for entity_id in entity_ids:
+                session.add(
+                    States(
+                        states_meta_rel=StatesMeta(entity_id=entity_id),
+                        state="on",
+                        attributes='{"name":"the light"}',
+                        last_changed=None,
+                        last_updated=point,
+                    )
+                )
+            session.flush()
+            session.query(States).update({States.last_updated_ts: None})
+
+    await instance.async_add_executor_job(_add_pre_schema_32_db_entries)
+
+    with patch.object(instance, "schema_version", 31):
+        hist = await _async_get_states(hass, end, entity_ids)
+        assert [state.entity_id for state in hist] == entity_ids
+        assert hist[0].attributes == {"name": "the light"}
+
+        hist = history.state_changes_during_period(
+            hass, start, end, entity_id_2, include_start_time_state=False
+        )
+        assert hist[entity_id_2][0].state == "on"
+        assert hist[entity_id_2][0].last_updated == point
+
+        hist = history.get_significant_states(
+            hass, start, end, entity_ids, compressed_state_format=True
+        )
+        assert hist[entity_id_1][0]["lu"] == point.timestamp()
+
+    # Rows that have not been migrated yet are not
+    # found once the schema has been updated
+    hist = history.state_changes_during_period(
+        hass, start, end, entity_id_2, include_start_time_state=False
+    )
+    assert hist == {}
+
+
 async def test_get_full_significant_states_handles_empty_last_changed(
     async_setup_recorder_instance: SetupRecorderInstanceT,
     hass: ha.HomeAssistant,
@@ -893,13 +1055,17 @@ async def test_get_full_significant_states_handles_empty_last_changed(
     db_sensor_one_states = await recorder.get_instance(hass).async_add_executor_job(
         _fetch_db_states
     )
-    assert db_sensor_one_states[0].last_changed is None
+    assert db_sensor_one_states[0].last_changed_ts is None
+    assert (
+        dt_util.utc_from_timestamp(db_sensor_one_states[1].last_changed_ts)
+        == state0.last_changed
+    )
+    assert db_sensor_one_states[0].last_updated_ts is not None
+    assert db_sensor_one_states[1].last_updated_ts is not None
     assert (
-        process_timestamp(db_sensor_one_states[1].last_changed) == state0.last_changed
+        db_sensor_one_states[0].last_updated_ts
+        != db_sensor_one_states[1].last_updated_ts
     )
-    assert db_sensor_one_states[0].last_updated is not None
-    assert db_sensor_one_states[1].last_updated is not None
-    assert db_sensor_one_states[0].last_updated != db_sensor_one_states[1].last_updated
 
 
 def test_state_changes_during_period_multiple_entities_single_test(hass_recorder):
@@ -32,9 +32,12 @@ from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
     EventData,
     Events,
+    EventTypes,
+    LogbookEntries,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
 )
 from homeassistant.components.recorder.models import process_timestamp
@@ -247,6 +250,53 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_many_states_in_one_commit_links_old_states(
+    recorder_mock, hass: HomeAssistant
+):
+    """Test states written in a single commit are linked to their old states."""
+    instance = get_instance(hass)
+    await async_wait_recording_done(hass)
+
+    with patch.object(instance, "_commit_event_session_or_retry"):
+        for idx in range(3):
+            hass.states.async_set("test.one", f"one_{idx}", {"idx": idx})
+            hass.states.async_set("test.two", f"two_{idx}", {"idx": idx})
+        hass.states.async_remove("test.two")
+        hass.states.async_set("test.two", "two_back")
+        await async_block_recorder(hass, 0.1)
+        assert len(instance._pending_states) == 8
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        rows = (
+            session.query(States, StatesMeta.entity_id, StateAttributes.shared_attrs)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+            .all()
+        )
+        state_ids = {db_state.state: db_state.state_id for db_state, _, _ in rows}
+        assert [
+            (entity_id, db_state.state, db_state.old_state_id, shared_attrs)
+            for db_state, entity_id, shared_attrs in rows
+        ] == [
+            ("test.one", "one_0", None, '{"idx":0}'),
+            ("test.two", "two_0", None, '{"idx":0}'),
+            ("test.one", "one_1", state_ids["one_0"], '{"idx":1}'),
+            ("test.two", "two_1", state_ids["two_0"], '{"idx":1}'),
+            ("test.one", "one_2", state_ids["one_1"], '{"idx":2}'),
+            ("test.two", "two_2", state_ids["two_1"], '{"idx":2}'),
+            ("test.two", None, state_ids["two_2"], "{}"),
+            ("test.two", "two_back", None, "{}"),
+        ]
+
+    assert not instance._pending_states
+    assert instance._old_states["test.one"].state_id == state_ids["one_2"]
+    assert instance._old_states["test.two"].state_id == state_ids["two_back"]
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock, hass: HomeAssistant
 ):
@@ -280,11 +330,8 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass)._pending_states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -318,11 +365,8 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass)._pending_states:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -407,7 +451,8 @@ def test_saving_event(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         for select_event, event_data in (
             session.query(Events, EventData)
-            .filter_by(event_type=event_type)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == event_type)
             .outerjoin(EventData, Events.data_id == EventData.data_id)
         ):
             select_event = cast(Events, select_event)
@@ -642,11 +687,11 @@ def test_saving_state_and_removing_entity(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         states = list(session.query(States))
         assert len(states) == 3
-        assert states[0].entity_id == entity_id
+        assert states[0].states_meta_rel.entity_id == entity_id
         assert states[0].state == STATE_LOCKED
-        assert states[1].entity_id == entity_id
+        assert states[1].states_meta_rel.entity_id == entity_id
         assert states[1].state == STATE_UNLOCKED
-        assert states[2].entity_id == entity_id
+        assert states[2].states_meta_rel.entity_id == entity_id
         assert states[2].state is None
 
 
@@ -1061,10 +1106,10 @@ def test_saving_sets_old_state(hass_recorder):
         states = list(session.query(States))
         assert len(states) == 4
 
-        assert states[0].entity_id == "test.one"
-        assert states[1].entity_id == "test.two"
-        assert states[2].entity_id == "test.one"
-        assert states[3].entity_id == "test.two"
+        assert states[0].states_meta_rel.entity_id == "test.one"
+        assert states[1].states_meta_rel.entity_id == "test.two"
+        assert states[2].states_meta_rel.entity_id == "test.one"
+        assert states[3].states_meta_rel.entity_id == "test.two"
 
         assert states[0].old_state_id is None
         assert states[1].old_state_id is None
@@ -1072,6 +1117,42 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_state_changes_writes_logbook_entries(hass_recorder):
+    """Test only states that changed value get a logbook entry."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "on", {"icon": "mdi:one"})
+    hass.states.set("sensor.two", "1", {"unit_of_measurement": "W"})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "on", {"icon": "mdi:one", "changed": True})
+    hass.states.set("sensor.two", "2", {"unit_of_measurement": "W"})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"icon": "mdi:one"})
+    hass.states.remove("sensor.two")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        rows = (
+            session.query(LogbookEntries, States)
+            .join(States, LogbookEntries.state_id == States.state_id)
+            .order_by(LogbookEntries.state_id)
+            .all()
+        )
+        assert [
+            (
+                states.state,
+                entry.metadata_id == states.metadata_id,
+                entry.last_updated_ts == states.last_updated_ts,
+                entry.icon,
+                entry.has_unit,
+            )
+            for entry, states in rows
+        ] == [
+            ("2", True, True, None, True),
+            ("off", True, True, "mdi:one", False),
+        ]
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -1088,8 +1169,8 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
         states = list(session.query(States))
         assert len(states) == 2
 
-        assert states[0].entity_id == "test.two"
-        assert states[1].entity_id == "test.two"
+        assert states[0].states_meta_rel.entity_id == "test.two"
+        assert states[1].states_meta_rel.entity_id == "test.two"
         assert states[0].old_state_id is None
         assert states[1].old_state_id == states[0].state_id
 
@@ -1137,7 +1218,11 @@ def test_service_disable_events_not_recording(hass, hass_recorder):
     event = events[0]
 
     with session_scope(hass=hass) as session:
-        db_events = list(session.query(Events).filter_by(event_type=event_type))
+        db_events = list(
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == event_type)
+        )
         assert len(db_events) == 0
 
     assert hass.services.call(
@@ -1159,7 +1244,8 @@ def test_service_disable_events_not_recording(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         for select_event, event_data in (
             session.query(Events, EventData)
-            .filter_by(event_type=event_type)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == event_type)
             .outerjoin(EventData, Events.data_id == EventData.data_id)
         ):
             select_event = cast(Events, select_event)
@@ -1353,7 +1439,11 @@ def test_entity_id_filter(hass_recorder):
         wait_recording_done(hass)
 
         with session_scope(hass=hass) as session:
-            db_events = list(session.query(Events).filter_by(event_type="hello"))
+            db_events = list(
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == "hello")
+            )
             assert len(db_events) == idx + 1, data
 
     for data in (
@@ -1364,7 +1454,11 @@ def test_entity_id_filter(hass_recorder):
         wait_recording_done(hass)
 
         with session_scope(hass=hass) as session:
-            db_events = list(session.query(Events).filter_by(event_type="hello"))
+            db_events = list(
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == "hello")
+            )
             # Keep referring idx + 1, as no new events are being added
             assert len(db_events) == idx + 1, data
 
@@ -1385,7 +1479,11 @@ async def test_database_lock_and_unlock(
 
     def _get_db_events():
         with session_scope(hass=hass) as session:
-            return list(session.query(Events).filter_by(event_type=event_type))
+            return list(
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == event_type)
+            )
 
     instance = get_instance(hass)
 
@@ -1427,7 +1525,11 @@ async def test_database_lock_and_overflow(
 
     def _get_db_events():
         with session_scope(hass=hass) as session:
-            return list(session.query(Events).filter_by(event_type=event_type))
+            return list(
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == event_type)
+            )
 
     instance = get_instance(hass)
 
@@ -1553,7 +1655,8 @@ def test_deduplication_event_data_inside_commit_interval(hass_recorder, caplog):
     with session_scope(hass=hass) as session:
         events = list(
             session.query(Events)
-            .filter(Events.event_type == "this_event")
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "this_event")
             .outerjoin(EventData, (Events.data_id == EventData.data_id))
         )
         assert len(events) == 20
@@ -1588,7 +1691,8 @@ def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, ca
     with session_scope(hass=hass) as session:
         states = list(
             session.query(States)
-            .filter(States.entity_id == entity_id)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
             .outerjoin(
                 StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
             )
@@ -1599,6 +1703,52 @@ def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, ca
         assert first_attributes_id == last_attributes_id
 
 
+# Patch the id cache sizes since otherwise
+# the CI can fail because the test takes too long to run
+@patch("homeassistant.components.recorder.core.STATES_META_ID_CACHE_SIZE", 2)
+@patch("homeassistant.components.recorder.core.EVENT_TYPE_ID_CACHE_SIZE", 2)
+def test_deduplication_states_meta_and_event_types(hass_recorder):
+    """Test entity_ids and event_types are only stored once."""
+    hass = hass_recorder()
+
+    for _ in range(2):
+        hass.states.set("test.one", "on")
+        hass.states.set("test.one", "off")
+        hass.bus.fire("this_event", {})
+    wait_recording_done(hass)
+
+    # Now exaust the caches to ensure we go back to the db
+    for idx in range(5):
+        hass.states.set(f"test.other_{idx}", "on")
+        hass.bus.fire(f"other_event_{idx}", {})
+    wait_recording_done(hass)
+
+    hass.states.set("test.one", "on")
+    hass.bus.fire("this_event", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states_meta = list(
+            session.query(StatesMeta).filter(StatesMeta.entity_id == "test.one")
+        )
+        assert len(states_meta) == 1
+        metadata_id = states_meta[0].metadata_id
+        states = list(session.query(States).filter(States.metadata_id == metadata_id))
+        assert len(states) == 5
+        assert all(state.entity_id is None for state in states)
+
+        event_types = list(
+            session.query(EventTypes).filter(EventTypes.event_type == "this_event")
+        )
+        assert len(event_types) == 1
+        event_type_id = event_types[0].event_type_id
+        events = list(
+            session.query(Events).filter(Events.event_type_id == event_type_id)
+        )
+        assert len(events) == 3
+        assert all(event.event_type is None for event in events)
+
+
 async def test_async_block_till_done(async_setup_recorder_instance, hass):
     """Test we can block until recordering is done."""
     instance = await async_setup_recorder_instance(hass)
@@ -1612,7 +1762,11 @@ async def test_async_block_till_done(async_setup_recorder_instance, hass):
 
     def _fetch_states():
         with session_scope(hass=hass) as session:
-            return list(session.query(States).filter(States.entity_id == entity_id))
+            return list(
+                session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == entity_id)
+            )
 
     await async_block_recorder(hass, 0.1)
     await instance.async_block_till_done()
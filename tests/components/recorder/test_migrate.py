@@ -8,7 +8,7 @@ import threading
 from unittest.mock import Mock, PropertyMock, call, patch
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, func, text
 from sqlalchemy.exc import (
     DatabaseError,
     InternalError,
@@ -20,15 +20,20 @@ from sqlalchemy.pool import StaticPool
 
 from homeassistant.bootstrap import async_setup_component
 from homeassistant.components import persistent_notification as pn, recorder
-from homeassistant.components.recorder import db_schema, migration
+from homeassistant.components.recorder import db_schema, history, migration
 from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
+    Events,
+    EventTypes,
     RecorderRuns,
     States,
+    StatesMeta,
 )
+from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.helpers import recorder as recorder_helper
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import ulid_to_bytes
 
 from .common import async_wait_recording_done, create_engine_test
 
@@ -41,7 +46,9 @@ def _get_native_states(hass, entity_id):
     with session_scope(hass=hass) as session:
         return [
             state.to_native()
-            for state in session.query(States).filter(States.entity_id == entity_id)
+            for state in session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
         ]
 
 
@@ -362,6 +369,412 @@ async def test_schema_migrate(hass, start_version, live):
         assert recorder.util.async_migration_in_progress(hass) is not True
 
 
+async def test_migrate_entity_ids_and_event_types(hass):
+    """Test entity_ids and event_types are moved to their own tables in schema 31."""
+    module = "tests.components.recorder.db_schema_30"
+    importlib.import_module(module)
+    old_db_schema = sys.modules[module]
+    now = dt_util.utcnow()
+    max_old_state_id = max_old_event_id = None
+
+    def _create_engine_30(*args, **kwargs):
+        """Test version of create_engine that initializes with the schema 30."""
+        nonlocal max_old_state_id, max_old_event_id
+        engine = create_engine(*args, **kwargs)
+        old_db_schema.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(db_schema.SchemaChanges(schema_version=30))
+            for idx in range(3):
+                for entity_id in ("sensor.one", "sensor.two"):
+                    session.add(
+                        old_db_schema.States(
+                            entity_id=entity_id,
+                            state=str(idx),
+                            last_changed=now,
+                            last_updated=now,
+                        )
+                    )
+                session.add(
+                    old_db_schema.Events(
+                        event_type="custom_event",
+                        origin_idx=0,
+                        time_fired=now,
+                    )
+                )
+            session.commit()
+            max_old_state_id = session.query(
+                func.max(old_db_schema.States.state_id)
+            ).scalar()
+            max_old_event_id = session.query(
+                func.max(old_db_schema.Events.event_id)
+            ).scalar()
+        return engine
+
+    with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True), patch(
+        "homeassistant.components.recorder.core.create_engine",
+        new=_create_engine_30,
+    ), patch.object(recorder.migration, "MIGRATION_BATCH_SIZE", 2):
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": "sqlite://"}}
+        )
+        await recorder.get_instance(hass).async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+
+    assert recorder.util.async_migration_in_progress(hass) is False
+
+    def _get_migrated_rows():
+        with session_scope(hass=hass) as session:
+            states_meta = {
+                states_meta.metadata_id: states_meta.entity_id
+                for states_meta in session.query(StatesMeta)
+            }
+            event_types = {
+                event_type.event_type_id: event_type.event_type
+                for event_type in session.query(EventTypes)
+            }
+            states = [
+                (state.entity_id, states_meta[state.metadata_id])
+                for state in session.query(States).filter(
+                    States.state_id <= max_old_state_id
+                )
+            ]
+            events = [
+                (event.event_type, event_types[event.event_type_id])
+                for event in session.query(Events).filter(
+                    Events.event_id <= max_old_event_id
+                )
+            ]
+            # Rows written after the migration only have the new columns
+            new_states = [
+                (state.entity_id, state.metadata_id)
+                for state in session.query(States).filter(
+                    States.state_id > max_old_state_id
+                )
+            ]
+            new_events = [
+                (event.event_type, event.event_type_id)
+                for event in session.query(Events).filter(
+                    Events.event_id > max_old_event_id
+                )
+            ]
+            return states_meta, event_types, states, events, new_states, new_events
+
+    (
+        states_meta,
+        event_types,
+        states,
+        events,
+        new_states,
+        new_events,
+    ) = await recorder.get_instance(hass).async_add_executor_job(_get_migrated_rows)
+    assert {"sensor.one", "sensor.two"}.issubset(states_meta.values())
+    assert "custom_event" in event_types.values()
+    assert new_states
+    assert all(metadata_id is not None for _, metadata_id in new_states)
+    assert all(event_type_id is not None for _, event_type_id in new_events)
+    # Every row written by the schema 30 engine has been moved over and the
+    # old columns are kept until the rows are purged
+    assert all(entity_id == meta_entity_id for entity_id, meta_entity_id in states)
+    assert all(event_type == type_event_type for event_type, type_event_type in events)
+    assert [entity_id for _, entity_id in states].count("sensor.one") == 3
+    assert [entity_id for _, entity_id in states].count("sensor.two") == 3
+    assert [event_type for _, event_type in events].count("custom_event") == 3
+
+    db_states = await recorder.get_instance(hass).async_add_executor_job(
+        _get_native_states, hass, "sensor.one"
+    )
+    assert [state.state for state in db_states] == ["0", "1", "2"]
+
+
+async def test_migrate_times_to_timestamps(hass):
+    """Test state and event times are converted to timestamps in schema 32."""
+    module = "tests.components.recorder.db_schema_31"
+    importlib.import_module(module)
+    old_db_schema = sys.modules[module]
+    now = dt_util.utcnow()
+    one_minute_ago = now - datetime.timedelta(minutes=1)
+
+    def _create_engine_31(*args, **kwargs):
+        """Test version of create_engine that initializes with the schema 31."""
+        engine = create_engine(*args, **kwargs)
+        old_db_schema.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(db_schema.SchemaChanges(schema_version=31))
+            states_meta = old_db_schema.StatesMeta(entity_id="sensor.one")
+            event_type = old_db_schema.EventTypes(event_type="custom_event")
+            for idx in range(3):
+                session.add(
+                    old_db_schema.States(
+                        states_meta_rel=states_meta,
+                        state=str(idx),
+                        last_changed=one_minute_ago if idx else None,
+                        last_updated=now,
+                    )
+                )
+                session.add(
+                    old_db_schema.Events(
+                        event_type_rel=event_type,
+                        origin_idx=0,
+                        time_fired=now,
+                    )
+                )
+            session.commit()
+        return engine
+
+    with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True), patch(
+        "homeassistant.components.recorder.core.create_engine",
+        new=_create_engine_31,
+    ), patch.object(recorder.migration, "MIGRATION_BATCH_SIZE", 2):
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": "sqlite://"}}
+        )
+        await recorder.get_instance(hass).async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+
+    assert recorder.util.async_migration_in_progress(hass) is False
+
+    def _get_migrated_rows():
+        with session_scope(hass=hass) as session:
+            states = [
+                (
+                    process_timestamp(state.last_updated),
+                    process_timestamp(state.last_changed),
+                    state.last_updated_ts,
+                    state.last_changed_ts,
+                )
+                for state in session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "sensor.one")
+            ]
+            events = [
+                (process_timestamp(event.time_fired), event.time_fired_ts)
+                for event in session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == "custom_event")
+            ]
+            return states, events
+
+    states, events = await recorder.get_instance(hass).async_add_executor_job(
+        _get_migrated_rows
+    )
+    # Every row has been converted and the old columns are kept
+    # until the rows are purged
+    assert states == [
+        (now, None, now.timestamp(), None),
+        (now, one_minute_ago, now.timestamp(), one_minute_ago.timestamp()),
+        (now, one_minute_ago, now.timestamp(), one_minute_ago.timestamp()),
+    ]
+    assert events == [(now, now.timestamp())] * 3
+
+    db_states = await recorder.get_instance(hass).async_add_executor_job(
+        _get_native_states, hass, "sensor.one"
+    )
+    assert [state.last_updated for state in db_states] == [now] * 3
+    assert [state.last_changed for state in db_states] == [
+        now,
+        one_minute_ago,
+        one_minute_ago,
+    ]
+
+
+async def test_migrate_context_ids_to_binary(hass):
+    """Test state and event context ids are converted to binary in schema 33."""
+    module = "tests.components.recorder.db_schema_32"
+    importlib.import_module(module)
+    old_db_schema = sys.modules[module]
+    ulid_context_id = "01GTDGKBCH00GW0X476W5TVAAA"
+    ulid_parent_id = "01GTDGKBCH00GW0X476W5TVBBB"
+    uuid_context_id = "ac5bd62de45711eaaeb351041eec8dd9"
+    user_id = "b400facee45711eaa9308bfd3d19e474"
+    contexts = [
+        (ulid_context_id, user_id, ulid_parent_id),
+        (uuid_context_id, None, None),
+        ("invalid", "invalid", None),
+    ]
+
+    def _create_engine_32(*args, **kwargs):
+        """Test version of create_engine that initializes with the schema 32."""
+        engine = create_engine(*args, **kwargs)
+        old_db_schema.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(db_schema.SchemaChanges(schema_version=32))
+            states_meta = old_db_schema.StatesMeta(entity_id="sensor.one")
+            event_type = old_db_schema.EventTypes(event_type="custom_event")
+            for idx, (context_id, context_user_id, context_parent_id) in enumerate(
+                contexts
+            ):
+                session.add(
+                    old_db_schema.States(
+                        states_meta_rel=states_meta,
+                        state=str(idx),
+                        last_updated_ts=idx,
+                        context_id=context_id,
+                        context_user_id=context_user_id,
+                        context_parent_id=context_parent_id,
+                    )
+                )
+                session.add(
+                    old_db_schema.Events(
+                        event_type_rel=event_type,
+                        origin_idx=0,
+                        time_fired_ts=idx,
+                        context_id=context_id,
+                        context_user_id=context_user_id,
+                        context_parent_id=context_parent_id,
+                    )
+                )
+            session.commit()
+        return engine
+
+    with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True), patch(
+        "homeassistant.components.recorder.core.create_engine",
+        new=_create_engine_32,
+    ), patch.object(recorder.migration, "MIGRATION_BATCH_SIZE", 2):
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": "sqlite://"}}
+        )
+        await recorder.get_instance(hass).async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+
+    assert recorder.util.async_migration_in_progress(hass) is False
+
+    def _get_migrated_rows():
+        with session_scope(hass=hass) as session:
+            states = [
+                (
+                    state.context_id,
+                    state.context_user_id,
+                    state.context_parent_id,
+                    state.context_id_bin,
+                    state.context_user_id_bin,
+                    state.context_parent_id_bin,
+                )
+                for state in session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "sensor.one")
+                .order_by(States.last_updated_ts)
+            ]
+            events = [
+                (
+                    event.context_id,
+                    event.context_user_id,
+                    event.context_parent_id,
+                    event.context_id_bin,
+                    event.context_user_id_bin,
+                    event.context_parent_id_bin,
+                )
+                for event in session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == "custom_event")
+                .order_by(Events.time_fired_ts)
+            ]
+            return states, events
+
+    states, events = await recorder.get_instance(hass).async_add_executor_job(
+        _get_migrated_rows
+    )
+    # Every row has been converted and the old columns are kept
+    # until the rows are purged
+    expected = [
+        (
+            ulid_context_id,
+            user_id,
+            ulid_parent_id,
+            ulid_to_bytes(ulid_context_id),
+            bytes.fromhex(user_id),
+            ulid_to_bytes(ulid_parent_id),
+        ),
+        (uuid_context_id, None, None, bytes.fromhex(uuid_context_id), None, None),
+        ("invalid", "invalid", None, None, None, None),
+    ]
+    assert states == expected
+    assert events == expected
+
+    db_states = await recorder.get_instance(hass).async_add_executor_job(
+        _get_native_states, hass, "sensor.one"
+    )
+    context = db_states[0].context
+    assert context.id == ulid_context_id
+    assert context.user_id == user_id
+    assert context.parent_id == ulid_parent_id
+
+
+async def test_history_during_migration(hass):
+    """Test history returns every state while the rows are being migrated."""
+    module = "tests.components.recorder.db_schema_30"
+    importlib.import_module(module)
+    old_db_schema = sys.modules[module]
+    now = dt_util.utcnow()
+    real_batched_id_ranges = migration._batched_id_ranges
+    states_during_migration = []
+
+    def _create_engine_30(*args, **kwargs):
+        """Test version of create_engine that initializes with the schema 30."""
+        engine = create_engine(*args, **kwargs)
+        old_db_schema.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(db_schema.SchemaChanges(schema_version=30))
+            for idx in range(3):
+                for entity_id in ("sensor.one", "sensor.two"):
+                    session.add(
+                        old_db_schema.States(
+                            entity_id=entity_id,
+                            state=str(idx),
+                            last_changed=now + datetime.timedelta(seconds=idx),
+                            last_updated=now + datetime.timedelta(seconds=idx),
+                            context_id=f"{idx:026}",
+                        )
+                    )
+            session.commit()
+        return engine
+
+    def _batched_id_ranges(session_maker, id_column):
+        """Query the history after every batch of migrated states."""
+        for id_range in real_batched_id_ranges(session_maker, id_column):
+            yield id_range
+            if id_column is not States.state_id:
+                continue
+            states = history.get_significant_states(
+                hass,
+                now - datetime.timedelta(minutes=1),
+                entity_ids=["sensor.one"],
+                include_start_time_state=False,
+            )
+            states_during_migration.append(
+                (
+                    recorder.get_instance(hass).schema_version,
+                    [state.state for state in states["sensor.one"]],
+                )
+            )
+
+    with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True), patch(
+        "homeassistant.components.recorder.core.create_engine",
+        new=_create_engine_30,
+    ), patch.object(recorder.migration, "MIGRATION_BATCH_SIZE", 2), patch.object(
+        migration, "_batched_id_ranges", _batched_id_ranges
+    ):
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": "sqlite://"}}
+        )
+        await recorder.get_instance(hass).async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+
+    assert recorder.util.async_migration_in_progress(hass) is False
+    # History was queried while the entity_ids, the times and the
+    # context ids were being migrated and always found every state
+    assert {schema_version for schema_version, _ in states_during_migration} == {
+        30,
+        31,
+        32,
+    }
+    for _, states in states_during_migration:
+        assert states == ["0", "1", "2"]
+
+
 def test_invalid_update(hass):
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
@@ -410,6 +823,25 @@ def test_forgiving_add_column():
         )
 
 
+def test_batched_id_ranges_start_at_lowest_id():
+    """Test the migration batches start at the lowest id left after a purge."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    db_schema.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for state_id in range(1000, 1005):
+            session.add(States(state_id=state_id, state="on"))
+        session.commit()
+
+    with patch.object(migration, "MIGRATION_BATCH_SIZE", 2):
+        assert list(
+            migration._batched_id_ranges(lambda: Session(engine), States.state_id)
+        ) == [(1000, 1002), (1002, 1004), (1004, 1006)]
+        assert (
+            list(migration._batched_id_ranges(lambda: Session(engine), Events.event_id))
+            == []
+        )
+
+
 def test_forgiving_add_index():
     """Test that add index will continue if index exists."""
     engine = create_engine("sqlite://", poolclass=StaticPool)
@@ -11,12 +11,15 @@ from homeassistant.components.recorder.db_schema import (
     Base,
     EventData,
     Events,
+    EventTypes,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
 )
 from homeassistant.components.recorder.models import (
     LazyState,
+    LazyStatePreSchema32,
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -25,6 +28,7 @@ from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt, dt as dt_util
+from homeassistant.util.ulid import ulid_to_bytes
 
 
 def test_from_event_to_db_event():
@@ -32,6 +36,7 @@ def test_from_event_to_db_event():
     event = ha.Event("test_event", {"some_data": 15})
     db_event = Events.from_event(event)
     db_event.event_data = EventData.from_event(event).shared_data
+    db_event.event_type_rel = EventTypes(event_type=event.event_type)
     assert event == db_event.to_native()
 
 
@@ -43,7 +48,59 @@ def test_from_event_to_db_state():
         {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
         context=state.context,
     )
-    assert state == States.from_event(event).to_native()
+    db_state = States.from_event(event)
+    db_state.states_meta_rel = StatesMeta(entity_id=state.entity_id)
+    assert state == db_state.to_native()
+
+
+def test_from_event_to_db_context_ids():
+    """Test context ids are stored as bytes and converted back."""
+    context = ha.Context(
+        user_id="b400facee45711eaa9308bfd3d19e474",
+        parent_id="01GTDGKBCH00GW0X476W5TVAAA",
+    )
+    event = ha.Event("test_event", {}, context=context)
+    db_event = Events.from_event(event)
+    assert db_event.context_id is None
+    assert len(db_event.context_id_bin) == 16
+    assert db_event.context_user_id_bin == bytes.fromhex(context.user_id)
+    assert db_event.context_parent_id_bin == ulid_to_bytes(context.parent_id)
+    db_event.event_type_rel = EventTypes(event_type=event.event_type)
+    assert db_event.to_native().context == context
+
+    state = ha.State("sensor.temperature", "18", context=context)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=context,
+    )
+    db_state = States.from_event(event)
+    db_state.states_meta_rel = StatesMeta(entity_id=state.entity_id)
+    assert db_state.context_id is None
+    assert db_state.to_native().context == context
+
+
+def test_context_ids_not_yet_migrated():
+    """Test rows with string context ids that have not been migrated yet."""
+    db_event = Events(
+        event_type="test_event",
+        origin_idx=0,
+        time_fired_ts=1,
+        context_id="ac5bd62de45711eaaeb351041eec8dd9",
+        context_user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    context = db_event.to_native().context
+    assert context.id == "ac5bd62de45711eaaeb351041eec8dd9"
+    assert context.user_id == "b400facee45711eaa9308bfd3d19e474"
+    assert context.parent_id is None
+
+
+def test_invalid_context_ids_are_not_stored():
+    """Test context ids that are not ulids or uuids are not stored."""
+    event = ha.Event("test_event", {}, context=ha.Context(id="1234", user_id="5678"))
+    db_event = Events.from_event(event)
+    assert db_event.context_id_bin is None
+    assert db_event.context_user_id_bin is None
 
 
 def test_from_event_to_db_state_attributes():
@@ -79,10 +136,11 @@ def test_from_event_to_delete_state():
     )
     db_state = States.from_event(event)
 
-    assert db_state.entity_id == "sensor.temperature"
+    assert db_state.entity_id is None
+    assert db_state.metadata_id is None
     assert db_state.state == ""
-    assert db_state.last_changed is None
-    assert db_state.last_updated == event.time_fired
+    assert db_state.last_changed_ts is None
+    assert db_state.last_updated_ts == event.time_fired.timestamp()
 
 
 def test_entity_ids():
@@ -117,35 +175,35 @@ def test_entity_ids():
 
     session.add(
         States(
-            entity_id="sensor.temperature",
+            states_meta_rel=StatesMeta(entity_id="sensor.temperature"),
             state="20",
-            last_changed=before_run,
-            last_updated=before_run,
+            last_changed_ts=dt_util.utc_to_timestamp(before_run),
+            last_updated_ts=dt_util.utc_to_timestamp(before_run),
         )
     )
     session.add(
         States(
-            entity_id="sensor.sound",
+            states_meta_rel=StatesMeta(entity_id="sensor.sound"),
             state="10",
-            last_changed=after_run,
-            last_updated=after_run,
+            last_changed_ts=dt_util.utc_to_timestamp(after_run),
+            last_updated_ts=dt_util.utc_to_timestamp(after_run),
         )
     )
 
     session.add(
         States(
-            entity_id="sensor.humidity",
+            states_meta_rel=StatesMeta(entity_id="sensor.humidity"),
             state="76",
-            last_changed=in_run,
-            last_updated=in_run,
+            last_changed_ts=dt_util.utc_to_timestamp(in_run),
+            last_updated_ts=dt_util.utc_to_timestamp(in_run),
         )
     )
     session.add(
         States(
-            entity_id="sensor.lux",
+            states_meta_rel=StatesMeta(entity_id="sensor.lux"),
             state="5",
-            last_changed=in_run3,
-            last_updated=in_run3,
+            last_changed_ts=dt_util.utc_to_timestamp(in_run3),
+            last_updated_ts=dt_util.utc_to_timestamp(in_run3),
         )
     )
 
@@ -237,10 +295,13 @@ async def test_event_to_db_model():
     )
     db_event = Events.from_event(event)
     db_event.event_data = EventData.from_event(event).shared_data
+    db_event.event_type_rel = EventTypes(event_type=event.event_type)
     native = db_event.to_native()
     assert native == event
 
-    native = Events.from_event(event).to_native()
+    db_event = Events.from_event(event)
+    db_event.event_type_rel = EventTypes(event_type=event.event_type)
+    native = db_event.to_native()
     event.data = {}
     assert native == event
 
@@ -268,6 +329,82 @@ async def test_lazy_state_prefers_shared_attrs_over_attrs(caplog):
 async def test_lazy_state_handles_different_last_updated_and_last_changed(caplog):
     """Test that the LazyState handles different last_updated and last_changed."""
     now = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
+    row = PropertyMock(
+        entity_id="sensor.valid",
+        state="off",
+        shared_attrs='{"shared":true}',
+        last_updated_ts=now.timestamp(),
+        last_changed_ts=(now - timedelta(seconds=60)).timestamp(),
+    )
+    lstate = LazyState(row, {})
+    assert lstate.as_dict() == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2021-06-12T03:03:01.000323+00:00",
+        "last_updated": "2021-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+    assert lstate.last_updated.timestamp() == row.last_updated_ts
+    assert lstate.last_changed.timestamp() == row.last_changed_ts
+    assert lstate.as_dict() == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2021-06-12T03:03:01.000323+00:00",
+        "last_updated": "2021-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+
+
+async def test_lazy_state_handles_same_last_updated_and_last_changed(caplog):
+    """Test that the LazyState handles same last_updated and last_changed."""
+    now = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
+    row = PropertyMock(
+        entity_id="sensor.valid",
+        state="off",
+        shared_attrs='{"shared":true}',
+        last_updated_ts=now.timestamp(),
+        last_changed_ts=now.timestamp(),
+    )
+    lstate = LazyState(row, {})
+    assert lstate.as_dict() == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2021-06-12T03:04:01.000323+00:00",
+        "last_updated": "2021-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+    assert lstate.last_updated.timestamp() == row.last_updated_ts
+    assert lstate.last_changed.timestamp() == row.last_changed_ts
+    assert lstate.as_dict() == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2021-06-12T03:04:01.000323+00:00",
+        "last_updated": "2021-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+    lstate.last_updated = datetime(2020, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
+    assert lstate.as_dict() == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2021-06-12T03:04:01.000323+00:00",
+        "last_updated": "2020-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+    lstate.last_changed = datetime(2020, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
+    assert lstate.as_dict() == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2020-06-12T03:04:01.000323+00:00",
+        "last_updated": "2020-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+
+
+async def test_lazy_state_pre_schema_32_handles_different_last_updated_and_last_changed(
+    caplog,
+):
+    """Test that the LazyStatePreSchema32 handles different last_updated and last_changed."""
+    now = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
     row = PropertyMock(
         entity_id="sensor.valid",
         state="off",
@@ -275,7 +412,7 @@ async def test_lazy_state_handles_different_last_updated_and_last_changed(caplog
         last_updated=now,
         last_changed=now - timedelta(seconds=60),
     )
-    lstate = LazyState(row, {})
+    lstate = LazyStatePreSchema32(row, {})
     assert lstate.as_dict() == {
         "attributes": {"shared": True},
         "entity_id": "sensor.valid",
@@ -294,8 +431,10 @@ async def test_lazy_state_handles_different_last_updated_and_last_changed(caplog
     }
 
 
-async def test_lazy_state_handles_same_last_updated_and_last_changed(caplog):
-    """Test that the LazyState handles same last_updated and last_changed."""
+async def test_lazy_state_pre_schema_32_handles_same_last_updated_and_last_changed(
+    caplog,
+):
+    """Test that the LazyStatePreSchema32 handles same last_updated and last_changed."""
     now = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
     row = PropertyMock(
         entity_id="sensor.valid",
@@ -304,7 +443,7 @@ async def test_lazy_state_handles_same_last_updated_and_last_changed(caplog):
         last_updated=now,
         last_changed=now,
     )
-    lstate = LazyState(row, {})
+    lstate = LazyStatePreSchema32(row, {})
     assert lstate.as_dict() == {
         "attributes": {"shared": True},
         "entity_id": "sensor.valid",
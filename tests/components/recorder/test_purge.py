@@ -13,12 +13,15 @@ from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE, Supported
 from homeassistant.components.recorder.db_schema import (
     EventData,
     Events,
+    EventTypes,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
+from homeassistant.components.recorder.models import process_datetime_to_timestamp
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -70,7 +73,11 @@ async def test_purge_old_states(
         assert states[5].old_state_id == states[4].state_id
         assert state_attributes.count() == 3
 
-        events = session.query(Events).filter(Events.event_type == "state_changed")
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "state_changed")
+        )
         assert events.count() == 0
         assert "test.recorder2" in instance._old_states
 
@@ -126,7 +133,11 @@ async def test_purge_old_states(
         assert states[0].old_state_id is None
         assert states[5].old_state_id == states[4].state_id
 
-        events = session.query(Events).filter(Events.event_type == "state_changed")
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "state_changed")
+        )
         assert events.count() == 0
         assert "test.recorder2" in instance._old_states
 
@@ -237,7 +248,11 @@ async def test_purge_old_events(
     await _add_test_events(hass)
 
     with session_scope(hass=hass) as session:
-        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type.like("EVENT_TEST%"))
+        )
         assert events.count() == 6
 
         purge_before = dt_util.utcnow() - timedelta(days=4)
@@ -361,7 +376,11 @@ async def test_purge_method(
         states = session.query(States)
         assert states.count() == 6
 
-        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type.like("EVENT_TEST%"))
+        )
         assert events.count() == 6
 
         statistics = session.query(StatisticsShortTerm)
@@ -392,7 +411,11 @@ async def test_purge_method(
 
     with session_scope(hass=hass) as session:
         states = session.query(States)
-        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type.like("EVENT_TEST%"))
+        )
         statistics = session.query(StatisticsShortTerm)
 
         # only purged old states, events and statistics
@@ -409,7 +432,11 @@ async def test_purge_method(
 
     with session_scope(hass=hass) as session:
         states = session.query(States)
-        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type.like("EVENT_TEST%"))
+        )
         statistics = session.query(StatisticsShortTerm)
         recorder_runs = session.query(RecorderRuns)
         statistics_runs = session.query(StatisticsRuns)
@@ -431,7 +458,9 @@ async def test_purge_method(
         assert_statistic_runs_equal(runs[1], statistic_runs_before_purge[5])
         assert_statistic_runs_equal(runs[2], statistic_runs_before_purge[6])
 
-        assert "EVENT_TEST_PURGE" not in (event.event_type for event in events.all())
+        assert "EVENT_TEST_PURGE" not in (
+            event.event_type_rel.event_type for event in events.all()
+        )
 
     # run purge method - correct service data, with repack
     service_data["repack"] = True
@@ -481,6 +510,7 @@ async def test_purge_edge_case(
                     attributes_id=1002,
                 )
             )
+            _convert_pending_states_and_events_to_current_schema(session)
 
     await async_setup_recorder_instance(hass, None)
     await async_wait_purge_done(hass)
@@ -496,7 +526,11 @@ async def test_purge_edge_case(
         state_attributes = session.query(StateAttributes)
         assert state_attributes.count() == 1
 
-        events = session.query(Events).filter(Events.event_type == "EVENT_TEST_PURGE")
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_TEST_PURGE")
+        )
         assert events.count() == 1
 
     await hass.services.async_call(recorder.DOMAIN, SERVICE_PURGE, service_data)
@@ -508,7 +542,11 @@ async def test_purge_edge_case(
     with session_scope(hass=hass) as session:
         states = session.query(States)
         assert states.count() == 0
-        events = session.query(Events).filter(Events.event_type == "EVENT_TEST_PURGE")
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_TEST_PURGE")
+        )
         assert events.count() == 0
 
 
@@ -578,6 +616,7 @@ async def test_purge_cutoff_date(
                         attributes_id=1000 + row,
                     )
                 )
+            _convert_pending_states_and_events_to_current_schema(session)
 
     instance = await async_setup_recorder_instance(hass, None)
     await async_wait_purge_done(hass)
@@ -592,7 +631,9 @@ async def test_purge_cutoff_date(
     with session_scope(hass=hass) as session:
         states = session.query(States)
         state_attributes = session.query(StateAttributes)
-        events = session.query(Events)
+        events = session.query(Events).join(
+            EventTypes, Events.event_type_id == EventTypes.event_type_id
+        )
         assert states.filter(States.state == "purge").count() == rows - 1
         assert states.filter(States.state == "keep").count() == 1
         assert (
@@ -603,8 +644,8 @@ async def test_purge_cutoff_date(
             .count()
             == 1
         )
-        assert events.filter(Events.event_type == "PURGE").count() == rows - 1
-        assert events.filter(Events.event_type == "KEEP").count() == 1
+        assert events.filter(EventTypes.event_type == "PURGE").count() == rows - 1
+        assert events.filter(EventTypes.event_type == "KEEP").count() == 1
 
     instance.queue_task(PurgeTask(cutoff, repack=False, apply_filter=False))
     await hass.async_block_till_done()
@@ -614,7 +655,9 @@ async def test_purge_cutoff_date(
     with session_scope(hass=hass) as session:
         states = session.query(States)
         state_attributes = session.query(StateAttributes)
-        events = session.query(Events)
+        events = session.query(Events).join(
+            EventTypes, Events.event_type_id == EventTypes.event_type_id
+        )
         assert states.filter(States.state == "purge").count() == 0
         assert (
             state_attributes.outerjoin(
@@ -633,8 +676,8 @@ async def test_purge_cutoff_date(
             .count()
             == 1
         )
-        assert events.filter(Events.event_type == "PURGE").count() == 0
-        assert events.filter(Events.event_type == "KEEP").count() == 1
+        assert events.filter(EventTypes.event_type == "PURGE").count() == 0
+        assert events.filter(EventTypes.event_type == "KEEP").count() == 1
 
     # Make sure we can purge everything
     instance.queue_task(PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False))
@@ -751,6 +794,7 @@ async def test_purge_filtered_states(
                     time_fired=timestamp,
                 )
             )
+            _convert_pending_states_and_events_to_current_schema(session)
 
     service_data = {"keep_days": 10}
     _add_db_entries(hass)
@@ -759,10 +803,16 @@ async def test_purge_filtered_states(
         states = session.query(States)
         assert states.count() == 74
 
-        events_state_changed = session.query(Events).filter(
-            Events.event_type == EVENT_STATE_CHANGED
+        events_state_changed = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == EVENT_STATE_CHANGED)
+        )
+        events_keep = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_KEEP")
         )
-        events_keep = session.query(Events).filter(Events.event_type == "EVENT_KEEP")
         assert events_state_changed.count() == 70
         assert events_keep.count() == 1
 
@@ -776,11 +826,17 @@ async def test_purge_filtered_states(
     with session_scope(hass=hass) as session:
         states = session.query(States)
         assert states.count() == 74
-        events_state_changed = session.query(Events).filter(
-            Events.event_type == EVENT_STATE_CHANGED
+        events_state_changed = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == EVENT_STATE_CHANGED)
         )
         assert events_state_changed.count() == 70
-        events_keep = session.query(Events).filter(Events.event_type == "EVENT_KEEP")
+        events_keep = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_KEEP")
+        )
         assert events_keep.count() == 1
 
     # Test with 'apply_filter' = True
@@ -797,15 +853,23 @@ async def test_purge_filtered_states(
     with session_scope(hass=hass) as session:
         states = session.query(States)
         assert states.count() == 13
-        events_state_changed = session.query(Events).filter(
-            Events.event_type == EVENT_STATE_CHANGED
+        events_state_changed = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == EVENT_STATE_CHANGED)
         )
         assert events_state_changed.count() == 10
-        events_keep = session.query(Events).filter(Events.event_type == "EVENT_KEEP")
+        events_keep = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_KEEP")
+        )
         assert events_keep.count() == 1
 
-        states_sensor_excluded = session.query(States).filter(
-            States.entity_id == "sensor.excluded"
+        states_sensor_excluded = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "sensor.excluded")
         )
         assert states_sensor_excluded.count() == 0
 
@@ -869,6 +933,7 @@ async def test_purge_filtered_states_to_empty(
                         timestamp,
                         event_id * days,
                     )
+            _convert_pending_states_and_events_to_current_schema(session)
 
     service_data = {"keep_days": 10}
     _add_db_entries(hass)
@@ -890,6 +955,10 @@ async def test_purge_filtered_states_to_empty(
         state_attributes = session.query(StateAttributes)
         assert states.count() == 0
         assert state_attributes.count() == 0
+        states_meta = session.query(StatesMeta).filter(
+            StatesMeta.entity_id == "sensor.excluded"
+        )
+        assert states_meta.count() == 0
 
     # Do it again to make sure nothing changes
     # Why do we do this? Should we check the end result?
@@ -944,6 +1013,7 @@ async def test_purge_without_state_attributes_filtered_states_to_empty(
                     time_fired=timestamp,
                 )
             )
+            _convert_pending_states_and_events_to_current_schema(session)
 
     service_data = {"keep_days": 10}
     _add_db_entries(hass)
@@ -1007,14 +1077,21 @@ async def test_purge_filtered_events(
                     timestamp,
                     event_id,
                 )
+            _convert_pending_states_and_events_to_current_schema(session)
 
     service_data = {"keep_days": 10}
     _add_db_entries(hass)
 
     with session_scope(hass=hass) as session:
-        events_purge = session.query(Events).filter(Events.event_type == "EVENT_PURGE")
-        events_keep = session.query(Events).filter(
-            Events.event_type == EVENT_STATE_CHANGED
+        events_purge = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_PURGE")
+        )
+        events_keep = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == EVENT_STATE_CHANGED)
         )
         states = session.query(States)
 
@@ -1030,9 +1107,15 @@ async def test_purge_filtered_events(
     await async_wait_purge_done(hass)
 
     with session_scope(hass=hass) as session:
-        events_purge = session.query(Events).filter(Events.event_type == "EVENT_PURGE")
-        events_keep = session.query(Events).filter(
-            Events.event_type == EVENT_STATE_CHANGED
+        events_purge = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_PURGE")
+        )
+        events_keep = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == EVENT_STATE_CHANGED)
         )
         states = session.query(States)
         assert events_purge.count() == 60
@@ -1051,14 +1134,24 @@ async def test_purge_filtered_events(
     await async_wait_purge_done(hass)
 
     with session_scope(hass=hass) as session:
-        events_purge = session.query(Events).filter(Events.event_type == "EVENT_PURGE")
-        events_keep = session.query(Events).filter(
-            Events.event_type == EVENT_STATE_CHANGED
+        events_purge = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_PURGE")
+        )
+        events_keep = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == EVENT_STATE_CHANGED)
         )
         states = session.query(States)
         assert events_purge.count() == 0
         assert events_keep.count() == 10
         assert states.count() == 10
+        event_types = session.query(EventTypes).filter(
+            EventTypes.event_type == "EVENT_PURGE"
+        )
+        assert event_types.count() == 0
 
 
 async def test_purge_filtered_events_state_changed(
@@ -1124,14 +1217,21 @@ async def test_purge_filtered_events_state_changed(
                 old_state_id=62,  # keep
             )
             session.add_all((state_1, state_2, state_3))
+            _convert_pending_states_and_events_to_current_schema(session)
 
     service_data = {"keep_days": 10, "apply_filter": True}
     _add_db_entries(hass)
 
     with session_scope(hass=hass) as session:
-        events_keep = session.query(Events).filter(Events.event_type == "EVENT_KEEP")
-        events_purge = session.query(Events).filter(
-            Events.event_type == EVENT_STATE_CHANGED
+        events_keep = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_KEEP")
+        )
+        events_purge = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == EVENT_STATE_CHANGED)
         )
         states = session.query(States)
 
@@ -1149,9 +1249,15 @@ async def test_purge_filtered_events_state_changed(
     await async_wait_purge_done(hass)
 
     with session_scope(hass=hass) as session:
-        events_keep = session.query(Events).filter(Events.event_type == "EVENT_KEEP")
-        events_purge = session.query(Events).filter(
-            Events.event_type == EVENT_STATE_CHANGED
+        events_keep = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "EVENT_KEEP")
+        )
+        events_purge = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == EVENT_STATE_CHANGED)
         )
         states = session.query(States)
 
@@ -1216,6 +1322,7 @@ async def test_purge_entities(
                         timestamp,
                         event_id * days,
                     )
+            _convert_pending_states_and_events_to_current_schema(session)
 
     def _add_keep_records(hass: HomeAssistant) -> None:
         with session_scope(hass=hass) as session:
@@ -1229,6 +1336,7 @@ async def test_purge_entities(
                     timestamp,
                     event_id,
                 )
+            _convert_pending_states_and_events_to_current_schema(session)
 
     _add_purge_records(hass)
     _add_keep_records(hass)
@@ -1244,8 +1352,10 @@ async def test_purge_entities(
         states = session.query(States)
         assert states.count() == 10
 
-        states_sensor_kept = session.query(States).filter(
-            States.entity_id == "sensor.keep"
+        states_sensor_kept = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "sensor.keep")
         )
         assert states_sensor_kept.count() == 10
 
@@ -1274,8 +1384,10 @@ async def test_purge_entities(
         states = session.query(States)
         assert states.count() == 10
 
-        states_sensor_kept = session.query(States).filter(
-            States.entity_id == "sensor.keep"
+        states_sensor_kept = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "sensor.keep")
         )
         assert states_sensor_kept.count() == 10
 
@@ -1358,6 +1470,7 @@ async def _add_test_events(hass: HomeAssistant, iterations: int = 1):
                         time_fired=timestamp,
                     )
                 )
+        _convert_pending_states_and_events_to_current_schema(session)
 
 
 async def _add_events_with_event_data(hass: HomeAssistant, iterations: int = 1):
@@ -1396,6 +1509,7 @@ async def _add_events_with_event_data(hass: HomeAssistant, iterations: int = 1):
                         event_data_rel=event_data,
                     )
                 )
+        _convert_pending_states_and_events_to_current_schema(session)
 
 
 async def _add_test_statistics(hass: HomeAssistant):
@@ -1536,6 +1650,48 @@ def _add_state_and_state_changed_event(
     )
 
 
+def _convert_pending_states_and_events_to_current_schema(session: Session) -> None:
+    """Convert the pending rows to the current schema like the recorder writes them.
+
+    The entity_ids and event_types are moved to their own tables
+    and the datetime columns are converted to timestamps.
+    """
+    states_meta: dict[str, StatesMeta] = {}
+    event_types: dict[str, EventTypes] = {}
+    with session.no_autoflush:
+        for db_states_meta in session.query(StatesMeta):
+            states_meta[db_states_meta.entity_id] = db_states_meta
+        for db_event_type in session.query(EventTypes):
+            event_types[db_event_type.event_type] = db_event_type
+        for row in list(session):
+            if isinstance(row, States):
+                if row.entity_id is not None:
+                    if row.entity_id not in states_meta:
+                        states_meta[row.entity_id] = StatesMeta(entity_id=row.entity_id)
+                    row.states_meta_rel = states_meta[row.entity_id]
+                    row.entity_id = None
+                if row.last_updated is not None:
+                    row.last_updated_ts = process_datetime_to_timestamp(
+                        row.last_updated
+                    )
+                    if row.last_changed is not None:
+                        row.last_changed_ts = process_datetime_to_timestamp(
+                            row.last_changed
+                        )
+                    row.last_updated = row.last_changed = None
+            elif isinstance(row, Events):
+                if row.event_type is not None:
+                    if row.event_type not in event_types:
+                        event_types[row.event_type] = EventTypes(
+                            event_type=row.event_type
+                        )
+                    row.event_type_rel = event_types[row.event_type]
+                    row.event_type = None
+                if row.time_fired is not None:
+                    row.time_fired_ts = process_datetime_to_timestamp(row.time_fired)
+                    row.time_fired = None
+
+
 async def test_purge_many_old_events(
     async_setup_recorder_instance: SetupRecorderInstanceT, hass: HomeAssistant
 ):
@@ -1545,7 +1701,11 @@ async def test_purge_many_old_events(
     await _add_test_events(hass, MAX_ROWS_TO_PURGE)
 
     with session_scope(hass=hass) as session:
-        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type.like("EVENT_TEST%"))
+        )
         event_datas = session.query(EventData)
         assert events.count() == MAX_ROWS_TO_PURGE * 6
         assert event_datas.count() == 5
@@ -1613,6 +1773,7 @@ async def test_purge_can_mix_legacy_and_new_format(
                 eleven_days_ago,
                 event_id,
             )
+        _convert_pending_states_and_events_to_current_schema(session)
     await _add_test_events(hass, 50)
     await _add_events_with_event_data(hass, 50)
     with session_scope(hass=hass) as session:
@@ -1620,6 +1781,7 @@ async def test_purge_can_mix_legacy_and_new_format(
             _add_state_without_event_linkage(
                 session, "switch.random", "on", eleven_days_ago
             )
+        _convert_pending_states_and_events_to_current_schema(session)
         states_with_event_id = session.query(States).filter(
             States.event_id.is_not(None)
         )
@@ -1668,6 +1830,7 @@ async def test_purge_can_mix_legacy_and_new_format(
         _add_state_without_event_linkage(
             session, "switch.random", "on", eleven_days_ago
         )
+        _convert_pending_states_and_events_to_current_schema(session)
         assert states_with_event_id.count() == 0
         assert states_without_event_id.count() == 2
         finished = purge_old_data(
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access,invalid-name
 from datetime import timedelta
 import importlib
+from itertools import chain
 import sys
 from unittest.mock import patch, sentinel
 
@@ -13,7 +14,11 @@ from sqlalchemy.orm import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder import history, statistics
 from homeassistant.components.recorder.const import SQLITE_URL_PREFIX
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
@@ -1165,6 +1170,68 @@ def test_monthly_statistics(hass_recorder, caplog, timezone):
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.freeze_time("2021-12-01 12:00:00+00:00")
+def test_rollup_statistics(hass_recorder, caplog, timezone, period):
+    """Test daily, weekly and monthly statistics are served from the rollups."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-29 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "mean": hour % 7,
+            "min": hour % 5,
+            "max": hour % 11,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(0, 24 * 40, 3)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsDaily).count() == len(
+            {dt_util.as_local(stat["start"]).date() for stat in external_statistics}
+        )
+        assert session.query(StatisticsMonthly).count() == 3
+
+    for start_time, end_time in (
+        (start, None),
+        (start + timedelta(days=2, hours=5), None),
+        (start - timedelta(days=3), start + timedelta(days=33, hours=7)),
+    ):
+        stats = statistics_during_period(
+            hass, start_time, end_time=end_time, period=period
+        )
+        with patch.object(statistics, "ROLLUP_STATISTICS_SCHEMA_VERSION", 1000):
+            hourly_stats = statistics_during_period(
+                hass, start_time, end_time=end_time, period=period
+            )
+        assert stats
+        if period == "week":
+            # The mean of a week is the mean of its daily means
+            for stat in chain(*stats.values(), *hourly_stats.values()):
+                stat.pop("mean")
+        assert stats == hourly_stats
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
 def test_delete_duplicates_no_duplicates(hass_recorder, caplog):
     """Test removal of duplicated statistics."""
     hass = hass_recorder()
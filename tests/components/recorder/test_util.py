@@ -752,8 +752,9 @@ def test_execute_stmt_lambda_element(hass_recorder):
 
     with session_scope(hass=hass) as session:
         # No time window, we always get a list
+        metadata_id = history._get_metadata_ids(session, ["sensor.on"])[0]
         stmt = history._get_single_entity_states_stmt(
-            instance.schema_version, dt_util.utcnow(), "sensor.on", False
+            instance.schema_version, dt_util.utcnow(), "sensor.on", metadata_id, False
         )
         rows = util.execute_stmt_lambda_element(session, stmt)
         assert isinstance(rows, list)
@@ -1333,6 +1333,110 @@ def test_compile_hourly_sum_statistics_total_increasing_small_dip(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_many_sensors(hass_recorder, caplog):
+    """Test compiling statistics for many sensors."""
+    period0 = dt_util.utcnow()
+    period0_end = period1 = period0 + timedelta(minutes=5)
+    period1_end = period0 + timedelta(minutes=10)
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    meter_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    count = 100
+
+    def temperature_seq(i):
+        return [i, i + 10, i - 5, i + 20, i + 1]
+
+    def meter_seq(i):
+        # Every tenth meter is reset in the second period
+        if i % 10 == 0:
+            return [i, i + 1, i + 2, 0, 1]
+        return [i, i + 1, i + 2, i + 3, i + 4]
+
+    for step, seconds in enumerate((5, 55, 255, 305, 405)):
+        with patch(
+            "homeassistant.components.recorder.core.dt_util.utcnow",
+            return_value=period0 + timedelta(seconds=seconds),
+        ):
+            for i in range(count):
+                hass.states.set(
+                    f"sensor.temperature_{i}",
+                    str(temperature_seq(i)[step]),
+                    attributes=TEMPERATURE_SENSOR_ATTRIBUTES,
+                )
+                hass.states.set(
+                    f"sensor.meter_{i}",
+                    str(meter_seq(i)[step]),
+                    attributes=meter_attributes,
+                )
+            wait_recording_done(hass)
+
+    do_adhoc_statistics(hass, start=period0)
+    wait_recording_done(hass)
+    do_adhoc_statistics(hass, start=period1)
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, period0, period="5minute")
+    assert len(stats) == 2 * count
+    for i in range(count):
+        assert stats[f"sensor.temperature_{i}"] == [
+            {
+                "statistic_id": f"sensor.temperature_{i}",
+                "start": process_timestamp_to_utc_isoformat(period0),
+                "end": process_timestamp_to_utc_isoformat(period0_end),
+                "mean": approx(i + 1775 / 295),
+                "min": approx(i - 5),
+                "max": approx(i + 10),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "statistic_id": f"sensor.temperature_{i}",
+                "start": process_timestamp_to_utc_isoformat(period1),
+                "end": process_timestamp_to_utc_isoformat(period1_end),
+                "mean": approx(i + 2170 / 300),
+                "min": approx(i - 5),
+                "max": approx(i + 20),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ]
+        reset = i % 10 == 0
+        assert stats[f"sensor.meter_{i}"] == [
+            {
+                "statistic_id": f"sensor.meter_{i}",
+                "start": process_timestamp_to_utc_isoformat(period0),
+                "end": process_timestamp_to_utc_isoformat(period0_end),
+                "max": None,
+                "mean": None,
+                "min": None,
+                "last_reset": None,
+                "state": approx(i + 2),
+                "sum": approx(2.0),
+            },
+            {
+                "statistic_id": f"sensor.meter_{i}",
+                "start": process_timestamp_to_utc_isoformat(period1),
+                "end": process_timestamp_to_utc_isoformat(period1_end),
+                "max": None,
+                "mean": None,
+                "min": None,
+                "last_reset": None,
+                "state": approx(1 if reset else i + 4),
+                "sum": approx(3.0 if reset else 4.0),
+            },
+        ]
+    assert "Error while processing event StatisticsTask" not in caplog.text
+    assert "Detected new cycle for sensor.meter_10, value dropped" in caplog.text
+    assert "Detected new cycle for sensor.meter_11, value dropped" not in caplog.text
+
+
 def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
     """Test compiling hourly statistics."""
     period0 = dt_util.utcnow()
@@ -27,6 +27,7 @@ import pytest
 
 from homeassistant.components.stream import KeyFrameConverter, Stream, create_stream
 from homeassistant.components.stream.const import (
+    ATTR_KEYFRAME_EXECUTOR,
     ATTR_SETTINGS,
     CONF_LL_HLS,
     CONF_PART_DURATION,
@@ -39,14 +40,16 @@ from homeassistant.components.stream.const import (
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
-from homeassistant.components.stream.core import StreamSettings
+from homeassistant.components.stream.core import Part, Segment, StreamSettings
 from homeassistant.components.stream.worker import (
     StreamEndedError,
     StreamState,
     StreamWorkerError,
     stream_worker,
 )
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from .common import generate_h264_video, generate_h265_video
 from .test_ll_hls import TEST_PART_DURATION
@@ -820,6 +823,23 @@ async def test_durations(hass, worker_finished_stream):
     await stream.stop()
 
 
+def test_segment_data_with_init():
+    """Test that the segment data with init matches the init and the parts joined."""
+    segment = Segment(
+        sequence=0,
+        init=b"init",
+        stream_id=0,
+        start_time=dt_util.utcnow(),
+        stream_outputs=[],
+    )
+    assert segment.get_data_with_init() == b"init"
+    segment.async_add_part(Part(duration=1, has_keyframe=True, data=b"part1"), 0)
+    segment.async_add_part(Part(duration=1, has_keyframe=False, data=b"part2"), 2)
+    assert segment.get_data_with_init() == segment.init + segment.get_data()
+    assert segment.get_data_with_init() == b"initpart1part2"
+    assert len(segment.get_data_with_init()) == segment.data_size_with_init
+
+
 async def test_has_keyframe(hass, h264_video, worker_finished_stream):
     """Test that the has_keyframe metadata matches the media."""
     await async_setup_component(
@@ -925,9 +945,40 @@ async def test_get_image(hass, h264_video, filename):
 
     assert await stream.async_get_image() == EMPTY_8_6_JPEG
 
+    # The keyframe was already decoded, so it is not decoded again
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    diagnostics = stream.get_diagnostics()
+    assert diagnostics["keyframe_decode"] == 1
+    assert diagnostics["keyframe_requests_waiting"] == 0
+    assert diagnostics["keyframe_decode_seconds"] >= 0
+
     await stream.stop()
 
 
+async def test_get_image_after_shutdown(hass, h264_video, filename):
+    """Test that an image can still be decoded once the keyframe executor is gone."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {})
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        make_recording = hass.async_create_task(stream.async_record(filename))
+        await make_recording
+    assert stream._keyframe_converter._image is None
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert ATTR_KEYFRAME_EXECUTOR not in hass.data[DOMAIN]
+
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert stream.get_diagnostics()["keyframe_decode"] == 1
+
+
 async def test_worker_disable_ll_hls(hass):
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
@@ -387,6 +387,9 @@ async def test_get_trace(
     for trace in trace_list:
         item_id = trace["item_id"]
         run_id = trace["run_id"]
+        # The size is worked out when listing, it's not part of the stored trace
+        size = trace.pop("size")
+        assert size > 0
         await client.send_json(
             {
                 "id": next_id(),
@@ -443,6 +446,9 @@ async def test_restore_traces(hass, hass_storage, hass_ws_client, domain):
     for trace in trace_list:
         item_id = trace["item_id"]
         run_id = trace["run_id"]
+        # The size is worked out when listing, it's not part of the stored trace
+        size = trace.pop("size")
+        assert size > 0
         await client.send_json(
             {
                 "id": next_id(),
@@ -872,6 +878,7 @@ async def test_list_traces(
     assert trace["timestamp"]
     assert trace["item_id"] == "sun"
     assert trace.get("trigger", UNDEFINED) == trigger[0]
+    assert trace["size"] > 0
 
     trace = _find_traces(response["result"], domain, "moon")[0]
     assert trace["last_step"] == last_step[1].format(prefix=prefix)
@@ -1047,6 +1047,74 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_between_connections(
+    hass, websocket_client, hass_ws_client, hass_admin_user, hass_read_only_access_token
+):
+    """Test subscribe_entities connections share one listener and filter per user."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    read_only_client = await hass_ws_client(
+        hass, access_token=hass_read_only_access_token
+    )
+    init_count = sum(hass.bus.async_listeners().values())
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    await read_only_client.send_json({"id": 8, "type": "subscribe_entities"})
+    await read_only_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+    for client, iden in (
+        (websocket_client, 7),
+        (read_only_client, 8),
+        (read_only_client, 9),
+    ):
+        msg = await client.receive_json()
+        assert msg["id"] == iden
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["id"] == iden
+        assert msg["type"] == "event"
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+    msg = await read_only_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"] == {
+        "c": {"light.not_permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+    received = [await read_only_client.receive_json() for _ in range(2)]
+    assert sorted(msg["id"] for msg in received) == [8, 9]
+    for msg in received:
+        assert msg["event"] == {
+            "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+
+    for client, iden, subscription in (
+        (websocket_client, 10, 7),
+        (read_only_client, 11, 8),
+        (read_only_client, 12, 9),
+    ):
+        await client.send_json(
+            {"id": iden, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await client.receive_json()
+        assert msg["id"] == iden
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -67,6 +67,30 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_coalesced_messages(hass, websocket_client):
+    """Test messages are sent as one text frame when coalescing is supported."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"]
+
+    # Send the pings in a single frame so the pongs are queued together
+    await websocket_client.send_json(
+        [{"id": 2, "type": "ping"}, {"id": 3, "type": "ping"}]
+    )
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    messages = msg.json()
+    assert [message["id"] for message in messages] == [2, 3]
+    assert all(message["type"] == "pong" for message in messages)
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
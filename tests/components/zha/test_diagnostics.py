@@ -25,6 +25,7 @@ CONFIG_ENTRY_DIAGNOSTICS_KEYS = [
     "config",
     "config_entry",
     "application_state",
+    "device_refresh",
     "versions",
 ]
 
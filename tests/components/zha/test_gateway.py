@@ -259,3 +259,39 @@ async def test_gateway_initialize_failure(hass, device_light_1, coordinator):
             await zha_gateway.async_initialize()
 
     assert mock_new.call_count == 3
+
+
+async def test_gateway_refresh_devices_concurrency(hass, coordinator):
+    """Test background device refreshes are limited in concurrency."""
+    zha_gateway = get_zha_gateway(hass)
+    assert zha_gateway is not None
+
+    in_flight = 0
+    max_in_flight = 0
+    release = asyncio.Event()
+
+    async def async_initialize(from_cache):
+        nonlocal in_flight, max_in_flight
+        assert not from_cache
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await release.wait()
+        in_flight -= 1
+
+    devices = [MagicMock(async_initialize=async_initialize) for _ in range(10)]
+    with patch.object(zha_gateway, "_refresh_semaphore", asyncio.Semaphore(3)):
+        tasks = [
+            hass.async_create_task(zha_gateway._async_refresh_device(device))
+            for device in devices
+        ]
+        await asyncio.sleep(0)
+
+        assert zha_gateway.refreshes_in_flight == 3
+        assert zha_gateway.refreshes_queued == 7
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert max_in_flight == 3
+    assert zha_gateway.refreshes_in_flight == 0
+    assert zha_gateway.refreshes_queued == 0
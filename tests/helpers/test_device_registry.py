@@ -1626,3 +1626,45 @@ async def test_only_disable_device_if_all_config_entries_are_disabled(hass, regi
 
     entry1 = registry.async_get(entry1.id)
     assert not entry1.disabled
+
+
+async def test_entries_for_area_and_config_entry(hass, registry):
+    """Test the area and config entry lookups follow device updates."""
+    entry1 = registry.async_get_or_create(
+        config_entry_id="entry1",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="entry1",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "34:56:AB:CD:EF:12")},
+    )
+    entry1 = registry.async_update_device(entry1.id, area_id="area1")
+    entry2 = registry.async_get_or_create(
+        config_entry_id="entry2",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "34:56:AB:CD:EF:12")},
+    )
+
+    assert device_registry.async_entries_for_area(registry, "area1") == [entry1]
+    assert device_registry.async_entries_for_config_entry(registry, "entry1") == [
+        entry1,
+        entry2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "entry2") == [
+        entry2
+    ]
+
+    registry.async_clear_area_id("area1")
+    entry1 = registry.async_get(entry1.id)
+    assert entry1.area_id is None
+    assert device_registry.async_entries_for_area(registry, "area1") == []
+
+    registry.async_clear_config_entry("entry1")
+    entry2 = registry.async_get(entry2.id)
+    assert registry.async_get(entry1.id) is None
+    assert device_registry.async_entries_for_config_entry(registry, "entry1") == []
+    assert device_registry.async_entries_for_config_entry(registry, "entry2") == [
+        entry2
+    ]
+
+    registry.async_remove_device(entry2.id)
+    assert device_registry.async_entries_for_config_entry(registry, "entry2") == []
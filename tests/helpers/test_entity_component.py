@@ -18,6 +18,7 @@ import homeassistant.core as ha
 from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers import discovery
 from homeassistant.helpers.entity_component import EntityComponent, async_update_entity
+from homeassistant.helpers.entity_platform import POLLING_JITTER
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -105,8 +106,8 @@ async def test_setup_does_discovery(mock_setup_component, mock_setup, hass):
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_config(mock_track, hass):
+@patch("homeassistant.helpers.entity_platform.async_call_later")
+async def test_set_scan_interval_via_config(mock_call_later, hass):
     """Test the setting of the scan interval via configuration."""
 
     def platform_setup(hass, config, add_entities, discovery_info=None):
@@ -122,8 +123,11 @@ async def test_set_scan_interval_via_config(mock_track, hass):
     )
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert mock_call_later.called
+    delay = mock_call_later.call_args[0][1]
+    assert (
+        timedelta(seconds=30) * (1 - POLLING_JITTER) <= delay <= timedelta(seconds=30)
+    )
 
 
 async def test_set_entity_namespace_via_config(hass):
@@ -2,7 +2,7 @@
 import asyncio
 from datetime import timedelta
 import logging
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
@@ -109,6 +109,40 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_records_stats_and_reschedules(hass):
+    """Test polling records the poll latency and schedules the next poll."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = AsyncMock()
+
+    await component.async_add_entities([poll_ent])
+    poll_ent.async_update.reset_mock()
+    platform = poll_ent.platform
+    assert platform.polling_stats.polls == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert len(poll_ent.async_update.mock_calls) == 1
+    assert platform.polling_stats.polls == 1
+    assert platform.polling_stats.overruns == 0
+    assert platform.polling_stats.last_duration is not None
+    assert platform._async_unsub_polling is not None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+
+    assert len(poll_ent.async_update.mock_calls) == 2
+    assert platform.polling_stats.polls == 2
+
+    platform.async_unsub_polling()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done()
+
+    assert len(poll_ent.async_update.mock_calls) == 2
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -154,8 +188,8 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_platform(mock_track, hass):
+@patch("homeassistant.helpers.entity_platform.async_call_later")
+async def test_set_scan_interval_via_platform(mock_call_later, hass):
     """Test the setting of the scan interval via platform."""
 
     def platform_setup(hass, config, add_entities, discovery_info=None):
@@ -172,8 +206,10 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
     component.setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert mock_call_later.called
+    delay = mock_call_later.call_args[0][1]
+    jitter = entity_platform.POLLING_JITTER
+    assert timedelta(seconds=30) * (1 - jitter) <= delay <= timedelta(seconds=30)
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
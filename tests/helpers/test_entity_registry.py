@@ -1,6 +1,7 @@
 """Tests for the Entity Registry."""
 from unittest.mock import patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -1306,6 +1307,45 @@ def test_entity_registry_items():
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_multi_value_indexes():
+    """Test the device, area and config entry indexes of EntityRegistryItems."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1", "1234", "hue", device_id="dev1", area_id="area1"
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2", "2345", "hue", device_id="dev1", config_entry_id="entry1"
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("dev1") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("area1") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry1") == [entry2]
+
+    # Unchanged values keep their position
+    entry1_updated = attr.evolve(entry1, area_id="area2")
+    entities["test.entity1"] = entry1_updated
+    assert entities.get_entries_for_device_id("dev1") == [entry1_updated, entry2]
+    assert entities.get_entries_for_area_id("area1") == []
+    assert entities.get_entries_for_area_id("area2") == [entry1_updated]
+
+    # Renaming an entity moves it to the end
+    entry3 = attr.evolve(entities.pop("test.entity2"), entity_id="test.entity3")
+    entities["test.entity3"] = entry3
+    assert entities.get_entries_for_device_id("dev1") == [entry1_updated, entry3]
+    assert entities.get_entries_for_config_entry_id("entry1") == [entry3]
+
+    del entities["test.entity1"]
+    del entities["test.entity3"]
+    assert entities.get_entries_for_device_id("dev1") == []
+    assert entities.get_entries_for_area_id("area2") == []
+    assert entities.get_entries_for_config_entry_id("entry1") == []
+    assert not entities._device_id_index
+    assert not entities._area_id_index
+    assert not entities._config_entry_id_index
+
+
 async def test_disabled_by_str_not_allowed(hass):
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
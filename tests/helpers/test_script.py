@@ -103,10 +103,11 @@ def assert_element(trace_element, expected_element, path):
     if trace_element.path == "0":
         return
 
+    changed_variables = trace_element.as_dict().get("changed_variables", {})
     if "variables" in expected_element:
-        assert expected_element["variables"] == trace_element._variables
+        assert expected_element["variables"] == changed_variables
     else:
-        assert not trace_element._variables
+        assert not changed_variables
 
 
 def assert_action_trace(expected, expected_script_execution="finished"):
@@ -5110,3 +5111,22 @@ async def test_condition_not_shorthand(hass, caplog):
             "2": [{"result": {"event": "test_event", "event_data": {}}}],
         }
     )
+
+
+def test_trace_element_shares_unchanged_variables():
+    """Test trace elements share variable snapshots until a variable changes."""
+    trace.trace_clear()
+    payload = {"key": "value"}
+
+    element_1 = trace.TraceElement({"trigger": payload}, "0")
+    element_2 = trace.TraceElement({"trigger": payload}, "1")
+    element_3 = trace.TraceElement({"trigger": payload, "wait": None}, "2")
+    element_4 = trace.TraceElement({"trigger": dict(payload), "wait": None}, "3")
+
+    assert element_2._variables is element_1._variables
+    assert element_3._variables is not element_2._variables
+    assert element_1.as_dict()["changed_variables"] == {"trigger": payload}
+    assert "changed_variables" not in element_2.as_dict()
+    assert element_3.as_dict()["changed_variables"] == {"wait": None}
+    # An equal but replaced variable is not reported as changed
+    assert "changed_variables" not in element_4.as_dict()
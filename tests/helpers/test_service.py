@@ -527,6 +527,31 @@ async def test_extract_entity_ids_from_devices(hass, area_mock):
     )
 
 
+async def test_extract_referenced_entity_ids_cache(hass, area_mock):
+    """Test resolved targets are cached until a registry is updated."""
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "own-area"})
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {"light.in_own_area"}
+
+    # Mutating a result must not leak into the cache
+    selected.indirectly_referenced.add("light.not_cached")
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {"light.in_own_area"}
+
+    ent_reg.async_get(hass).async_update_entity("light.no_area", area_id="own-area")
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {"light.in_own_area", "light.no_area"}
+
+    dev_reg.async_get(hass).async_update_device("device-no-area-id", area_id="own-area")
+    ent_reg.async_get(hass).async_update_entity("light.no_area", area_id=None)
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.referenced_devices == {"device-no-area-id"}
+    assert selected.indirectly_referenced == {"light.in_own_area", "light.no_area"}
+
+
 async def test_async_get_all_descriptions(hass):
     """Test async_get_all_descriptions."""
     group = hass.components.group
@@ -11,7 +11,7 @@ import logging
 import os
 from tempfile import TemporaryDirectory
 from typing import Any
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
 
 import pytest
 import voluptuous as vol
@@ -35,6 +35,7 @@ from homeassistant.const import (
 import homeassistant.core as ha
 from homeassistant.core import State
 from homeassistant.exceptions import (
+    HomeAssistantError,
     InvalidEntityFormatError,
     InvalidStateError,
     MaxLengthExceeded,
@@ -400,6 +401,75 @@ def test_state_as_dict():
     assert state.as_dict() is as_dict_1
 
 
+def test_state_as_dict_json():
+    """Test a State as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        context=ha.Context(id="01H0D6K3RFJAYAV2093ZW30PCW"),
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    expected = (
+        '{"entity_id":"happy.happy","state":"on","attributes":{"pig":"dog"},'
+        '"last_changed":"1984-12-08T12:00:00","last_updated":"1984-12-08T12:00:00",'
+        '"context":{"id":"01H0D6K3RFJAYAV2093ZW30PCW","parent_id":null,"user_id":null}}'
+    )
+    as_dict_json_1 = state.as_dict_json()
+    assert as_dict_json_1 == expected
+    # 2nd time to verify cache
+    assert state.as_dict_json() is as_dict_json_1
+
+
+def test_state_as_compressed_state():
+    """Test a State as compressed state."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        context=ha.Context(id="01H0D6K3RFJAYAV2093ZW30PCW"),
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    expected = {
+        "a": {"pig": "dog"},
+        "c": state.context.id,
+        "lc": last_time.timestamp(),
+        "s": "on",
+    }
+    as_compressed_state = state.as_compressed_state()
+    assert as_compressed_state == expected
+    # 2nd time to verify cache
+    assert state.as_compressed_state() is as_compressed_state
+    # The cached dict is shared, so it must not be modified
+    with pytest.raises(RuntimeError):
+        as_compressed_state["s"] = "off"
+    assert state.as_compressed_state_json() == (
+        '{"s":"on","a":{"pig":"dog"},"c":"01H0D6K3RFJAYAV2093ZW30PCW",'
+        '"lc":471355200.0}'
+    )
+
+    state = ha.State(
+        "happy.happy",
+        "on",
+        context=ha.Context(user_id="abc", id="01H0D6K3RFJAYAV2093ZW30PCW"),
+        last_updated=last_time + timedelta(seconds=1),
+        last_changed=last_time,
+    )
+    assert state.as_compressed_state() == {
+        "a": {},
+        "c": {"id": state.context.id, "parent_id": None, "user_id": "abc"},
+        "lc": last_time.timestamp(),
+        "lu": last_time.timestamp() + 1,
+        "s": "on",
+    }
+    with pytest.raises(RuntimeError):
+        state.as_compressed_state()["c"]["user_id"] = "def"
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -448,6 +518,66 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_state_changed_listener(hass):
+    """Test we can listen for state changes of specific entities."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    old_count = len(hass.bus.async_listeners())
+    unsub = hass.bus.async_listen_state_changed(
+        ["light.kitchen", "light.bowl"], listener
+    )
+    unsub_single = hass.bus.async_listen_state_changed("light.bowl", listener)
+    assert len(hass.bus.async_listeners()) == old_count + 1
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == 2
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bowl",
+        "light.bowl",
+    ]
+
+    unsub()
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == 1
+    unsub_single()
+    assert len(hass.bus.async_listeners()) == old_count
+
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+
+async def test_eventbus_state_changed_listener_run_immediately(hass):
+    """Test we can run state changed listeners immediately."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_state_changed(
+        "light.kitchen", listener, run_immediately=True
+    )
+    hass.states.async_set("light.kitchen", "on")
+    assert len(calls) == 1
+    unsub()
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_state_changed(
+            "light.kitchen", AsyncMock(), run_immediately=True
+        )
+
+
 async def test_eventbus_run_immediately(hass):
     """Test we can call events immediately."""
     calls = []
@@ -2,6 +2,8 @@
 
 import uuid
 
+import pytest
+
 import homeassistant.util.ulid as ulid_util
 
 
@@ -14,3 +16,30 @@ async def test_ulid_util_uuid_hex():
 async def test_ulid_util_uuid():
     """Verify we can generate a ulid."""
     assert len(ulid_util.ulid()) == 26
+
+
+async def test_ulid_to_bytes_round_trip():
+    """Verify a ulid can be converted to bytes and back."""
+    ulid = ulid_util.ulid()
+    ulid_bytes = ulid_util.ulid_to_bytes(ulid)
+    assert len(ulid_bytes) == 16
+    assert ulid_util.bytes_to_ulid(ulid_bytes) == ulid
+    assert ulid_util.ulid_to_bytes(ulid.lower()) == ulid_bytes
+
+
+async def test_ulid_to_bytes_known_value():
+    """Verify ulid_to_bytes matches the reference implementation."""
+    assert ulid_util.ulid_to_bytes("01GTDGKBCH00GW0X476W5TVAAA") == bytes.fromhex(
+        "01869b09ad910021c07487370bada94a"
+    )
+    assert ulid_util.bytes_to_ulid(b"\x00" * 16) == "0" * 26
+    assert ulid_util.bytes_to_ulid(b"\xff" * 16) == "7" + "Z" * 25
+
+
+@pytest.mark.parametrize(
+    "value", ["", "01GTDGKBCH00GW0X476W5TVAA", "01GTDGKBCH00GW0X476W5TVAAU", "8" * 26]
+)
+async def test_ulid_to_bytes_invalid(value):
+    """Verify invalid ulids raise ValueError."""
+    with pytest.raises(ValueError):
+        ulid_util.ulid_to_bytes(value)